@@ -1,6 +1,30 @@
-from .milvus import MilvusRerankType, Milvus
+from .ingest import IngestPolicy, IngestStats
+from .milvus import MilvusHit, MilvusRerankType, Milvus
+from .numpy_index import NumpyIndex
+from .pool import disconnect, disconnect_all, release_collection
+from .retriever import (
+    MilvusRetriever,
+    RetrieverCacheStats,
+    rrf_fusion,
+    weighted_fusion,
+)
+from .schema import MilvusCollectionSpec, MilvusIndexSpec, MilvusIndexType
 
 __all__ = [
+    "IngestPolicy",
+    "IngestStats",
+    "MilvusCollectionSpec",
+    "MilvusHit",
+    "MilvusIndexSpec",
+    "MilvusIndexType",
     "MilvusRerankType",
+    "MilvusRetriever",
     "Milvus",
+    "NumpyIndex",
+    "RetrieverCacheStats",
+    "disconnect",
+    "disconnect_all",
+    "release_collection",
+    "rrf_fusion",
+    "weighted_fusion",
 ]
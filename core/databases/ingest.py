@@ -0,0 +1,233 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+
+@dataclass
+class IngestPolicy:
+    """
+    대량 적재 정책
+
+    Args:
+        chunk_size: 청크 최대 길이(UTF-8 바이트) (기본: None, 컬렉션 text 필드 최대 길이)
+        chunk_overlap: 청크 간 겹치는 길이(UTF-8 바이트) (기본: 0)
+        embed_batch_size: 임베딩 배치 크기 (기본: 64)
+        insert_batch_size: 삽입 배치 크기 (기본: 1000)
+        flush_every: 이 행 수만큼 삽입할 때마다 flush (기본: None, 종료 시에만 flush)
+        compact_on_finish: 종료 시 compaction 수행 여부 (기본: False)
+    """
+
+    chunk_size: int | None = None
+    chunk_overlap: int = 0
+    embed_batch_size: int = 64
+    insert_batch_size: int = 1000
+    flush_every: int | None = None
+    compact_on_finish: bool = False
+
+
+@dataclass
+class IngestStats:
+    """대량 적재 진행 상황 및 처리량 카운터"""
+
+    texts: int = 0
+    chunks: int = 0
+    inserted: int = 0
+    batches: int = 0
+    flushes: int = 0
+    embed_seconds: float = 0.0
+    insert_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """경과 시간(초)"""
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        """초당 삽입 행 수"""
+        return self.inserted / self.elapsed if self.elapsed else 0.0
+
+
+def split_documents(
+    documents: Iterable[tuple[str, dict | None]],
+    chunk_size: int,
+    chunk_overlap: int,
+    stats: IngestStats,
+) -> Iterator[tuple[str, dict | None]]:
+    """
+    (텍스트, 메타데이터) 스트림을 UTF-8 바이트 길이 기준 청크 스트림으로 변환
+    각 청크는 원본 텍스트의 메타데이터를 그대로 물려받는다
+
+    Args:
+        documents: (원본 텍스트, 추가 필드 값 또는 None) 이터레이터
+        chunk_size: 청크 최대 길이(바이트)
+        chunk_overlap: 청크 간 겹치는 길이(바이트)
+        stats: 카운터 (texts/chunks 갱신)
+
+    Yields:
+        (청크 문자열, 메타데이터)
+    """
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=lambda text: len(text.encode("utf-8")),
+    )
+    for text, metadata in documents:
+        stats.texts += 1
+        for chunk in splitter.split_text(text):
+            stats.chunks += 1
+            yield chunk, metadata
+
+
+def _documents(texts: Iterable, metadata: Iterable[dict] | None) -> Iterator[tuple]:
+    """텍스트(또는 (텍스트, 메타데이터)) 스트림과 병렬 메타데이터를 (텍스트, 메타데이터) 쌍으로 통일"""
+    if metadata is not None:
+        yield from zip(texts, metadata, strict=True)
+        return
+    for item in texts:
+        if isinstance(item, str):
+            yield item, None
+        else:
+            text, fields = item
+            yield text, fields
+
+
+def _required_fields(milvus) -> list[str]:
+    """삽입할 때 값이 반드시 있어야 하는 추가 필드 이름 (기본값/nullable 필드 제외, 명세가 없으면 빈 리스트)"""
+    spec = getattr(milvus, "spec", None)
+    if spec is None:
+        return []
+    return [
+        schema_field.name
+        for schema_field in spec.extra_fields
+        if not schema_field.nullable
+        and schema_field.default_value is None
+        and not schema_field.auto_id
+    ]
+
+
+def _check_metadata(documents: Iterable[tuple], required: list[str]) -> Iterator[tuple]:
+    """
+    필수 추가 필드가 빠진 원본 텍스트가 있으면 임베딩/삽입 전에 ValueError
+
+    Args:
+        documents: (텍스트, 메타데이터) 이터레이터
+        required: 필수 추가 필드 이름
+
+    Yields:
+        (텍스트, 메타데이터)
+    """
+    for i, (text, fields) in enumerate(documents):
+        missing = [name for name in required if name not in (fields or {})]
+        if missing:
+            raise ValueError(
+                f"{i}번째 텍스트에 필수 추가 필드 값이 없습니다: {', '.join(missing)}"
+            )
+        yield text, fields
+
+
+def iter_batches(items: Iterable, size: int) -> Iterator[list]:
+    """이터레이터를 size 단위 리스트로 묶기"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def bulk_ingest(
+    milvus,
+    texts: Iterable[str | tuple[str, dict]],
+    dense_embedding,
+    sparse_embedding,
+    policy: IngestPolicy | None = None,
+    on_progress: Callable[[IngestStats], None] | None = None,
+    metadata: Iterable[dict] | None = None,
+) -> IngestStats:
+    """
+    텍스트 스트림을 청크 → 임베딩 → 삽입 순으로 적재
+    삽입은 별도 스레드에서 진행되어 다음 배치 임베딩과 겹치며, 대기 중인 삽입은 최대 1개로 메모리를 제한한다
+
+    Args:
+        milvus: 대상 Milvus 인스턴스
+        texts: 원본 텍스트 이터레이터 (또는 (텍스트, 추가 필드 값) 쌍)
+        dense_embedding: embed_documents(texts) -> list[list[float]] 를 제공하는 객체
+        sparse_embedding: embed_documents(texts) -> list[dict[int, float]] 를 제공하는 객체
+            partial_fit이 있고 auto_update가 꺼져 있으면(BM25SparseEmbedding 기본값) 임베딩 전에 청크로 통계를 갱신
+        policy: 적재 정책 (기본: IngestPolicy())
+        on_progress: 삽입 배치가 끝날 때마다 호출되는 콜백 (Option)
+        metadata: texts와 같은 순서의 추가 필드 값 이터레이터 (Option, 청크는 원본 텍스트의 값을 물려받음)
+            명세(milvus.spec)의 기본값/nullable이 아닌 추가 필드가 빠진 텍스트를 만나면 ValueError
+
+    Returns:
+        적재 통계
+    """
+    policy = policy or IngestPolicy()
+    stats = IngestStats()
+    chunks = split_documents(
+        _check_metadata(_documents(texts, metadata), _required_fields(milvus)),
+        policy.chunk_size or milvus.text_max_length,
+        policy.chunk_overlap,
+        stats,
+    )
+    unflushed = 0
+    fit_sparse = hasattr(sparse_embedding, "partial_fit") and not getattr(
+        sparse_embedding, "auto_update", False
+    )
+
+    def insert(batch, dense_vectors, sparse_vectors):
+        nonlocal unflushed
+        started = time.monotonic()
+        texts = [text for text, _ in batch]
+        fields = [metadata or {} for _, metadata in batch]
+        milvus.insert(
+            texts,
+            dense_vectors,
+            sparse_vectors,
+            metadata=fields if any(fields) else None,
+        )
+        stats.inserted += len(batch)
+        stats.batches += 1
+        unflushed += len(batch)
+        if policy.flush_every and unflushed >= policy.flush_every:
+            milvus.collection.flush()
+            stats.flushes += 1
+            unflushed = 0
+        stats.insert_seconds += time.monotonic() - started
+        if on_progress:
+            on_progress(stats)
+
+    pending: Future | None = None
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="milvus-ingest") as pool:
+        for batch in iter_batches(chunks, policy.insert_batch_size):
+            started = time.monotonic()
+            dense_vectors, sparse_vectors = [], []
+            for sub_batch in iter_batches(batch, policy.embed_batch_size):
+                sub_texts = [text for text, _ in sub_batch]
+                if fit_sparse:
+                    sparse_embedding.partial_fit(sub_texts)
+                dense_vectors.extend(dense_embedding.embed_documents(sub_texts))
+                sparse_vectors.extend(sparse_embedding.embed_documents(sub_texts))
+            stats.embed_seconds += time.monotonic() - started
+
+            if pending is not None:
+                pending.result()
+            pending = pool.submit(insert, batch, dense_vectors, sparse_vectors)
+        if pending is not None:
+            pending.result()
+
+    milvus.collection.flush()
+    stats.flushes += 1
+    if policy.compact_on_finish:
+        milvus.collection.compact()
+        milvus.collection.wait_for_compaction_completed()
+    stats.finished_at = time.monotonic()
+    return stats
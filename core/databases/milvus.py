@@ -1,17 +1,27 @@
+import asyncio
 import enum
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Callable, ClassVar, Iterable
 
 from pymilvus import (
     AnnSearchRequest,
     WeightedRanker,
-    connections,
     utility,
-    FieldSchema,
-    CollectionSchema,
     DataType,
     Collection,
     RRFRanker,
 )
 
+from .ingest import IngestPolicy, IngestStats, bulk_ingest
+from .pool import connection_alias, get_collection, release_collection
+from .schema import MilvusCollectionSpec, MilvusIndexSpec
+
+logger = logging.getLogger(__name__)
+
 
 class MilvusRerankType(enum.Enum):
     """밀버스 리랭크 타입"""
@@ -20,6 +30,24 @@ class MilvusRerankType(enum.Enum):
     RRF_RANKER = "rrf_ranker"
 
 
+@dataclass(frozen=True)
+class MilvusHit:
+    """
+    밀버스 검색 결과 항목
+
+    Args:
+        pk: primary key
+        score: 유사도 점수 (IP 기준 클수록 유사)
+        text: text 필드 값
+        fields: text 외에 함께 조회한 필드 값
+    """
+
+    pk: str
+    score: float
+    text: str
+    fields: dict = field(default_factory=dict)
+
+
 class Milvus:
     """
     밀버스 라이브러리
@@ -27,16 +55,34 @@ class Milvus:
     Args:
         uri: 밀버스 접속을 위한 URI
         collection_name: 연결이 필요한 컬렉션
+        spec: 컬렉션 생성 명세 (기본: MilvusCollectionSpec(), 이미 존재하는 컬렉션은 스키마/인덱스를 그대로 사용)
+            전달한 명세는 바꾸지 않고, 기존 컬렉션 값을 반영한 사본을 self.spec으로 쓴다
+
+    연결과 로드된 컬렉션 핸들은 (uri, 컬렉션) 단위로 프로세스 안에서 공유되므로 인스턴스 생성 비용이 거의 없다
     """
 
     DEFAULT_MILVUS_URI = "./milvus.db"
     DEFAULT_COLLECTION_NAME = "milvus"
+    ASYNC_MAX_WORKERS = 8
+
+    # 비동기 API가 공유하는 프로세스 단위 실행기 (동시 요청 수 상한)
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+    _executor_lock: ClassVar[threading.Lock] = threading.Lock()
 
-    def __init__(self, uri: str = None, collection_name: str = None):
+    def __init__(
+        self,
+        uri: str = None,
+        collection_name: str = None,
+        spec: MilvusCollectionSpec = None,
+    ):
         self.uri = self._get_uri(uri)
         self.collection_name = self._get_collection_name(collection_name)
+        self.spec = spec or MilvusCollectionSpec()
+        self.text_max_length = self.spec.text_max_length
         self.collection = None
         self._init_collection()
+        if spec is not None:
+            self._warn_spec_conflicts(spec)
 
     def _get_uri(self, uri: str) -> str:
         return uri if uri else self.DEFAULT_MILVUS_URI
@@ -45,104 +91,304 @@ class Milvus:
         return collection_name if collection_name else self.DEFAULT_COLLECTION_NAME
 
     def _init_collection(self):
-        connections.connect(uri=self.uri)
+        # 같은 (uri, 컬렉션)은 프로세스 안에서 연결/로드를 한 번만 수행하고 핸들을 공유
+        self.alias = connection_alias(self.uri)
+        self.collection = get_collection(
+            self.uri, self.collection_name, self._open_collection
+        )
+        self._sync_spec_from_schema()
 
+    def _open_collection(self, alias: str) -> Collection:
+        """컬렉션을 열거나 명세대로 생성한 뒤 로드"""
         # 컬렉션 존재 여부 확인
-        if utility.has_collection(self.collection_name):
-            self.collection = Collection(self.collection_name)
-            self.collection.load()
-            return
+        if utility.has_collection(self.collection_name, using=alias):
+            collection = Collection(self.collection_name, using=alias)
+            collection.load()
+            return collection
 
-        collection_schema = CollectionSchema(
-            [
-                FieldSchema(
-                    name="pk",
-                    dtype=DataType.VARCHAR,
-                    is_primary=True,
-                    auto_id=True,
-                    max_length=100,
-                ),
-                FieldSchema(
-                    name="text",
-                    dtype=DataType.VARCHAR,
-                    max_length=512,
-                ),
-                FieldSchema(
-                    name="sparse_vector",
-                    dtype=DataType.SPARSE_FLOAT_VECTOR,
-                ),
-                FieldSchema(
-                    name="dense_vector",
-                    dtype=DataType.FLOAT_VECTOR,
-                    dim=128,
-                ),
-            ]
-        )
+        kwargs = {}
+        if self.spec.partition_key_field and self.spec.num_partitions:
+            kwargs["num_partitions"] = self.spec.num_partitions
         collection = Collection(
-            self.collection_name, collection_schema, consistency_level="Bounded"
+            self.collection_name,
+            self.spec.build_schema(),
+            using=alias,
+            consistency_level=self.spec.consistency_level,
+            **kwargs,
         )
-        collection.create_index(
-            "sparse_vector",
-            {"index_type": "SPARSE_INVERTED_INDEX", "metric_type": "IP"},
+        collection.create_index("sparse_vector", self.spec.sparse_index.index_params())
+        collection.create_index("dense_vector", self.spec.dense_index.index_params())
+        collection.load()
+        return collection
+
+    def release(self) -> bool:
+        """
+        공유 컬렉션 핸들을 언로드하고 레지스트리에서 제거
+        같은 컬렉션을 쓰는 다른 인스턴스도 영향을 받으므로 종료 시점에만 호출한다
+
+        Returns:
+            해제 여부
+        """
+        return release_collection(self.uri, self.collection_name)
+
+    @staticmethod
+    def _synced_index(
+        requested: MilvusIndexSpec, params: dict | None
+    ) -> MilvusIndexSpec:
+        """
+        기존 인덱스 파라미터를 반영한 인덱스 명세
+        인덱스 타입이 같으면 요청한 검색 파라미터를 유지하고, 다르면 (다른 타입의 파라미터이므로) 비운다
+        """
+        if params is None:
+            return requested
+        existing = MilvusIndexSpec.from_index_params(params)
+        if existing.index_type == requested.index_type:
+            existing.search_params = dict(requested.search_params)
+        return existing
+
+    def _sync_spec_from_schema(self):
+        """
+        기존 컬렉션의 스키마 값(text 길이, 벡터 차원, 추가 필드)과 인덱스 타입/척도/파라미터를
+        명세 사본에 반영 (여러 인스턴스가 공유하는 호출자의 명세 객체는 바꾸지 않음)
+        """
+        base_fields = {"pk", "text", "sparse_vector", "dense_vector"}
+        values = {"extra_fields": []}
+        for schema_field in self.collection.schema.fields:
+            if schema_field.name == "text":
+                values["text_max_length"] = schema_field.params["max_length"]
+            elif schema_field.dtype == DataType.FLOAT_VECTOR:
+                values["dim"] = schema_field.params["dim"]
+            elif schema_field.name not in base_fields:
+                values["extra_fields"].append(schema_field)
+        indexes = {index.field_name: index.params for index in self.collection.indexes}
+        values["dense_index"] = self._synced_index(
+            self.spec.dense_index, indexes.get("dense_vector")
         )
-        collection.create_index(
-            "dense_vector",
-            {"index_type": "AUTOINDEX", "metric_type": "IP"},
+        values["sparse_index"] = self._synced_index(
+            self.spec.sparse_index, indexes.get("sparse_vector")
         )
-        collection.load()
-        self.collection = collection
+        self.spec = replace(self.spec, **values)
+        self.text_max_length = self.spec.text_max_length
 
-    def dense_search(self, query_dense_embedding, params: dict = None, limit=10):
+    def _warn_spec_conflicts(self, requested: MilvusCollectionSpec) -> None:
+        """
+        요청한 명세가 기존 컬렉션(공유 핸들 포함)의 스키마/인덱스와 다르면 경고
+        이미 만들어진 컬렉션은 바꾸지 않고 기존 값을 사용하므로, 조용히 무시되지 않도록 알린다
+        """
+        conflicts = []
+        for name in ("dim", "text_max_length"):
+            if getattr(requested, name) != getattr(self.spec, name):
+                conflicts.append(
+                    f"{name}: {getattr(requested, name)} -> {getattr(self.spec, name)}"
+                )
+        requested_fields = [f.name for f in requested.extra_fields]
+        existing_fields = [f.name for f in self.spec.extra_fields]
+        if requested_fields and requested_fields != existing_fields:
+            conflicts.append(f"extra_fields: {requested_fields} -> {existing_fields}")
+        for name in ("dense_index", "sparse_index"):
+            want, have = getattr(requested, name), getattr(self.spec, name)
+            if (want.index_type, want.metric_type) != (
+                have.index_type,
+                have.metric_type,
+            ) or any(have.params.get(k) != v for k, v in want.params.items()):
+                conflicts.append(
+                    f"{name}: {want.index_params()} -> {have.index_params()}"
+                )
+        if conflicts:
+            logger.warning(
+                "기존 컬렉션 %s의 스키마/인덱스가 명세와 달라 기존 값을 사용합니다: %s",
+                self.collection_name,
+                ", ".join(conflicts),
+            )
+
+    def insert(
+        self,
+        texts: list[str],
+        dense_vectors: list[list[float]],
+        sparse_vectors: list,
+        metadata: list[dict] | None = None,
+    ) -> list:
+        """
+        텍스트와 벡터를 한 번에 삽입
+
+        Args:
+            texts: 텍스트 리스트
+            dense_vectors: 텍스트별 dense 벡터
+            sparse_vectors: 텍스트별 sparse 벡터 ({인덱스: 값} 딕셔너리 등)
+            metadata: 텍스트별 추가 필드 값 (Option)
+
+        Returns:
+            삽입된 행의 primary key 리스트
+        """
+        rows = [
+            {"text": text, "dense_vector": dense, "sparse_vector": sparse}
+            for text, dense, sparse in zip(texts, dense_vectors, sparse_vectors)
+        ]
+        if metadata:
+            for row, fields in zip(rows, metadata):
+                row.update(fields)
+        return self.collection.insert(rows).primary_keys
+
+    def ingest(
+        self,
+        texts: Iterable[str | tuple[str, dict]],
+        dense_embedding,
+        sparse_embedding,
+        policy: IngestPolicy | None = None,
+        on_progress: Callable[[IngestStats], None] | None = None,
+        metadata: Iterable[dict] | None = None,
+    ) -> IngestStats:
+        """
+        텍스트 스트림 대량 적재
+        청크 분할 → 배치 임베딩 → 배치 삽입을 스트리밍으로 처리해 전체를 메모리에 올리지 않는다
+
+        Args:
+            texts: 원본 텍스트 이터레이터 (또는 (텍스트, 추가 필드 값) 쌍)
+            dense_embedding: dense 임베딩 모델 (embed_documents 제공)
+            sparse_embedding: sparse 임베딩 모델 (embed_documents 제공)
+            policy: 청크/배치/flush/compaction 정책 (기본: IngestPolicy())
+            on_progress: 삽입 배치가 끝날 때마다 IngestStats로 호출되는 콜백 (Option)
+            metadata: texts와 같은 순서의 추가 필드/파티션 키 값 (Option, 청크는 원본 텍스트의 값을 물려받음)
+
+        Returns:
+            적재 통계
+        """
+        return bulk_ingest(
+            self,
+            texts,
+            dense_embedding,
+            sparse_embedding,
+            policy,
+            on_progress,
+            metadata=metadata,
+        )
+
+    def _to_hits(self, results, output_fields: list[str]) -> list[list[MilvusHit]]:
+        """pymilvus 검색 결과를 쿼리별 MilvusHit 리스트로 변환"""
+        return [
+            [
+                MilvusHit(
+                    pk=hit.id,
+                    score=hit.distance,
+                    text=hit.get("text"),
+                    fields={
+                        name: hit.get(name) for name in output_fields if name != "text"
+                    },
+                )
+                for hit in hits
+            ]
+            for hits in results
+        ]
+
+    def dense_search_batch(
+        self,
+        query_dense_embeddings: list,
+        params: dict = None,
+        limit=10,
+        output_fields: list[str] = None,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """
+        여러 dense 쿼리 벡터를 한 번의 search 호출로 검색
+
+        Args:
+            query_dense_embeddings: 쿼리 dense 벡터 리스트
+            params: 검색 파라미터 (기본: 인덱스 명세의 search_params)
+            limit: 쿼리별 결과 수
+            output_fields: 함께 조회할 필드 (기본: text + 추가 필드)
+            expr: 스칼라 필터 표현식 (Option)
+
+        Returns:
+            쿼리별 MilvusHit 리스트
+        """
+        output_fields = output_fields or self.spec.output_fields
         res = self.collection.search(
-            [query_dense_embedding],
+            query_dense_embeddings,
             anns_field="dense_vector",
             limit=limit,
-            output_fields=["text"],
-            param={"metric_type": "IP", "params": {} if params is None else params},
-        )[0]
-        return [hit.get("text") for hit in res]
+            expr=expr,
+            output_fields=output_fields,
+            param=self.spec.dense_index.search_param(params),
+        )
+        return self._to_hits(res, output_fields)
 
-    def sparse_search(self, query_sparse_embedding, params: dict = None, limit=10):
+    def sparse_search_batch(
+        self,
+        query_sparse_embeddings: list,
+        params: dict = None,
+        limit=10,
+        output_fields: list[str] = None,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """
+        여러 sparse 쿼리 벡터를 한 번의 search 호출로 검색
+
+        Args:
+            query_sparse_embeddings: 쿼리 sparse 벡터 리스트 (또는 CSR 행렬)
+            params: 검색 파라미터 (기본: 인덱스 명세의 search_params)
+            limit: 쿼리별 결과 수
+            output_fields: 함께 조회할 필드 (기본: text + 추가 필드)
+            expr: 스칼라 필터 표현식 (Option)
+
+        Returns:
+            쿼리별 MilvusHit 리스트
+        """
+        output_fields = output_fields or self.spec.output_fields
         res = self.collection.search(
-            [query_sparse_embedding],
+            query_sparse_embeddings,
             anns_field="sparse_vector",
             limit=limit,
-            output_fields=["text"],
-            param={
-                "metric_type": "IP",
-                "params": {} if params is None else params,
-            },
-        )[0]
-        return [hit.get("text") for hit in res]
+            expr=expr,
+            output_fields=output_fields,
+            param=self.spec.sparse_index.search_param(params),
+        )
+        return self._to_hits(res, output_fields)
 
-    def hybrid_search(
+    def hybrid_search_batch(
         self,
-        query_dense_embedding,
-        query_sparse_embedding,
+        query_dense_embeddings: list,
+        query_sparse_embeddings: list,
         dense_params=None,
         sparse_params=None,
         ranker_type=MilvusRerankType.RRF_RANKER,
         sparse_weight=1.0,  # MilvusRerankType.WEIGHTED_RANKER 에서만 사용
         dense_weight=1.0,  # MilvusRerankType.WEIGHTED_RANKER 에서만 사용
         limit=10,
-    ):
+        output_fields: list[str] = None,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """
+        여러 쿼리의 dense/sparse 벡터 쌍을 한 번의 hybrid_search 호출로 검색
+
+        Args:
+            query_dense_embeddings: 쿼리 dense 벡터 리스트
+            query_sparse_embeddings: 쿼리 sparse 벡터 리스트 (dense와 같은 순서)
+            dense_params: dense 검색 파라미터 (기본: 인덱스 명세의 search_params)
+            sparse_params: sparse 검색 파라미터 (기본: 인덱스 명세의 search_params)
+            ranker_type: 서버 측 리랭커 종류
+            sparse_weight: sparse 가중치 (WEIGHTED_RANKER 전용)
+            dense_weight: dense 가중치 (WEIGHTED_RANKER 전용)
+            limit: 쿼리별 결과 수
+            output_fields: 함께 조회할 필드 (기본: text + 추가 필드)
+            expr: 스칼라 필터 표현식 (Option)
+
+        Returns:
+            쿼리별 MilvusHit 리스트
+        """
+        output_fields = output_fields or self.spec.output_fields
         dense_req = AnnSearchRequest(
-            [query_dense_embedding],
+            query_dense_embeddings,
             "dense_vector",
-            {
-                "metric_type": "IP",
-                "params": {} if dense_params is None else dense_params,
-            },
+            self.spec.dense_index.search_param(dense_params),
             limit=limit,
+            expr=expr,
         )
         sparse_req = AnnSearchRequest(
-            [query_sparse_embedding],
+            query_sparse_embeddings,
             "sparse_vector",
-            {
-                "metric_type": "IP",
-                "params": {} if sparse_params is None else sparse_params,
-            },
+            self.spec.sparse_index.search_param(sparse_params),
             limit=limit,
+            expr=expr,
         )
         rerank = RRFRanker()
         if ranker_type == MilvusRerankType.WEIGHTED_RANKER:
@@ -151,6 +397,159 @@ class Milvus:
             [sparse_req, dense_req],
             rerank=rerank,
             limit=limit,
-            output_fields=["text"],
+            output_fields=output_fields,
+        )
+        return self._to_hits(res, output_fields)
+
+    def dense_search(self, query_dense_embedding, params: dict = None, limit=10):
+        hits = self.dense_search_batch([query_dense_embedding], params, limit)[0]
+        return [hit.text for hit in hits]
+
+    def sparse_search(self, query_sparse_embedding, params: dict = None, limit=10):
+        hits = self.sparse_search_batch([query_sparse_embedding], params, limit)[0]
+        return [hit.text for hit in hits]
+
+    def hybrid_search(
+        self,
+        query_dense_embedding,
+        query_sparse_embedding,
+        dense_params=None,
+        sparse_params=None,
+        ranker_type=MilvusRerankType.RRF_RANKER,
+        sparse_weight=1.0,  # MilvusRerankType.WEIGHTED_RANKER 에서만 사용
+        dense_weight=1.0,  # MilvusRerankType.WEIGHTED_RANKER 에서만 사용
+        limit=10,
+    ):
+        hits = self.hybrid_search_batch(
+            [query_dense_embedding],
+            [query_sparse_embedding],
+            dense_params=dense_params,
+            sparse_params=sparse_params,
+            ranker_type=ranker_type,
+            sparse_weight=sparse_weight,
+            dense_weight=dense_weight,
+            limit=limit,
         )[0]
-        return [hit.get("text") for hit in res]
+        return [hit.text for hit in hits]
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """비동기 API용 공유 실행기 (최초 호출 시 생성)"""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=cls.ASYNC_MAX_WORKERS,
+                        thread_name_prefix="milvus-async",
+                    )
+        return cls._executor
+
+    async def run_async(self, func, *args, **kwargs):
+        """
+        동기 함수를 공유 실행기에서 실행해 이벤트 루프를 막지 않도록 한다
+
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: func에 전달할 인자
+
+        Returns:
+            func의 반환값
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def asearch(
+        self,
+        query_embeddings: list,
+        anns_field: str = "dense_vector",
+        params: dict = None,
+        limit=10,
+        output_fields: list[str] = None,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """
+        dense/sparse 배치 검색 (비동기)
+
+        Args:
+            query_embeddings: 쿼리 벡터 리스트
+            anns_field: 검색할 벡터 필드 (dense_vector 또는 sparse_vector)
+            params: 검색 파라미터 (기본: 인덱스 명세의 search_params)
+            limit: 쿼리별 결과 수
+            output_fields: 함께 조회할 필드 (기본: text + 추가 필드)
+            expr: 스칼라 필터 표현식 (Option)
+
+        Returns:
+            쿼리별 MilvusHit 리스트
+        """
+        if anns_field == "dense_vector":
+            search = self.dense_search_batch
+        elif anns_field == "sparse_vector":
+            search = self.sparse_search_batch
+        else:
+            raise ValueError(f"지원하지 않는 벡터 필드입니다: {anns_field}")
+        return await self.run_async(
+            search,
+            query_embeddings,
+            params=params,
+            limit=limit,
+            output_fields=output_fields,
+            expr=expr,
+        )
+
+    async def ahybrid_search(
+        self, query_dense_embedding, query_sparse_embedding, **kwargs
+    ):
+        """
+        hybrid_search의 비동기 버전
+
+        Args:
+            query_dense_embedding: 쿼리 dense 벡터
+            query_sparse_embedding: 쿼리 sparse 벡터
+            **kwargs: hybrid_search 옵션
+
+        Returns:
+            text 리스트
+        """
+        return await self.run_async(
+            self.hybrid_search, query_dense_embedding, query_sparse_embedding, **kwargs
+        )
+
+    async def ahybrid_search_batch(
+        self, query_dense_embeddings: list, query_sparse_embeddings: list, **kwargs
+    ) -> list[list[MilvusHit]]:
+        """
+        hybrid_search_batch의 비동기 버전
+
+        Args:
+            query_dense_embeddings: 쿼리 dense 벡터 리스트
+            query_sparse_embeddings: 쿼리 sparse 벡터 리스트
+            **kwargs: hybrid_search_batch 옵션
+
+        Returns:
+            쿼리별 MilvusHit 리스트
+        """
+        return await self.run_async(
+            self.hybrid_search_batch,
+            query_dense_embeddings,
+            query_sparse_embeddings,
+            **kwargs,
+        )
+
+    async def ainsert(
+        self,
+        texts: list[str],
+        dense_vectors: list[list[float]],
+        sparse_vectors: list,
+        metadata: list[dict] | None = None,
+    ) -> list:
+        """
+        insert의 비동기 버전
+
+        Returns:
+            삽입된 행의 primary key 리스트
+        """
+        return await self.run_async(
+            self.insert, texts, dense_vectors, sparse_vectors, metadata
+        )
@@ -0,0 +1,564 @@
+import asyncio
+import functools
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, ClassVar
+
+import numpy as np
+from scipy import sparse as sp
+
+from .milvus import MilvusHit, MilvusRerankType
+from .retriever import rrf_fusion, weighted_fusion
+
+
+def _top_k(
+    ids: np.ndarray, scores: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """쿼리(행)별 상위 k개 후보만 남기기 (argpartition, 순서는 정렬되지 않음)"""
+    if scores.shape[1] <= k:
+        return ids, scores
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(ids, part, 1), np.take_along_axis(scores, part, 1)
+
+
+def _write_replace(path: Path, write: Callable) -> None:
+    """임시 파일에 쓴 뒤 os.replace로 교체 (기존 파일을 연 쪽은 이전 내용을 그대로 봄)"""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _to_csr(vectors, num_columns: int) -> sp.csr_matrix:
+    """
+    sparse 벡터 리스트를 CSR 행렬로 변환
+
+    Args:
+        vectors: {인덱스: 값} 딕셔너리/scipy sparse 행 리스트 또는 scipy sparse 행렬
+        num_columns: 열 수 (이보다 큰 인덱스는 버림)
+
+    Returns:
+        (행 수, num_columns) CSR 행렬
+    """
+    if sp.issparse(vectors):
+        matrix = sp.csr_matrix(vectors, dtype=np.float32)
+        matrix.resize((matrix.shape[0], num_columns))
+        return matrix
+    if any(sp.issparse(vector) for vector in vectors):
+        # Milvus처럼 행 단위 sparse 행렬 리스트도 받는다
+        return sp.vstack(
+            [
+                _to_csr(vector if sp.issparse(vector) else [vector], num_columns)
+                for vector in vectors
+            ],
+            format="csr",
+        )
+    indptr = [0]
+    indices, data = [], []
+    for vector in vectors:
+        for index, value in vector.items():
+            if int(index) < num_columns:
+                indices.append(int(index))
+                data.append(value)
+        indptr.append(len(indices))
+    return sp.csr_matrix(
+        (
+            np.asarray(data, dtype=np.float32),
+            np.asarray(indices, dtype=np.int64),
+            np.asarray(indptr, dtype=np.int64),
+        ),
+        shape=(len(vectors), num_columns),
+    )
+
+
+class NumpyIndex:
+    """
+    NumPy/SciPy 기반 인프로세스 벡터 인덱스
+    Milvus와 같은 insert/dense_search/sparse_search/hybrid_search 인터페이스를 제공하며,
+    테스트/엣지 배포/소규모 코퍼스에서 milvus-lite 없이 전수 탐색(정확 검색)으로 동작한다
+
+    dense 벡터는 float32/float16 행렬, sparse 벡터는 CSR 행렬로 보관하고
+    save/load로 디스크에 저장하며, load(mmap=True) 시 dense 행렬은 메모리 매핑된다
+    MilvusRetriever가 쓰는 uri/collection_name/run_async와 비동기 검색 API도 Milvus와 같게 제공한다
+
+    Args:
+        dim: dense 벡터 차원 (기본: 1024, Qwen3-Embedding-0.6B)
+        dtype: dense 벡터 저장 타입 ("float32" 또는 "float16", 기본: "float32")
+        metric_type: dense 거리 척도 ("IP" 또는 "COSINE", 기본: "IP")
+        collection_name: 인덱스 이름 (기본: "numpy_index")
+    """
+
+    # 한 번에 점수를 계산할 행 수 (점수 행렬 메모리 상한)
+    SEARCH_BLOCK_SIZE = 65536
+    INITIAL_CAPACITY = 1024
+    # 비동기 API용 공유 실행기 (행렬곱은 GIL을 놓으므로 스레드로 병렬 실행)
+    ASYNC_MAX_WORKERS: ClassVar[int] = 8
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+    _executor_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        dim: int = 1024,
+        dtype: str = "float32",
+        metric_type: str = "IP",
+        collection_name: str = "numpy_index",
+    ):
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"지원하지 않는 저장 타입입니다: {dtype}")
+        if metric_type not in ("IP", "COSINE"):
+            raise ValueError(f"지원하지 않는 거리 척도입니다: {metric_type}")
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        self.metric_type = metric_type
+        # 메모리 인덱스는 memory://, load로 연 인덱스는 저장 경로의 file:// URI
+        self.uri = "memory://"
+        self.collection_name = collection_name
+        self.texts: list[str] = []
+        self.fields: list[dict] = []
+        self._size = 0
+        self._dense = np.empty((0, dim), dtype=self.dtype)
+        self._sparse = sp.csr_matrix((0, 0), dtype=np.float32)
+        self._pending_sparse: list[sp.csr_matrix] = []
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _prepare_dense(self, vectors) -> np.ndarray:
+        """dense 벡터를 (n, dim) float32 행렬로 변환 (COSINE이면 L2 정규화)"""
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if self.metric_type == "COSINE":
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms == 0, 1, norms)
+        return matrix
+
+    def _reserve(self, extra: int) -> None:
+        """dense 행렬 용량 확보 (2배씩 증가, 메모리 매핑된 읽기 전용 행렬은 메모리로 복사)"""
+        needed = self._size + extra
+        if needed <= len(self._dense) and self._dense.flags.writeable:
+            return
+        capacity = max(needed, 2 * len(self._dense), self.INITIAL_CAPACITY)
+        dense = np.empty((capacity, self.dim), dtype=self.dtype)
+        dense[: self._size] = self._dense[: self._size]
+        self._dense = dense
+
+    def _sparse_matrix(self) -> sp.csr_matrix:
+        """대기 중인 sparse 배치를 하나의 CSR 행렬로 합친 결과"""
+        with self._lock:
+            if self._pending_sparse:
+                blocks = [self._sparse, *self._pending_sparse]
+                num_columns = max(block.shape[1] for block in blocks)
+                for block in blocks:
+                    block.resize((block.shape[0], num_columns))
+                self._sparse = sp.vstack(blocks, format="csr", dtype=np.float32)
+                self._pending_sparse = []
+            return self._sparse
+
+    def insert(
+        self,
+        texts: list[str],
+        dense_vectors: list[list[float]],
+        sparse_vectors: list,
+        metadata: list[dict] | None = None,
+    ) -> list:
+        """
+        텍스트와 벡터를 한 번에 삽입
+
+        Args:
+            texts: 텍스트 리스트
+            dense_vectors: 텍스트별 dense 벡터
+            sparse_vectors: 텍스트별 sparse 벡터 ({인덱스: 값} 딕셔너리 또는 CSR 행렬)
+            metadata: 텍스트별 추가 필드 값 (Option)
+
+        Returns:
+            삽입된 행의 primary key 리스트
+        """
+        dense = self._prepare_dense(dense_vectors)
+        if sp.issparse(sparse_vectors):
+            num_columns = sparse_vectors.shape[1]
+        else:
+            num_columns = 1 + max(
+                (int(i) for vector in sparse_vectors for i in vector), default=-1
+            )
+        sparse = _to_csr(sparse_vectors, num_columns)
+        if not len(texts) == len(dense) == sparse.shape[0]:
+            raise ValueError("texts, dense_vectors, sparse_vectors의 길이가 다릅니다")
+
+        with self._lock:
+            start = self._size
+            self._reserve(len(texts))
+            self._dense[start : start + len(texts)] = dense
+            self._pending_sparse.append(sparse)
+            self.texts.extend(texts)
+            self.fields.extend(metadata or [{} for _ in texts])
+            self._size += len(texts)
+        return [str(pk) for pk in range(start, start + len(texts))]
+
+    def _search(
+        self,
+        score_block: Callable[[int, int], np.ndarray],
+        num_queries: int,
+        size: int,
+        limit: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        블록 단위로 점수를 계산하면서 쿼리별 상위 limit개만 유지
+
+        Args:
+            score_block: (start, end) 행 구간의 (쿼리 수, end - start) 점수 행렬을 반환하는 함수
+            num_queries: 쿼리 수
+            size: 검색할 행 수
+            limit: 쿼리별 결과 수
+
+        Returns:
+            점수 내림차순으로 정렬된 (행 번호, 점수) 행렬
+        """
+        best_ids = np.empty((num_queries, 0), dtype=np.int64)
+        best_scores = np.empty((num_queries, 0), dtype=np.float32)
+        for start in range(0, size, self.SEARCH_BLOCK_SIZE):
+            end = min(start + self.SEARCH_BLOCK_SIZE, size)
+            ids = np.broadcast_to(np.arange(start, end), (num_queries, end - start))
+            best_ids, best_scores = _top_k(
+                np.concatenate([best_ids, ids], axis=1),
+                np.concatenate([best_scores, score_block(start, end)], axis=1),
+                limit,
+            )
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        return (
+            np.take_along_axis(best_ids, order, 1),
+            np.take_along_axis(best_scores, order, 1),
+        )
+
+    def _to_hits(
+        self,
+        ids: np.ndarray,
+        scores: np.ndarray,
+        output_fields: list[str] | None,
+        positive_only: bool = False,
+    ) -> list[list[MilvusHit]]:
+        """행 번호/점수 행렬을 쿼리별 MilvusHit 리스트로 변환"""
+        results = []
+        for row_ids, row_scores in zip(ids.tolist(), scores.tolist()):
+            hits = []
+            for i, score in zip(row_ids, row_scores):
+                if positive_only and score <= 0:
+                    continue
+                fields = self.fields[i]
+                if output_fields is not None:
+                    fields = {
+                        name: fields.get(name)
+                        for name in output_fields
+                        if name != "text"
+                    }
+                hits.append(MilvusHit(str(i), score, self.texts[i], dict(fields)))
+            results.append(hits)
+        return results
+
+    @staticmethod
+    def _check_expr(expr: str | None) -> None:
+        if expr is not None:
+            raise ValueError(
+                "NumpyIndex는 스칼라 필터 표현식(expr)을 지원하지 않습니다"
+            )
+
+    def dense_search_batch(
+        self,
+        query_dense_embeddings: list,
+        params: dict = None,
+        limit=10,
+        output_fields: list[str] = None,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """
+        여러 dense 쿼리 벡터를 행렬곱 한 번(블록 단위)으로 검색
+
+        Args:
+            query_dense_embeddings: 쿼리 dense 벡터 리스트
+            params: Milvus 호환용 (전수 탐색이므로 사용하지 않음)
+            limit: 쿼리별 결과 수
+            output_fields: 함께 반환할 추가 필드 (기본: 저장된 모든 추가 필드)
+            expr: 지원하지 않음 (None 이외의 값이면 ValueError)
+
+        Returns:
+            쿼리별 MilvusHit 리스트
+        """
+        self._check_expr(expr)
+        queries = self._prepare_dense(query_dense_embeddings)
+        dense, size = self._dense, self._size
+
+        def score_block(start: int, end: int) -> np.ndarray:
+            return queries @ dense[start:end].astype(np.float32, copy=False).T
+
+        ids, scores = self._search(score_block, len(queries), size, limit)
+        return self._to_hits(ids, scores, output_fields)
+
+    def sparse_search_batch(
+        self,
+        query_sparse_embeddings: list,
+        params: dict = None,
+        limit=10,
+        output_fields: list[str] = None,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """
+        여러 sparse 쿼리 벡터를 CSR 행렬곱으로 검색 (공통 항이 없는 문서는 제외)
+
+        Args:
+            query_sparse_embeddings: 쿼리 sparse 벡터 리스트 (또는 CSR 행렬)
+            params: Milvus 호환용 (전수 탐색이므로 사용하지 않음)
+            limit: 쿼리별 결과 수
+            output_fields: 함께 반환할 추가 필드 (기본: 저장된 모든 추가 필드)
+            expr: 지원하지 않음 (None 이외의 값이면 ValueError)
+
+        Returns:
+            쿼리별 MilvusHit 리스트
+        """
+        self._check_expr(expr)
+        matrix = self._sparse_matrix()
+        size = matrix.shape[0]
+        queries = _to_csr(query_sparse_embeddings, matrix.shape[1])
+
+        def score_block(start: int, end: int) -> np.ndarray:
+            return (matrix[start:end] @ queries.T).T.toarray()
+
+        ids, scores = self._search(score_block, queries.shape[0], size, limit)
+        return self._to_hits(ids, scores, output_fields, positive_only=True)
+
+    def hybrid_search_batch(
+        self,
+        query_dense_embeddings: list,
+        query_sparse_embeddings: list,
+        dense_params=None,
+        sparse_params=None,
+        ranker_type=MilvusRerankType.RRF_RANKER,
+        sparse_weight=1.0,  # MilvusRerankType.WEIGHTED_RANKER 에서만 사용
+        dense_weight=1.0,  # MilvusRerankType.WEIGHTED_RANKER 에서만 사용
+        limit=10,
+        output_fields: list[str] = None,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """
+        dense/sparse 검색 결과를 RRF 또는 min-max 정규화 가중합으로 융합
+
+        Args:
+            query_dense_embeddings: 쿼리 dense 벡터 리스트
+            query_sparse_embeddings: 쿼리 sparse 벡터 리스트 (dense와 같은 순서)
+            dense_params: Milvus 호환용 (사용하지 않음)
+            sparse_params: Milvus 호환용 (사용하지 않음)
+            ranker_type: 융합 방식
+            sparse_weight: sparse 가중치 (WEIGHTED_RANKER 전용)
+            dense_weight: dense 가중치 (WEIGHTED_RANKER 전용)
+            limit: 쿼리별 결과 수
+            output_fields: 함께 반환할 추가 필드 (기본: 저장된 모든 추가 필드)
+            expr: 지원하지 않음 (None 이외의 값이면 ValueError)
+
+        Returns:
+            쿼리별 MilvusHit 리스트
+        """
+        dense_hits = self.dense_search_batch(
+            query_dense_embeddings, limit=limit, output_fields=output_fields, expr=expr
+        )
+        sparse_hits = self.sparse_search_batch(
+            query_sparse_embeddings, limit=limit, output_fields=output_fields, expr=expr
+        )
+        results = []
+        for dense, sparse in zip(dense_hits, sparse_hits):
+            if ranker_type == MilvusRerankType.WEIGHTED_RANKER:
+                fused = weighted_fusion(
+                    [sparse, dense], [sparse_weight, dense_weight], limit=limit
+                )
+            else:
+                fused = rrf_fusion([sparse, dense], limit=limit)
+            results.append(fused)
+        return results
+
+    def dense_search(self, query_dense_embedding, params: dict = None, limit=10):
+        hits = self.dense_search_batch([query_dense_embedding], params, limit)[0]
+        return [hit.text for hit in hits]
+
+    def sparse_search(self, query_sparse_embedding, params: dict = None, limit=10):
+        hits = self.sparse_search_batch([query_sparse_embedding], params, limit)[0]
+        return [hit.text for hit in hits]
+
+    def hybrid_search(
+        self,
+        query_dense_embedding,
+        query_sparse_embedding,
+        dense_params=None,
+        sparse_params=None,
+        ranker_type=MilvusRerankType.RRF_RANKER,
+        sparse_weight=1.0,  # MilvusRerankType.WEIGHTED_RANKER 에서만 사용
+        dense_weight=1.0,  # MilvusRerankType.WEIGHTED_RANKER 에서만 사용
+        limit=10,
+    ):
+        hits = self.hybrid_search_batch(
+            [query_dense_embedding],
+            [query_sparse_embedding],
+            dense_params=dense_params,
+            sparse_params=sparse_params,
+            ranker_type=ranker_type,
+            sparse_weight=sparse_weight,
+            dense_weight=dense_weight,
+            limit=limit,
+        )[0]
+        return [hit.text for hit in hits]
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """비동기 API용 공유 실행기 (최초 호출 시 생성)"""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=cls.ASYNC_MAX_WORKERS,
+                        thread_name_prefix="numpy-index-async",
+                    )
+        return cls._executor
+
+    async def run_async(self, func, *args, **kwargs):
+        """
+        동기 함수를 공유 실행기에서 실행해 이벤트 루프를 막지 않도록 한다
+
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: func에 전달할 인자
+
+        Returns:
+            func의 반환값
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def asearch(
+        self,
+        query_embeddings: list,
+        anns_field: str = "dense_vector",
+        params: dict = None,
+        limit=10,
+        output_fields: list[str] = None,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """
+        dense/sparse 배치 검색 (비동기, Milvus.asearch와 같은 인터페이스)
+
+        Args:
+            query_embeddings: 쿼리 벡터 리스트
+            anns_field: 검색할 벡터 필드 (dense_vector 또는 sparse_vector)
+            params: Milvus 호환용 (사용하지 않음)
+            limit: 쿼리별 결과 수
+            output_fields: 함께 반환할 추가 필드 (기본: 저장된 모든 추가 필드)
+            expr: 지원하지 않음 (None 이외의 값이면 ValueError)
+
+        Returns:
+            쿼리별 MilvusHit 리스트
+        """
+        if anns_field == "dense_vector":
+            search = self.dense_search_batch
+        elif anns_field == "sparse_vector":
+            search = self.sparse_search_batch
+        else:
+            raise ValueError(f"지원하지 않는 벡터 필드입니다: {anns_field}")
+        return await self.run_async(
+            search,
+            query_embeddings,
+            params=params,
+            limit=limit,
+            output_fields=output_fields,
+            expr=expr,
+        )
+
+    async def ahybrid_search(
+        self, query_dense_embedding, query_sparse_embedding, **kwargs
+    ):
+        """hybrid_search의 비동기 버전"""
+        return await self.run_async(
+            self.hybrid_search, query_dense_embedding, query_sparse_embedding, **kwargs
+        )
+
+    async def ahybrid_search_batch(
+        self, query_dense_embeddings: list, query_sparse_embeddings: list, **kwargs
+    ) -> list[list[MilvusHit]]:
+        """hybrid_search_batch의 비동기 버전"""
+        return await self.run_async(
+            self.hybrid_search_batch,
+            query_dense_embeddings,
+            query_sparse_embeddings,
+            **kwargs,
+        )
+
+    async def ainsert(
+        self,
+        texts: list[str],
+        dense_vectors: list[list[float]],
+        sparse_vectors: list,
+        metadata: list[dict] | None = None,
+    ) -> list:
+        """insert의 비동기 버전"""
+        return await self.run_async(
+            self.insert, texts, dense_vectors, sparse_vectors, metadata
+        )
+
+    def save(self, directory: str) -> None:
+        """
+        인덱스를 디렉터리에 저장 (dense.npy, sparse.npz, meta.json)
+
+        Args:
+            directory: 저장 경로 (없으면 생성)
+        """
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            # load(mmap=True)로 연 파일에 그대로 덮어쓰면 매핑된 데이터가 깨지므로 임시 파일에 쓴 뒤 교체
+            _write_replace(
+                path / "dense.npy", lambda f: np.save(f, self._dense[: self._size])
+            )
+            _write_replace(
+                path / "sparse.npz", lambda f: sp.save_npz(f, self._sparse_matrix())
+            )
+            meta = {
+                "dim": self.dim,
+                "dtype": self.dtype.name,
+                "metric_type": self.metric_type,
+                "collection_name": self.collection_name,
+                "texts": self.texts,
+                "fields": self.fields,
+            }
+            _write_replace(
+                path / "meta.json",
+                lambda f: f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8")),
+            )
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "NumpyIndex":
+        """
+        저장된 인덱스 불러오기
+
+        Args:
+            directory: save로 저장한 경로
+            mmap: dense 행렬을 읽기 전용 메모리 매핑으로 열지 여부 (기본: True, 삽입 시 메모리로 복사)
+
+        Returns:
+            NumpyIndex
+        """
+        path = Path(directory)
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        index = cls(
+            meta["dim"],
+            meta["dtype"],
+            meta["metric_type"],
+            meta.get("collection_name", "numpy_index"),
+        )
+        index.uri = path.resolve().as_uri()
+        index._dense = np.load(path / "dense.npy", mmap_mode="r" if mmap else None)
+        index._sparse = sp.csr_matrix(
+            sp.load_npz(path / "sparse.npz"), dtype=np.float32
+        )
+        index.texts = meta["texts"]
+        index.fields = meta["fields"]
+        index._size = len(index.texts)
+        return index
@@ -0,0 +1,89 @@
+import hashlib
+from typing import Callable
+
+from pymilvus import Collection, connections
+
+from core.utils import Registry
+
+# uri별 연결 alias, (uri, 컬렉션)별 로드된 컬렉션 핸들
+_connections = Registry("milvus-connections")
+_collections = Registry("milvus-collections")
+
+
+def connection_alias(uri: str) -> str:
+    """
+    uri에 대응하는 named alias로 연결 (프로세스당 최초 1회만 connect)
+    기본 alias를 쓰지 않으므로 서로 다른 uri의 연결이 섞이지 않는다
+
+    Args:
+        uri: 밀버스 접속 URI
+
+    Returns:
+        연결 alias
+    """
+
+    def connect() -> str:
+        alias = "milvus-" + hashlib.sha1(uri.encode("utf-8")).hexdigest()[:16]
+        connections.connect(alias=alias, uri=uri)
+        return alias
+
+    return _connections.get_or_create(uri, connect)
+
+
+def get_collection(
+    uri: str, collection_name: str, factory: Callable[[str], Collection]
+) -> Collection:
+    """
+    로드된 컬렉션 핸들 조회 (없으면 factory로 생성/로드 후 등록)
+    이미 등록된 핸들을 받는 쪽의 factory(명세)는 쓰이지 않으므로 호출자가 기존 스키마/인덱스와 비교해야 한다
+
+    Args:
+        uri: 밀버스 접속 URI
+        collection_name: 컬렉션 이름
+        factory: 연결 alias를 받아 로드된 Collection을 반환하는 함수
+
+    Returns:
+        공유 Collection 핸들
+    """
+    return _collections.get_or_create(
+        (uri, collection_name), lambda: factory(connection_alias(uri))
+    )
+
+
+def release_collection(uri: str, collection_name: str) -> bool:
+    """
+    컬렉션 핸들을 레지스트리에서 제거하고 메모리에서 언로드
+
+    Args:
+        uri: 밀버스 접속 URI
+        collection_name: 컬렉션 이름
+
+    Returns:
+        해제 여부 (등록되어 있지 않았으면 False)
+    """
+    collection = _collections.pop((uri, collection_name))
+    if collection is None:
+        return False
+    collection.release()
+    return True
+
+
+def disconnect(uri: str) -> None:
+    """
+    uri에 속한 컬렉션을 모두 언로드하고 연결 해제
+
+    Args:
+        uri: 밀버스 접속 URI
+    """
+    for key in _collections.keys():
+        if key[0] == uri:
+            release_collection(*key)
+    alias = _connections.pop(uri)
+    if alias is not None:
+        connections.disconnect(alias)
+
+
+def disconnect_all() -> None:
+    """등록된 모든 컬렉션을 언로드하고 모든 연결 해제"""
+    for uri in _connections.keys():
+        disconnect(uri)
@@ -0,0 +1,301 @@
+import array
+import threading
+from dataclasses import dataclass, replace
+
+import xxhash
+from cachetools import TTLCache
+
+from .milvus import Milvus, MilvusHit, MilvusRerankType
+
+
+def _normalize_scores(hits: list[MilvusHit], normalization: str | None) -> list[float]:
+    """
+    결과 리스트 점수 정규화
+
+    Args:
+        hits: 검색 결과
+        normalization: "minmax" 또는 None (정규화 없음)
+
+    Returns:
+        정규화된 점수 리스트
+    """
+    scores = [hit.score for hit in hits]
+    if normalization is None or not scores:
+        return scores
+    if normalization != "minmax":
+        raise ValueError(f"지원하지 않는 정규화 방식입니다: {normalization}")
+    low, high = min(scores), max(scores)
+    if high == low:
+        return [1.0] * len(scores)
+    return [(score - low) / (high - low) for score in scores]
+
+
+def _fuse(
+    result_lists: list[list[MilvusHit]], contributions: list[list[float]], limit: int
+) -> list[MilvusHit]:
+    """pk 기준으로 점수를 합산하고 중복을 제거해 상위 limit개 반환"""
+    fused: dict[str, float] = {}
+    first_hit: dict[str, MilvusHit] = {}
+    for hits, scores in zip(result_lists, contributions):
+        for hit, score in zip(hits, scores):
+            fused[hit.pk] = fused.get(hit.pk, 0.0) + score
+            first_hit.setdefault(hit.pk, hit)
+    ranked = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [replace(first_hit[pk], score=score) for pk, score in ranked]
+
+
+def rrf_fusion(
+    result_lists: list[list[MilvusHit]],
+    k: int = 60,
+    weights: list[float] | None = None,
+    limit: int = 10,
+) -> list[MilvusHit]:
+    """
+    Reciprocal Rank Fusion
+    score(d) = Σ weight_i / (k + rank_i(d)), rank는 1부터 시작
+
+    Args:
+        result_lists: 검색기별 결과 리스트
+        k: 순위 완화 상수 (기본: 60, 클수록 하위 순위의 영향이 커짐)
+        weights: 검색기별 가중치 (기본: 모두 1.0)
+        limit: 반환할 결과 수
+
+    Returns:
+        pk 기준 중복 제거된 융합 결과 (score는 RRF 점수)
+    """
+    weights = weights or [1.0] * len(result_lists)
+    contributions = [
+        [weight / (k + rank) for rank in range(1, len(hits) + 1)]
+        for hits, weight in zip(result_lists, weights)
+    ]
+    return _fuse(result_lists, contributions, limit)
+
+
+def weighted_fusion(
+    result_lists: list[list[MilvusHit]],
+    weights: list[float] | None = None,
+    normalization: str | None = "minmax",
+    limit: int = 10,
+) -> list[MilvusHit]:
+    """
+    점수 가중합 융합
+    검색기마다 점수 척도가 다르므로 기본적으로 min-max 정규화 후 가중합한다
+
+    Args:
+        result_lists: 검색기별 결과 리스트
+        weights: 검색기별 가중치 (기본: 모두 1.0)
+        normalization: "minmax" 또는 None (기본: "minmax")
+        limit: 반환할 결과 수
+
+    Returns:
+        pk 기준 중복 제거된 융합 결과 (score는 가중합 점수)
+    """
+    weights = weights or [1.0] * len(result_lists)
+    contributions = [
+        [weight * score for score in _normalize_scores(hits, normalization)]
+        for hits, weight in zip(result_lists, weights)
+    ]
+    return _fuse(result_lists, contributions, limit)
+
+
+@dataclass
+class RetrieverCacheStats:
+    """검색 결과 캐시 적중 통계"""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 적중률"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class MilvusRetriever:
+    """
+    클라이언트 측 하이브리드 융합 검색기
+    dense/sparse 검색을 각각 배치로 수행한 뒤 RRF 또는 정규화 가중합으로 융합하고,
+    쿼리 벡터 해시 + 파라미터를 키로 하는 TTL/LRU 캐시로 반복 쿼리는 DB 호출 없이 응답한다
+
+    Args:
+        milvus: 검색 대상 Milvus 또는 NumpyIndex 인스턴스
+        fusion: 융합 방식 (기본: RRF_RANKER)
+        rrf_k: RRF 순위 완화 상수 (기본: 60)
+        dense_weight: dense 결과 가중치 (기본: 1.0)
+        sparse_weight: sparse 결과 가중치 (기본: 1.0)
+        normalization: 가중합 융합 시 점수 정규화 방식 (기본: "minmax")
+        candidate_multiplier: 검색기별 후보 수 = limit x 배수 (기본: 2)
+        cache_size: 캐시 최대 항목 수 (기본: 1024, 0이면 캐시 미사용)
+        cache_ttl: 캐시 유지 시간(초) (기본: 300)
+    """
+
+    def __init__(
+        self,
+        milvus: Milvus,
+        fusion: MilvusRerankType = MilvusRerankType.RRF_RANKER,
+        rrf_k: int = 60,
+        dense_weight: float = 1.0,
+        sparse_weight: float = 1.0,
+        normalization: str | None = "minmax",
+        candidate_multiplier: int = 2,
+        cache_size: int = 1024,
+        cache_ttl: float = 300,
+    ):
+        self.milvus = milvus
+        self.fusion = fusion
+        self.rrf_k = rrf_k
+        self.dense_weight = dense_weight
+        self.sparse_weight = sparse_weight
+        self.normalization = normalization
+        self.candidate_multiplier = candidate_multiplier
+        self.cache = TTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_size else None
+        self.stats = RetrieverCacheStats()
+        self._lock = threading.Lock()
+
+    def _cache_key(self, dense, sparse, limit: int, expr: str | None) -> str:
+        """쿼리 벡터 해시 + 검색/융합 파라미터로 캐시 키 생성"""
+        digest = xxhash.xxh3_128()
+        digest.update(array.array("f", dense).tobytes())
+        if isinstance(sparse, dict):
+            digest.update(repr(sorted(sparse.items())).encode("utf-8"))
+        elif hasattr(sparse, "tocsr"):
+            # scipy sparse 행렬은 repr에 모양/nnz만 나오므로 정렬된 CSR 내용으로 해시
+            csr = sparse.tocsr(copy=True)
+            csr.sum_duplicates()
+            digest.update(repr(csr.shape).encode("utf-8"))
+            digest.update(csr.indptr.astype("int64").tobytes())
+            digest.update(csr.indices.astype("int64").tobytes())
+            digest.update(csr.data.astype("float32").tobytes())
+        else:
+            digest.update(repr(sparse).encode("utf-8"))
+        params = (
+            self.milvus.uri,
+            self.milvus.collection_name,
+            self.fusion,
+            self.rrf_k,
+            self.dense_weight,
+            self.sparse_weight,
+            self.normalization,
+            self.candidate_multiplier,
+            limit,
+            expr,
+        )
+        digest.update(repr(params).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _fuse(self, dense_hits, sparse_hits, limit: int) -> list[MilvusHit]:
+        result_lists = [dense_hits, sparse_hits]
+        weights = [self.dense_weight, self.sparse_weight]
+        if self.fusion == MilvusRerankType.WEIGHTED_RANKER:
+            return weighted_fusion(result_lists, weights, self.normalization, limit)
+        return rrf_fusion(result_lists, self.rrf_k, weights, limit)
+
+    def search_batch(
+        self,
+        query_dense_embeddings: list,
+        query_sparse_embeddings: list,
+        limit: int = 10,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """
+        여러 쿼리의 하이브리드 검색 (캐시 미스만 DB 조회)
+
+        Args:
+            query_dense_embeddings: 쿼리 dense 벡터 리스트
+            query_sparse_embeddings: 쿼리 sparse 벡터 리스트 (dense와 같은 순서)
+            limit: 쿼리별 결과 수
+            expr: 스칼라 필터 표현식 (Option)
+
+        Returns:
+            쿼리별 융합 결과 (pk 기준 중복 제거)
+        """
+        keys = [
+            self._cache_key(dense, sparse, limit, expr)
+            for dense, sparse in zip(query_dense_embeddings, query_sparse_embeddings)
+        ]
+        results: list[list[MilvusHit] | None] = [None] * len(keys)
+        if self.cache is not None:
+            with self._lock:
+                for i, key in enumerate(keys):
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        results[i] = list(cached)
+                self.stats.hits += sum(r is not None for r in results)
+                self.stats.misses += sum(r is None for r in results)
+
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+
+        candidates = limit * self.candidate_multiplier
+        dense_hits = self.milvus.dense_search_batch(
+            [query_dense_embeddings[i] for i in misses], limit=candidates, expr=expr
+        )
+        sparse_hits = self.milvus.sparse_search_batch(
+            [query_sparse_embeddings[i] for i in misses], limit=candidates, expr=expr
+        )
+        for i, dense, sparse in zip(misses, dense_hits, sparse_hits):
+            results[i] = self._fuse(dense, sparse, limit)
+            if self.cache is not None:
+                with self._lock:
+                    self.cache[keys[i]] = tuple(results[i])
+        return results
+
+    def search(
+        self,
+        query_dense_embedding,
+        query_sparse_embedding,
+        limit: int = 10,
+        expr: str = None,
+    ) -> list[MilvusHit]:
+        """
+        단일 쿼리 하이브리드 검색
+
+        Args:
+            query_dense_embedding: 쿼리 dense 벡터
+            query_sparse_embedding: 쿼리 sparse 벡터
+            limit: 결과 수
+            expr: 스칼라 필터 표현식 (Option)
+
+        Returns:
+            융합 결과 (pk 기준 중복 제거)
+        """
+        return self.search_batch(
+            [query_dense_embedding], [query_sparse_embedding], limit, expr
+        )[0]
+
+    async def asearch_batch(
+        self,
+        query_dense_embeddings: list,
+        query_sparse_embeddings: list,
+        limit: int = 10,
+        expr: str = None,
+    ) -> list[list[MilvusHit]]:
+        """search_batch의 비동기 버전 (Milvus 공유 실행기 사용)"""
+        return await self.milvus.run_async(
+            self.search_batch,
+            query_dense_embeddings,
+            query_sparse_embeddings,
+            limit,
+            expr,
+        )
+
+    async def asearch(
+        self,
+        query_dense_embedding,
+        query_sparse_embedding,
+        limit: int = 10,
+        expr: str = None,
+    ) -> list[MilvusHit]:
+        """search의 비동기 버전 (Milvus 공유 실행기 사용)"""
+        results = await self.asearch_batch(
+            [query_dense_embedding], [query_sparse_embedding], limit, expr
+        )
+        return results[0]
+
+    def clear_cache(self) -> None:
+        """검색 결과 캐시 비우기"""
+        if self.cache is not None:
+            with self._lock:
+                self.cache.clear()
@@ -0,0 +1,233 @@
+import enum
+from dataclasses import dataclass, field
+
+from pymilvus import CollectionSchema, DataType, FieldSchema
+
+
+class MilvusIndexType(enum.StrEnum):
+    """밀버스 인덱스 타입"""
+
+    AUTOINDEX = "AUTOINDEX"
+    FLAT = "FLAT"
+    HNSW = "HNSW"
+    IVF_FLAT = "IVF_FLAT"
+    IVF_SQ8 = "IVF_SQ8"
+    IVF_PQ = "IVF_PQ"
+    SPARSE_INVERTED_INDEX = "SPARSE_INVERTED_INDEX"
+    SPARSE_WAND = "SPARSE_WAND"
+
+
+@dataclass
+class MilvusIndexSpec:
+    """
+    벡터 필드 인덱스 명세
+
+    Args:
+        index_type: 인덱스 타입 (기본: AUTOINDEX)
+        metric_type: 거리 척도 (기본: IP)
+        params: 인덱스 생성 파라미터 (M, efConstruction, nlist 등)
+        search_params: 기본 검색 파라미터 (ef, nprobe 등)
+    """
+
+    index_type: MilvusIndexType = MilvusIndexType.AUTOINDEX
+    metric_type: str = "IP"
+    params: dict = field(default_factory=dict)
+    search_params: dict = field(default_factory=dict)
+
+    @classmethod
+    def hnsw(
+        cls,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef: int = 64,
+        metric_type: str = "IP",
+    ) -> "MilvusIndexSpec":
+        """
+        HNSW 인덱스 (M/efConstruction이 클수록 recall↑, 메모리/빌드 시간↑)
+
+        Args:
+            m: 노드당 최대 연결 수 (기본: 16)
+            ef_construction: 빌드 시 후보 수 (기본: 200)
+            ef: 검색 시 후보 수 (기본: 64, limit 이상이어야 함)
+            metric_type: 거리 척도 (기본: IP)
+        """
+        return cls(
+            MilvusIndexType.HNSW,
+            metric_type,
+            {"M": m, "efConstruction": ef_construction},
+            {"ef": ef},
+        )
+
+    @classmethod
+    def ivf(
+        cls,
+        nlist: int = 1024,
+        nprobe: int = 16,
+        quantization: str | None = None,
+        pq_m: int = 8,
+        pq_nbits: int = 8,
+        metric_type: str = "IP",
+    ) -> "MilvusIndexSpec":
+        """
+        IVF 계열 인덱스 (quantization: None=IVF_FLAT, "SQ8"=IVF_SQ8, "PQ"=IVF_PQ)
+
+        Args:
+            nlist: 클러스터 수 (기본: 1024)
+            nprobe: 검색 시 탐색할 클러스터 수 (기본: 16)
+            quantization: 양자화 방식 (기본: None)
+            pq_m: PQ 서브벡터 수 (기본: 8, dim의 약수여야 함)
+            pq_nbits: PQ 서브벡터당 비트 수 (기본: 8)
+            metric_type: 거리 척도 (기본: IP)
+        """
+        params = {"nlist": nlist}
+        if quantization is None:
+            index_type = MilvusIndexType.IVF_FLAT
+        elif quantization.upper() == "SQ8":
+            index_type = MilvusIndexType.IVF_SQ8
+        elif quantization.upper() == "PQ":
+            index_type = MilvusIndexType.IVF_PQ
+            params.update({"m": pq_m, "nbits": pq_nbits})
+        else:
+            raise ValueError(f"지원하지 않는 양자화 방식입니다: {quantization}")
+        return cls(index_type, metric_type, params, {"nprobe": nprobe})
+
+    @classmethod
+    def sparse(
+        cls, index_type: MilvusIndexType = MilvusIndexType.SPARSE_INVERTED_INDEX
+    ) -> "MilvusIndexSpec":
+        """sparse 벡터 인덱스 (IP 척도 고정)"""
+        return cls(index_type, "IP")
+
+    @classmethod
+    def from_index_params(
+        cls, params: dict, search_params: dict | None = None
+    ) -> "MilvusIndexSpec":
+        """
+        생성된 인덱스의 파라미터(Collection.indexes[i].params)로 명세 생성
+        서버가 돌려주는 평탄화된 문자열 값은 숫자로 되돌리고, 인덱스 파라미터가 아닌 dim은 제외한다
+
+        Args:
+            params: 인덱스 파라미터 (index_type, metric_type + 생성 파라미터)
+            search_params: 기본 검색 파라미터 (기본: None, 빈 딕셔너리)
+
+        Returns:
+            인덱스 명세
+        """
+        params = dict(params)
+        nested = params.pop("params", None) or {}
+        index_type = MilvusIndexType(params.pop("index_type"))
+        metric_type = params.pop("metric_type")
+        params.pop("dim", None)
+        build_params = {}
+        for name, value in {**params, **nested}.items():
+            for convert in (int, float):
+                try:
+                    value = convert(value)
+                    break
+                except (TypeError, ValueError):
+                    continue
+            build_params[name] = value
+        return cls(index_type, metric_type, build_params, dict(search_params or {}))
+
+    def index_params(self) -> dict:
+        """create_index에 전달할 인덱스 파라미터"""
+        params = {"index_type": str(self.index_type), "metric_type": self.metric_type}
+        if self.params:
+            params["params"] = dict(self.params)
+        return params
+
+    def search_param(self, params: dict | None = None) -> dict:
+        """
+        search/AnnSearchRequest에 전달할 검색 파라미터
+
+        Args:
+            params: 호출 시 지정한 검색 파라미터 (Option, 기본 검색 파라미터보다 우선)
+        """
+        return {
+            "metric_type": self.metric_type,
+            "params": dict(self.search_params) if params is None else params,
+        }
+
+
+@dataclass
+class MilvusCollectionSpec:
+    """
+    밀버스 컬렉션 명세
+
+    Args:
+        dim: dense 벡터 차원 (기본: 1024, Qwen3-Embedding-0.6B)
+        text_max_length: text 필드 최대 길이(UTF-8 바이트) (기본: 512)
+        pk_max_length: pk 필드 최대 길이 (기본: 100)
+        dense_index: dense 벡터 인덱스 명세 (기본: AUTOINDEX/IP)
+        sparse_index: sparse 벡터 인덱스 명세 (기본: SPARSE_INVERTED_INDEX/IP)
+        consistency_level: 일관성 수준 (기본: Bounded)
+        extra_fields: 추가 스칼라/메타데이터 필드
+        partition_key_field: 파티션 키로 사용할 추가 필드 이름 (Option)
+        num_partitions: 파티션 키 사용 시 파티션 수 (Option)
+        enable_dynamic_field: 스키마에 없는 필드 허용 여부 (기본: False)
+    """
+
+    dim: int = 1024
+    text_max_length: int = 512
+    pk_max_length: int = 100
+    dense_index: MilvusIndexSpec = field(default_factory=MilvusIndexSpec)
+    sparse_index: MilvusIndexSpec = field(default_factory=MilvusIndexSpec.sparse)
+    consistency_level: str = "Bounded"
+    extra_fields: list[FieldSchema] = field(default_factory=list)
+    partition_key_field: str | None = None
+    num_partitions: int | None = None
+    enable_dynamic_field: bool = False
+
+    @classmethod
+    def from_embedding(cls, embedding, **kwargs) -> "MilvusCollectionSpec":
+        """
+        임베딩 모델에서 dense 벡터 차원을 가져와 명세 생성
+        embedding.dimension이 있으면 사용하고, 없으면 샘플 쿼리를 임베딩해 차원을 구한다
+
+        Args:
+            embedding: 임베딩 모델
+            **kwargs: 나머지 명세 필드
+
+        Returns:
+            컬렉션 명세
+        """
+        dim = getattr(embedding, "dimension", None)
+        if dim is None:
+            dim = len(embedding.embed_query("dimension"))
+        return cls(dim=dim, **kwargs)
+
+    @property
+    def output_fields(self) -> list[str]:
+        """검색 시 함께 조회할 필드 (text + 추가 필드)"""
+        return ["text"] + [f.name for f in self.extra_fields]
+
+    def build_schema(self) -> CollectionSchema:
+        """명세로부터 CollectionSchema 생성"""
+        fields = [
+            FieldSchema(
+                name="pk",
+                dtype=DataType.VARCHAR,
+                is_primary=True,
+                auto_id=True,
+                max_length=self.pk_max_length,
+            ),
+            FieldSchema(
+                name="text",
+                dtype=DataType.VARCHAR,
+                max_length=self.text_max_length,
+            ),
+            FieldSchema(
+                name="sparse_vector",
+                dtype=DataType.SPARSE_FLOAT_VECTOR,
+            ),
+            FieldSchema(
+                name="dense_vector",
+                dtype=DataType.FLOAT_VECTOR,
+                dim=self.dim,
+            ),
+            *self.extra_fields,
+        ]
+        kwargs = {"enable_dynamic_field": self.enable_dynamic_field}
+        if self.partition_key_field:
+            kwargs["partition_key_field"] = self.partition_key_field
+        return CollectionSchema(fields, **kwargs)
@@ -0,0 +1,40 @@
+from .balancer import EndpointPool, RoutingStrategy
+from .http import (
+    HttpClientConfig,
+    aclose_http_clients,
+    close_http_clients,
+    get_async_http_client,
+    get_balanced_async_http_client,
+    get_balanced_http_client,
+    get_endpoint_pool,
+    get_http_client,
+    get_loop_async_http_client,
+)
+from .limiter import (
+    AdaptiveLimiter,
+    LimiterStats,
+    RateLimitConfig,
+    get_limiter,
+)
+from .registry import Registry, model_registry, resolve_device
+
+__all__ = [
+    "AdaptiveLimiter",
+    "EndpointPool",
+    "HttpClientConfig",
+    "LimiterStats",
+    "RateLimitConfig",
+    "Registry",
+    "RoutingStrategy",
+    "aclose_http_clients",
+    "close_http_clients",
+    "get_async_http_client",
+    "get_balanced_async_http_client",
+    "get_balanced_http_client",
+    "get_endpoint_pool",
+    "get_http_client",
+    "get_limiter",
+    "get_loop_async_http_client",
+    "model_registry",
+    "resolve_device",
+]
@@ -0,0 +1,360 @@
+import enum
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+import httpx
+
+
+class RoutingStrategy(enum.StrEnum):
+    """엔드포인트 선택 방식"""
+
+    LEAST_OUTSTANDING = "least_outstanding"  # 진행 중인 요청 수가 가장 적은 엔드포인트
+    LATENCY = "latency"  # 지연 시간 EWMA x (진행 중 요청 수 + 1)이 가장 작은 엔드포인트
+
+
+@dataclass
+class Endpoint:
+    """
+    엔드포인트 상태 (수동 헬스 체크)
+
+    Args:
+        url: 엔드포인트 base URL
+        outstanding: 진행 중인 요청 수
+        latency: 응답 헤더까지의 지연 시간 EWMA(초)
+        failures: 연속 실패 횟수
+        ejected_until: 제외 해제 시각 (time.monotonic 기준, 0이면 정상)
+        requests: 누적 요청 수
+        errors: 누적 실패 수
+    """
+
+    url: str
+    outstanding: int = 0
+    latency: float = 0.0
+    failures: int = 0
+    ejected_until: float = 0.0
+    requests: int = 0
+    errors: int = 0
+
+    def available(self, now: float) -> bool:
+        return self.ejected_until <= now
+
+
+class EndpointPool:
+    """
+    여러 엔드포인트에 요청을 분산하는 풀
+    연속 실패가 max_failures에 이르면 eject_seconds 동안 후보에서 제외하고,
+    모든 엔드포인트가 제외되면 가장 먼저 해제될 엔드포인트로 요청을 보낸다
+
+    Args:
+        urls: 엔드포인트 base URL 리스트 (첫 번째가 요청 URL의 기준)
+        strategy: 선택 방식 (기본: LEAST_OUTSTANDING)
+        max_failures: 제외할 연속 실패 횟수 (기본: 3)
+        eject_seconds: 제외 시간(초) (기본: 30)
+        latency_decay: 지연 시간 EWMA 가중치 (기본: 0.3, 클수록 최근 값 반영)
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        strategy: RoutingStrategy = RoutingStrategy.LEAST_OUTSTANDING,
+        max_failures: int = 3,
+        eject_seconds: float = 30.0,
+        latency_decay: float = 0.3,
+    ):
+        if not urls:
+            raise ValueError("엔드포인트가 하나 이상 필요합니다")
+        self.endpoints = [Endpoint(url.rstrip("/")) for url in urls]
+        self.strategy = RoutingStrategy(strategy)
+        self.max_failures = max_failures
+        self.eject_seconds = eject_seconds
+        self.latency_decay = latency_decay
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        """요청 URL의 기준이 되는 첫 번째 엔드포인트"""
+        return self.endpoints[0].url
+
+    def _cost(self, endpoint: Endpoint) -> tuple:
+        if self.strategy == RoutingStrategy.LATENCY:
+            return (endpoint.latency * (endpoint.outstanding + 1), endpoint.outstanding)
+        return (endpoint.outstanding, endpoint.latency)
+
+    def acquire(self, exclude: set[str] = frozenset()) -> Endpoint:
+        """
+        요청을 보낼 엔드포인트 선택 (진행 중 요청 수 증가)
+
+        Args:
+            exclude: 이번 요청에서 이미 실패한 엔드포인트 URL
+
+        Returns:
+            선택된 엔드포인트
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [e for e in self.endpoints if e.url not in exclude] or list(
+                self.endpoints
+            )
+            healthy = [e for e in candidates if e.available(now)]
+            if healthy:
+                best = min(self._cost(e) for e in healthy)
+                endpoint = random.choice([e for e in healthy if self._cost(e) == best])
+            else:
+                endpoint = min(candidates, key=lambda e: e.ejected_until)
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def release(
+        self, endpoint: Endpoint, latency: float | None, ok: bool | None
+    ) -> None:
+        """
+        요청 결과 반영 (진행 중 요청 수 감소, 지연 시간/실패 횟수 갱신)
+
+        Args:
+            endpoint: acquire로 받은 엔드포인트
+            latency: 응답 헤더까지 걸린 시간(초) (실패 시 None)
+            ok: 성공 여부 (None이면 취소 등 결과 없음, 진행 중 요청 수만 감소)
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if ok is None:
+                return
+            if ok:
+                endpoint.failures = 0
+                endpoint.ejected_until = 0.0
+                if latency is not None:
+                    decay = self.latency_decay if endpoint.latency else 1.0
+                    endpoint.latency += decay * (latency - endpoint.latency)
+                return
+            endpoint.errors += 1
+            endpoint.failures += 1
+            if endpoint.failures >= self.max_failures:
+                endpoint.ejected_until = time.monotonic() + self.eject_seconds
+
+    def snapshot(self) -> list[dict]:
+        """엔드포인트별 상태 (모니터링용)"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "url": e.url,
+                    "outstanding": e.outstanding,
+                    "latency": e.latency,
+                    "requests": e.requests,
+                    "errors": e.errors,
+                    "ejected": not e.available(now),
+                }
+                for e in self.endpoints
+            ]
+
+
+class _BalancedTransportBase:
+    """동기/비동기 분산 transport 공통 로직"""
+
+    # 재시도해도 안전한 메서드 (retry_post=True면 POST도 포함)
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    # 다른 엔드포인트로 재시도할 응답 상태 코드
+    RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+    def __init__(self, pool: EndpointPool, max_attempts: int | None, retry_post: bool):
+        self.pool = pool
+        attempts = max_attempts or len(pool.endpoints)
+        self.max_attempts = max(1, min(attempts, len(pool.endpoints)))
+        self.retry_post = retry_post
+        # httpx는 URL을 정규화하므로(호스트 소문자, 기본 포트 생략) 문자열이 아닌 파싱된 값으로 비교
+        self._base_url = httpx.URL(pool.base_url)
+
+    def _retryable(self, request: httpx.Request) -> bool:
+        return request.method in self.IDEMPOTENT_METHODS or (
+            self.retry_post and request.method == "POST"
+        )
+
+    def _route(self, request: httpx.Request, endpoint: Endpoint) -> httpx.Request:
+        """
+        기준 엔드포인트 URL을 선택된 엔드포인트 URL로 바꾼 요청
+        scheme/host/port가 같고 경로가 기준 경로로 시작하는 요청만 바꾼다
+        """
+        url, base = request.url, self._base_url
+        base_path = base.path.rstrip("/")
+        if (url.scheme, url.host, url.port) == (base.scheme, base.host, base.port) and (
+            url.path == base_path or url.path.startswith(base_path + "/")
+        ):
+            target = httpx.URL(endpoint.url)
+            url = url.copy_with(
+                scheme=target.scheme,
+                host=target.host,
+                port=target.port,
+                path=target.path.rstrip("/") + url.path[len(base_path) :],
+            )
+        headers = request.headers.copy()
+        headers.pop("host", None)
+        return httpx.Request(
+            request.method,
+            url,
+            headers=headers,
+            content=request.content,
+            extensions=request.extensions,
+        )
+
+
+class _TrackedStream(httpx.SyncByteStream):
+    """응답 본문을 다 읽거나 닫을 때 엔드포인트를 반환하는 스트림"""
+
+    def __init__(self, stream, on_close):
+        self.stream = stream
+        self.on_close = on_close
+
+    def __iter__(self):
+        yield from self.stream
+
+    def close(self):
+        try:
+            self.stream.close()
+        finally:
+            if self.on_close is not None:
+                self.on_close()
+                self.on_close = None
+
+
+class _AsyncTrackedStream(httpx.AsyncByteStream):
+    """_TrackedStream의 비동기 버전"""
+
+    def __init__(self, stream, on_close):
+        self.stream = stream
+        self.on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self.stream.aclose()
+        finally:
+            if self.on_close is not None:
+                self.on_close()
+                self.on_close = None
+
+
+class BalancedTransport(_BalancedTransportBase, httpx.BaseTransport):
+    """
+    EndpointPool로 요청을 분산하는 동기 httpx transport
+    연결 오류, 502/503/504 응답은 실패로 기록하고, 재시도 가능한 요청은 다른 엔드포인트로 다시 보낸다
+
+    Args:
+        pool: 엔드포인트 풀
+        transport: 실제 전송에 사용할 transport (여러 엔드포인트의 연결 풀을 함께 관리)
+        max_attempts: 요청당 최대 시도 엔드포인트 수 (기본: None, 모든 엔드포인트)
+        retry_post: POST 요청도 재시도할지 여부 (기본: False)
+    """
+
+    def __init__(
+        self,
+        pool: EndpointPool,
+        transport: httpx.BaseTransport,
+        max_attempts: int | None = None,
+        retry_post: bool = False,
+    ):
+        super().__init__(pool, max_attempts, retry_post)
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        tried: set[str] = set()
+        for attempt in range(self.max_attempts):
+            last = attempt == self.max_attempts - 1 or not self._retryable(request)
+            endpoint = self.pool.acquire(tried)
+            tried.add(endpoint.url)
+            started = time.monotonic()
+            try:
+                response = self.transport.handle_request(self._route(request, endpoint))
+            except httpx.TransportError:
+                self.pool.release(endpoint, None, ok=False)
+                if last:
+                    raise
+                continue
+            except BaseException:
+                # 호출자 쪽 중단 등은 엔드포인트 실패로 보지 않고 진행 중 요청 수만 되돌림
+                self.pool.release(endpoint, None, ok=None)
+                raise
+            latency = time.monotonic() - started
+            if response.status_code in self.RETRY_STATUS_CODES:
+                if not last:
+                    self.pool.release(endpoint, None, ok=False)
+                    response.close()
+                    continue
+                ok = False
+            else:
+                ok = True
+            return httpx.Response(
+                response.status_code,
+                headers=response.headers,
+                stream=_TrackedStream(
+                    response.stream,
+                    lambda: self.pool.release(endpoint, latency, ok),
+                ),
+                extensions=response.extensions,
+            )
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncBalancedTransport(_BalancedTransportBase, httpx.AsyncBaseTransport):
+    """BalancedTransport의 비동기 버전"""
+
+    def __init__(
+        self,
+        pool: EndpointPool,
+        transport: httpx.AsyncBaseTransport,
+        max_attempts: int | None = None,
+        retry_post: bool = False,
+    ):
+        super().__init__(pool, max_attempts, retry_post)
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        tried: set[str] = set()
+        for attempt in range(self.max_attempts):
+            last = attempt == self.max_attempts - 1 or not self._retryable(request)
+            endpoint = self.pool.acquire(tried)
+            tried.add(endpoint.url)
+            started = time.monotonic()
+            try:
+                response = await self.transport.handle_async_request(
+                    self._route(request, endpoint)
+                )
+            except httpx.TransportError:
+                self.pool.release(endpoint, None, ok=False)
+                if last:
+                    raise
+                continue
+            except BaseException:
+                # 취소(CancelledError) 등은 엔드포인트 실패로 보지 않고 진행 중 요청 수만 되돌림
+                self.pool.release(endpoint, None, ok=None)
+                raise
+            latency = time.monotonic() - started
+            if response.status_code in self.RETRY_STATUS_CODES:
+                if not last:
+                    self.pool.release(endpoint, None, ok=False)
+                    await response.aclose()
+                    continue
+                ok = False
+            else:
+                ok = True
+            return httpx.Response(
+                response.status_code,
+                headers=response.headers,
+                stream=_AsyncTrackedStream(
+                    response.stream,
+                    lambda: self.pool.release(endpoint, latency, ok),
+                ),
+                extensions=response.extensions,
+            )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,244 @@
+import asyncio
+import importlib.util
+import threading
+import weakref
+from dataclasses import dataclass
+
+import httpx
+
+from .balancer import (
+    AsyncBalancedTransport,
+    BalancedTransport,
+    EndpointPool,
+    RoutingStrategy,
+)
+from .registry import Registry
+
+# (클라이언트 종류, base_url, 설정)별 공유 httpx 클라이언트
+http_registry = Registry("http-clients")
+
+# 이벤트 루프별 비동기 클라이언트 (루프가 사라지면 함께 정리)
+_loop_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_loop_clients_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    """
+    공유 httpx 클라이언트 설정
+
+    Args:
+        max_connections: 엔드포인트당 최대 동시 연결 수 (기본: 100)
+        max_keepalive_connections: 유지할 유휴 연결 수 (기본: 20)
+        keepalive_expiry: 유휴 연결 유지 시간(초) (기본: 30)
+        connect_timeout: 연결 타임아웃(초) (기본: 5)
+        read_timeout: 응답 읽기 타임아웃(초) (기본: 120, LLM 응답 대기 포함)
+        write_timeout: 요청 쓰기 타임아웃(초) (기본: 30)
+        pool_timeout: 연결 풀 대기 타임아웃(초) (기본: 30, 동시 연결이 가득 찼을 때)
+        http2: HTTP/2 사용 여부 (기본: True, h2 패키지가 설치된 경우에만 적용)
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 120.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 30.0
+    http2: bool = True
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    @property
+    def use_http2(self) -> bool:
+        """HTTP/2 실제 사용 여부 (h2 미설치 시 HTTP/1.1로 대체)"""
+        return self.http2 and importlib.util.find_spec("h2") is not None
+
+    def client_kwargs(self) -> dict:
+        """httpx.Client/AsyncClient 생성 인자"""
+        return {
+            "limits": self.limits,
+            "timeout": self.timeout,
+            "http2": self.use_http2,
+        }
+
+
+def _registry_key(kind: str, base_url: str, config: HttpClientConfig) -> tuple:
+    return kind, base_url.rstrip("/"), config
+
+
+def get_http_client(
+    base_url: str, config: HttpClientConfig | None = None
+) -> httpx.Client:
+    """
+    base_url별 공유 동기 httpx 클라이언트 (프로세스당 한 번만 생성)
+    같은 엔드포인트를 쓰는 모든 인스턴스가 연결 풀과 keep-alive 연결을 함께 사용한다
+
+    Args:
+        base_url: 엔드포인트 URL
+        config: 클라이언트 설정 (기본: HttpClientConfig())
+
+    Returns:
+        httpx.Client
+    """
+    config = config or HttpClientConfig()
+    return http_registry.get_or_create(
+        _registry_key("sync", base_url, config),
+        lambda: httpx.Client(**config.client_kwargs()),
+    )
+
+
+def get_async_http_client(
+    base_url: str, config: HttpClientConfig | None = None
+) -> httpx.AsyncClient:
+    """
+    base_url별 공유 비동기 httpx 클라이언트 (프로세스당 한 번만 생성)
+
+    Args:
+        base_url: 엔드포인트 URL
+        config: 클라이언트 설정 (기본: HttpClientConfig())
+
+    Returns:
+        httpx.AsyncClient
+    """
+    config = config or HttpClientConfig()
+    return http_registry.get_or_create(
+        _registry_key("async", base_url, config),
+        lambda: httpx.AsyncClient(**config.client_kwargs()),
+    )
+
+
+def get_loop_async_http_client(
+    name: str, config: HttpClientConfig | None = None
+) -> httpx.AsyncClient:
+    """
+    현재 실행 중인 이벤트 루프에 묶인 공유 비동기 httpx 클라이언트
+    httpx.AsyncClient의 연결은 만든 루프에서만 쓸 수 있으므로,
+    asyncio.run을 여러 번 호출하는 도구처럼 루프가 바뀌는 호출부에서 사용한다
+
+    Args:
+        name: 클라이언트 이름 (같은 루프/이름/설정이면 같은 클라이언트)
+        config: 클라이언트 설정 (기본: HttpClientConfig())
+
+    Returns:
+        httpx.AsyncClient
+    """
+    config = config or HttpClientConfig()
+    loop = asyncio.get_running_loop()
+    with _loop_clients_lock:
+        clients = _loop_clients.setdefault(loop, {})
+        client = clients.get((name, config))
+        if client is None or client.is_closed:
+            client = clients[(name, config)] = httpx.AsyncClient(
+                **config.client_kwargs()
+            )
+        return client
+
+
+def get_endpoint_pool(
+    urls: list[str], strategy: RoutingStrategy = RoutingStrategy.LEAST_OUTSTANDING
+) -> EndpointPool:
+    """
+    엔드포인트 목록별 공유 EndpointPool (동기/비동기 클라이언트가 상태를 함께 사용)
+
+    Args:
+        urls: 엔드포인트 base URL 리스트
+        strategy: 선택 방식 (기본: LEAST_OUTSTANDING)
+
+    Returns:
+        EndpointPool
+    """
+    key = ("pool", tuple(url.rstrip("/") for url in urls), RoutingStrategy(strategy))
+    return http_registry.get_or_create(key, lambda: EndpointPool(urls, strategy))
+
+
+def get_balanced_http_client(
+    urls: list[str],
+    config: HttpClientConfig | None = None,
+    strategy: RoutingStrategy = RoutingStrategy.LEAST_OUTSTANDING,
+    retry_post: bool = False,
+) -> httpx.Client:
+    """
+    여러 엔드포인트로 요청을 분산하는 공유 동기 httpx 클라이언트
+    요청 URL은 첫 번째 엔드포인트 기준으로 만들고, 전송 시 선택된 엔드포인트로 바뀐다
+
+    Args:
+        urls: 엔드포인트 base URL 리스트
+        config: 클라이언트 설정 (기본: HttpClientConfig())
+        strategy: 선택 방식 (기본: LEAST_OUTSTANDING)
+        retry_post: 실패 시 POST 요청도 다른 엔드포인트로 재시도할지 여부 (기본: False)
+
+    Returns:
+        httpx.Client
+    """
+    config = config or HttpClientConfig()
+    pool = get_endpoint_pool(urls, strategy)
+
+    def create() -> httpx.Client:
+        transport = httpx.HTTPTransport(limits=config.limits, http2=config.use_http2)
+        return httpx.Client(
+            transport=BalancedTransport(pool, transport, retry_post=retry_post),
+            timeout=config.timeout,
+        )
+
+    urls = tuple(e.url for e in pool.endpoints)
+    key = ("balanced-sync", urls, RoutingStrategy(strategy), config, retry_post)
+    return http_registry.get_or_create(key, create)
+
+
+def get_balanced_async_http_client(
+    urls: list[str],
+    config: HttpClientConfig | None = None,
+    strategy: RoutingStrategy = RoutingStrategy.LEAST_OUTSTANDING,
+    retry_post: bool = False,
+) -> httpx.AsyncClient:
+    """get_balanced_http_client의 비동기 버전"""
+    config = config or HttpClientConfig()
+    pool = get_endpoint_pool(urls, strategy)
+
+    def create() -> httpx.AsyncClient:
+        transport = httpx.AsyncHTTPTransport(
+            limits=config.limits, http2=config.use_http2
+        )
+        return httpx.AsyncClient(
+            transport=AsyncBalancedTransport(pool, transport, retry_post=retry_post),
+            timeout=config.timeout,
+        )
+
+    urls = tuple(e.url for e in pool.endpoints)
+    key = ("balanced-async", urls, RoutingStrategy(strategy), config, retry_post)
+    return http_registry.get_or_create(key, create)
+
+
+def close_http_clients() -> None:
+    """등록된 동기 클라이언트를 닫고 레지스트리 비우기 (비동기 클라이언트는 aclose_http_clients 사용)"""
+    for key in http_registry.keys():
+        if key[0] in ("sync", "balanced-sync"):
+            http_registry.pop(key).close()
+
+
+async def aclose_http_clients() -> None:
+    """등록된 모든 클라이언트(현재 루프의 루프별 클라이언트 포함)를 닫고 레지스트리 비우기"""
+    close_http_clients()
+    for item in http_registry.clear():
+        if isinstance(item, httpx.AsyncClient):
+            await item.aclose()
+    with _loop_clients_lock:
+        clients = _loop_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
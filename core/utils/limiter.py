@@ -0,0 +1,266 @@
+import asyncio
+import contextlib
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+from .registry import Registry
+
+# (이름, 설정)별 공유 제한기
+limiter_registry = Registry("rate-limiters")
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """
+    요청 속도/동시성 제한 설정
+
+    Args:
+        requests_per_second: 토큰 버킷 충전 속도 (기본: None, 속도 제한 없음)
+        burst: 토큰 버킷 크기 (기본: None, requests_per_second와 같음)
+        initial_concurrency: 초기 동시 요청 한도 (기본: 8)
+        min_concurrency: 동시 요청 한도 하한 (기본: 1)
+        max_concurrency: 동시 요청 한도 상한 (기본: 64)
+        decrease_factor: 스로틀/지연 초과 시 한도에 곱할 값 (기본: 0.5)
+        latency_target: 이 시간(초)을 넘는 응답은 과부하로 보고 한도를 줄임 (기본: None, 사용 안 함)
+        cooldown: 한도를 연속으로 줄이지 않는 최소 간격(초) (기본: 1)
+        max_wait: 대기 시간 상한(초), 넘으면 TimeoutError (기본: None, 무제한)
+    """
+
+    requests_per_second: float | None = None
+    burst: float | None = None
+    initial_concurrency: int = 8
+    min_concurrency: int = 1
+    max_concurrency: int = 64
+    decrease_factor: float = 0.5
+    latency_target: float | None = None
+    cooldown: float = 1.0
+    max_wait: float | None = None
+
+
+@dataclass
+class LimiterStats:
+    """제한기 상태/대기 지표"""
+
+    limit: float = 0.0
+    inflight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    acquired: int = 0
+    throttled: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        """평균 대기 시간(초)"""
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+class AdaptiveLimiter:
+    """
+    토큰 버킷 속도 제한 + AIMD 동시성 제한
+    성공하면 동시 요청 한도를 1/한도 만큼 늘리고(요청 한 바퀴당 +1),
+    스로틀(429)이나 목표 지연 초과 시 decrease_factor를 곱해 줄인다 (cooldown 안에서는 한 번만)
+    Retry-After가 주어지면 그 시간 동안 새 요청을 내보내지 않는다
+
+    Args:
+        config: 제한 설정 (기본: RateLimitConfig())
+    """
+
+    # 동시성 슬롯 대기 시 비동기 경로의 재확인 간격(초)
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, config: RateLimitConfig | None = None):
+        self.config = config or RateLimitConfig()
+        rate = self.config.requests_per_second
+        self.capacity = (self.config.burst or rate) if rate else None
+        self.tokens = self.capacity or 0.0
+        self.limit = float(self.config.initial_concurrency)
+        self.inflight = 0
+        self.paused_until = 0.0
+        self._refilled_at = time.monotonic()
+        self._decreased_at = 0.0
+        self._stats = LimiterStats()
+        self._condition = threading.Condition()
+
+    def _try_acquire(self, now: float) -> float:
+        """
+        슬롯 획득 시도 (락 안에서 호출)
+
+        Returns:
+            0이면 획득 성공, 아니면 다시 시도하기까지 기다릴 시간(초)
+        """
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.inflight >= max(1, math.floor(self.limit)):
+            return self.POLL_INTERVAL
+        if self.capacity is not None:
+            rate = self.config.requests_per_second
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self._refilled_at) * rate
+            )
+            self._refilled_at = now
+            if self.tokens < 1:
+                return (1 - self.tokens) / rate
+            self.tokens -= 1
+        self.inflight += 1
+        return 0.0
+
+    def _enqueue(self) -> float:
+        self._stats.queue_depth += 1
+        self._stats.max_queue_depth = max(
+            self._stats.max_queue_depth, self._stats.queue_depth
+        )
+        return time.monotonic()
+
+    def _dequeue(self, started: float, acquired: bool) -> None:
+        waited = time.monotonic() - started
+        self._stats.queue_depth -= 1
+        if acquired:
+            self._stats.acquired += 1
+            self._stats.total_wait += waited
+            self._stats.max_wait = max(self._stats.max_wait, waited)
+        else:
+            self._stats.timeouts += 1
+
+    def _deadline_left(self, started: float) -> float | None:
+        if self.config.max_wait is None:
+            return None
+        return self.config.max_wait - (time.monotonic() - started)
+
+    def acquire(self) -> None:
+        """슬롯을 얻을 때까지 대기 (max_wait 초과 시 TimeoutError)"""
+        with self._condition:
+            started = self._enqueue()
+            while (wait := self._try_acquire(time.monotonic())) > 0:
+                left = self._deadline_left(started)
+                if left is not None and left <= 0:
+                    self._dequeue(started, acquired=False)
+                    raise TimeoutError("요청 대기 시간이 max_wait를 넘었습니다")
+                self._condition.wait(wait if left is None else min(wait, left))
+            self._dequeue(started, acquired=True)
+
+    async def aacquire(self) -> None:
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        with self._condition:
+            started = self._enqueue()
+        while True:
+            with self._condition:
+                wait = self._try_acquire(time.monotonic())
+                if wait <= 0:
+                    self._dequeue(started, acquired=True)
+                    return
+                left = self._deadline_left(started)
+                if left is not None and left <= 0:
+                    self._dequeue(started, acquired=False)
+                    raise TimeoutError("요청 대기 시간이 max_wait를 넘었습니다")
+            await asyncio.sleep(wait if left is None else min(wait, left))
+
+    def _decrease(self, now: float) -> None:
+        if now - self._decreased_at >= self.config.cooldown:
+            self.limit = max(
+                self.config.min_concurrency, self.limit * self.config.decrease_factor
+            )
+            self._decreased_at = now
+
+    def release(
+        self,
+        latency: float | None = None,
+        throttled: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
+        """
+        슬롯 반환 및 한도 조정
+
+        Args:
+            latency: 요청 소요 시간(초) (Option)
+            throttled: 서버가 스로틀(429)했는지 여부
+            retry_after: 서버가 알려준 재시도 대기 시간(초) (Option)
+        """
+        now = time.monotonic()
+        with self._condition:
+            self.inflight -= 1
+            target = self.config.latency_target
+            if throttled:
+                self._stats.throttled += 1
+                self._decrease(now)
+                if retry_after:
+                    self.paused_until = max(self.paused_until, now + retry_after)
+            elif target is not None and latency is not None and latency > target:
+                self._decrease(now)
+            else:
+                self.limit = min(
+                    self.config.max_concurrency, self.limit + 1 / max(self.limit, 1)
+                )
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def slot(self):
+        """
+        acquire/release 컨텍스트 (블록 소요 시간을 지연 시간으로 기록)
+
+        Yields:
+            SlotResult (블록 안에서 스로틀 여부/Retry-After를 기록)
+        """
+        self.acquire()
+        result = SlotResult()
+        started = time.monotonic()
+        try:
+            yield result
+        finally:
+            self.release(
+                time.monotonic() - started, result.throttled, result.retry_after
+            )
+
+    @contextlib.asynccontextmanager
+    async def aslot(self):
+        """slot의 비동기 버전"""
+        await self.aacquire()
+        result = SlotResult()
+        started = time.monotonic()
+        try:
+            yield result
+        finally:
+            self.release(
+                time.monotonic() - started, result.throttled, result.retry_after
+            )
+
+    @property
+    def stats(self) -> LimiterStats:
+        """현재 지표 스냅샷"""
+        with self._condition:
+            return LimiterStats(
+                **{
+                    **self._stats.__dict__,
+                    "limit": self.limit,
+                    "inflight": self.inflight,
+                }
+            )
+
+
+@dataclass
+class SlotResult:
+    """slot 블록 안에서 기록하는 요청 결과"""
+
+    throttled: bool = False
+    retry_after: float | None = None
+
+
+def get_limiter(name: str, config: RateLimitConfig | None = None) -> AdaptiveLimiter:
+    """
+    이름(모델 등)과 설정별 공유 제한기 (프로세스당 한 번만 생성)
+
+    Args:
+        name: 제한 단위 이름 (예: "openrouter:<모델 이름>")
+        config: 제한 설정 (기본: RateLimitConfig())
+
+    Returns:
+        AdaptiveLimiter
+    """
+    config = config or RateLimitConfig()
+    return limiter_registry.get_or_create(
+        (name, config), lambda: AdaptiveLimiter(config)
+    )
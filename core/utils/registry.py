@@ -0,0 +1,104 @@
+import threading
+from typing import Any, Callable, Hashable
+
+
+class Registry:
+    """
+    프로세스 단위 공유 객체 레지스트리
+    같은 키로 요청하면 한 번만 생성하고 이후에는 같은 인스턴스를 돌려준다
+
+    Args:
+        name: 레지스트리 이름 (디버깅용)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._items: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        키에 해당하는 객체 조회, 없으면 factory로 생성 후 등록
+        서로 다른 키의 생성은 병렬로 진행되고 같은 키는 한 번만 생성된다
+
+        Args:
+            key: 레지스트리 키
+            factory: 객체 생성 함수
+
+        Returns:
+            등록된 객체
+        """
+        item = self._items.get(key)
+        if item is not None:
+            return item
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            item = self._items.get(key)
+            if item is None:
+                item = factory()
+                with self._lock:
+                    self._items[key] = item
+        return item
+
+    def get(self, key: Hashable) -> Any:
+        """등록된 객체 조회 (없으면 None)"""
+        return self._items.get(key)
+
+    def pop(self, key: Hashable) -> Any:
+        """
+        등록된 객체 제거
+
+        Returns:
+            제거된 객체 (없으면 None)
+        """
+        with self._lock:
+            self._key_locks.pop(key, None)
+            return self._items.pop(key, None)
+
+    def clear(self) -> list[Any]:
+        """
+        등록된 객체 전체 제거
+
+        Returns:
+            제거된 객체 리스트
+        """
+        with self._lock:
+            items = list(self._items.values())
+            self._items.clear()
+            self._key_locks.clear()
+        return items
+
+    def keys(self) -> list[Hashable]:
+        """등록된 키 리스트"""
+        return list(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+# 모델 가중치 공유용 레지스트리 (키: (종류, 모델, 디바이스, ...))
+model_registry = Registry("models")
+
+
+def resolve_device(device: str | None = None) -> str:
+    """
+    실행 디바이스 결정
+    지정하지 않으면 CUDA 사용 가능 여부에 따라 cuda/cpu 선택
+
+    Args:
+        device: 명시적으로 지정한 디바이스 (Option)
+
+    Returns:
+        디바이스 문자열
+    """
+    if device:
+        return device
+    import torch
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
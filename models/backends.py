@@ -0,0 +1,152 @@
+import enum
+import os
+from pathlib import Path
+
+
+class ModelBackend(enum.StrEnum):
+    """로컬 모델 실행 백엔드"""
+
+    TORCH = "torch"  # 즉시 실행 fp32 (기본)
+    TORCH_INT8 = "torch_int8"  # torch 동적 int8 양자화 (CPU)
+    ONNX = "onnx"  # ONNX Runtime 세션 (CPU)
+
+
+# 변환된 모델 저장 경로 (환경 변수 LANGGRAPH_BLOCKS_CACHE_DIR로 변경 가능)
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get(
+        "LANGGRAPH_BLOCKS_CACHE_DIR",
+        Path.home() / ".cache" / "langgraph-blocks",
+    )
+)
+
+
+def backend_device(backend: ModelBackend, device: str) -> str:
+    """
+    백엔드가 지원하는 디바이스로 보정
+    양자화/ONNX 백엔드는 CPU 전용
+
+    Args:
+        backend: 실행 백엔드
+        device: 요청한 디바이스
+
+    Returns:
+        실제 사용할 디바이스
+    """
+    return device if backend == ModelBackend.TORCH else "cpu"
+
+
+def quantize_dynamic(model):
+    """
+    Linear 레이어를 int8 동적 양자화
+
+    Args:
+        model: torch 모듈
+
+    Returns:
+        양자화된 모듈 (in-place)
+    """
+    import torch
+
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
+def causal_attention_bias(attention_mask):
+    """
+    2D 패딩 마스크로 4D 가산 어텐션 마스크(인과 + 패딩) 생성
+    transformers 기본 마스크 생성은 vmap을 사용해 ONNX 트레이싱이 되지 않으므로 변환용 래퍼에서 직접 전달한다
+
+    Args:
+        attention_mask: (batch, sequence) 패딩 마스크
+
+    Returns:
+        (batch, 1, sequence, sequence) float32 마스크
+    """
+    import torch
+
+    idx = attention_mask.new_ones(attention_mask.shape[-1]).cumsum(0)
+    causal = idx[None, :] <= idx[:, None]
+    allowed = causal[None, None] & attention_mask[:, None, None, :].bool()
+    return torch.zeros(allowed.shape, dtype=torch.float32).masked_fill(
+        ~allowed, torch.finfo(torch.float32).min
+    )
+
+
+def onnx_model_path(kind: str, model_name: str, cache_dir: Path | None = None) -> Path:
+    """
+    변환된 ONNX 모델 파일 경로
+
+    Args:
+        kind: 모델 종류 (embedding, reranking 등)
+        model_name: 허깅페이스 모델 이름
+        cache_dir: 저장 루트 (기본: DEFAULT_CACHE_DIR)
+
+    Returns:
+        ONNX 파일 경로
+    """
+    root = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    return root / "onnx" / kind / model_name.replace("/", "--") / "model.onnx"
+
+
+def export_onnx(
+    module,
+    sample_inputs: dict,
+    path: Path,
+    output_names: list[str],
+    opset_version: int = 17,
+):
+    """
+    torch 모듈을 ONNX로 변환해 저장 (이미 있으면 건너뜀)
+    입력은 (batch, sequence) 동적 축을 가진 정수 텐서로 가정
+
+    Args:
+        module: 변환할 torch 모듈
+        sample_inputs: 입력 이름별 예시 텐서
+        path: 저장 경로
+        output_names: 출력 이름 리스트
+        opset_version: ONNX opset 버전 (기본: 17)
+    """
+    import torch
+
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    input_names = list(sample_inputs)
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes.update({name: {0: "batch"} for name in output_names})
+
+    # 변환 도중 실패해도 깨진 파일이 캐시로 남지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = path.with_suffix(".tmp.onnx")
+    with torch.no_grad():
+        torch.onnx.export(
+            module.eval(),
+            tuple(sample_inputs.values()),
+            str(tmp_path),
+            input_names=input_names,
+            output_names=output_names,
+            dynamic_axes=dynamic_axes,
+            opset_version=opset_version,
+            dynamo=False,
+        )
+    os.replace(tmp_path, path)
+
+
+def onnx_session(path: Path, num_threads: int | None = None):
+    """
+    CPU ONNX Runtime 세션 생성
+
+    Args:
+        path: ONNX 파일 경로
+        num_threads: 연산 스레드 수 (기본: None, 런타임 기본값)
+
+    Returns:
+        onnxruntime.InferenceSession
+    """
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if num_threads:
+        options.intra_op_num_threads = num_threads
+    return ort.InferenceSession(str(path), options, providers=["CPUExecutionProvider"])
@@ -1,7 +1,10 @@
+from .cached import CachedChatModel, ChatCacheStats
 from .local import ChatLocal
 from .openrouter import ChatOpenRouter
 
 __all__ = [
+    "CachedChatModel",
+    "ChatCacheStats",
     "ChatLocal",
     "ChatOpenRouter",
 ]
@@ -0,0 +1,320 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+import diskcache
+import xxhash
+from cachetools import LRUCache
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessageChunk,
+    BaseMessage,
+    message_to_dict,
+    messages_from_dict,
+    messages_to_dict,
+)
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableBinding
+from pydantic import PrivateAttr
+
+from models.backends import DEFAULT_CACHE_DIR
+
+
+class _LeaderAbandoned(Exception):
+    """leader 호출이 취소/중단되어 follower가 직접 다시 시도해야 함을 알리는 내부 예외"""
+
+
+@dataclass
+class ChatCacheStats:
+    """챗 모델 응답 캐시/요청 합치기 통계"""
+
+    hits: int = 0
+    disk_hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 적중률 (합쳐진 요청 포함)"""
+        total = self.hits + self.disk_hits + self.coalesced + self.misses
+        return (total - self.misses) / total if total else 0.0
+
+
+class CachedChatModel(BaseChatModel):
+    """
+    응답 캐시와 요청 합치기(single-flight)를 제공하는 챗 모델 래퍼
+    동시에 들어온 같은 요청은 하나의 업스트림 호출 결과를 함께 받고,
+    temperature=0 호출의 응답은 메모리 LRU(+ 선택적 디스크)에 저장해 재사용한다
+
+    Args:
+        model: 감쌀 챗 모델 (ChatLocal, ChatOpenRouter 등)
+        cache_size: 메모리 캐시 최대 항목 수 (기본: 1024)
+        disk_cache: 디스크 캐시 사용 여부 (기본: False)
+        disk_cache_dir: 디스크 캐시 경로 (기본: ~/.cache/langgraph-blocks/chat)
+        disk_size_limit: 디스크 캐시 최대 용량(바이트) (기본: 1GiB)
+        disk_cache_ttl: 디스크 캐시 항목 유지 시간(초) (기본: 7일, None이면 만료 없음)
+    """
+
+    model: Any
+    cache_size: int = 1024
+    disk_cache: bool = False
+    disk_cache_dir: str | None = None
+    disk_size_limit: int = 2**30
+    disk_cache_ttl: float | None = 7 * 24 * 3600
+
+    _memory: LRUCache = PrivateAttr()
+    _disk: diskcache.Cache | None = PrivateAttr(default=None)
+    _inflight: dict = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _stats: ChatCacheStats = PrivateAttr(default_factory=ChatCacheStats)
+
+    def model_post_init(self, context: Any) -> None:
+        self._memory = LRUCache(maxsize=max(self.cache_size, 1))
+        if self.disk_cache:
+            self._disk = diskcache.Cache(
+                str(Path(self.disk_cache_dir or DEFAULT_CACHE_DIR / "chat")),
+                size_limit=self.disk_size_limit,
+                eviction_policy="least-recently-used",
+            )
+
+    @property
+    def _llm_type(self) -> str:
+        return "cached-chat-model"
+
+    @property
+    def stats(self) -> ChatCacheStats:
+        return self._stats
+
+    @property
+    def _bound_model(self) -> BaseChatModel:
+        return (
+            self.model.bound if isinstance(self.model, RunnableBinding) else self.model
+        )
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        params = {"model": type(self._bound_model).__name__}
+        params.update(getattr(self._bound_model, "_identifying_params", {}))
+        # 모델 이름이 고정된 로컬 서버(ChatLocal 등)도 서버별로 구분되도록 엔드포인트 포함
+        params["endpoint"] = getattr(self._bound_model, "openai_api_base", None)
+        if isinstance(self.model, RunnableBinding):
+            params["bound_kwargs"] = self.model.kwargs
+        return params
+
+    def _is_deterministic(self, kwargs: dict) -> bool:
+        """temperature=0 호출인지 여부 (호출 인자 > 바인딩 인자 > 모델 설정 순)"""
+        bound_kwargs = getattr(self.model, "kwargs", {})
+        temperature = kwargs.get(
+            "temperature",
+            bound_kwargs.get(
+                "temperature", getattr(self._bound_model, "temperature", None)
+            ),
+        )
+        return temperature == 0
+
+    def _key(self, messages: list[BaseMessage], stop, kwargs: dict) -> str:
+        """모델 식별 정보 + 메시지 + 호출 인자로 캐시 키 생성 (메시지 id 제외)"""
+        payload = messages_to_dict(messages)
+        for message in payload:
+            message["data"].pop("id", None)
+        data = [self._identifying_params, payload, stop, kwargs]
+        digest = xxhash.xxh3_128_hexdigest(
+            json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        )
+        return f"chat:{digest}"
+
+    def _lookup(self, key: str) -> BaseMessage | None:
+        with self._lock:
+            message = self._memory.get(key)
+            if message is not None:
+                self._stats.hits += 1
+                return message
+        if self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                message = messages_from_dict([json.loads(value)])[0]
+                with self._lock:
+                    self._memory[key] = message
+                    self._stats.disk_hits += 1
+                return message
+        return None
+
+    def _store(self, key: str, message: BaseMessage) -> None:
+        with self._lock:
+            self._memory[key] = message
+        if self._disk is not None:
+            self._disk.set(
+                key,
+                json.dumps(message_to_dict(message)),
+                expire=self.disk_cache_ttl,
+            )
+
+    def _join(self, key: str) -> tuple[Future, bool]:
+        """진행 중인 같은 요청이 있으면 그 Future, 없으면 새 Future를 등록 (leader 여부 함께 반환)"""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._stats.coalesced += 1
+                return future, False
+            future = self._inflight[key] = Future()
+            self._stats.misses += 1
+            return future, True
+
+    def _finish(self, key: str, future: Future, message=None, error=None) -> None:
+        """
+        진행 중 요청 종료 (follower에게 결과/예외 전달)
+        leader가 취소(CancelledError)·중단된 경우 그 예외는 leader에서만 다시 발생시키고,
+        follower는 _LeaderAbandoned를 받아 새 leader로 다시 시도한다
+        """
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is not None and not isinstance(error, Exception):
+            error = _LeaderAbandoned()
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(message)
+
+    @staticmethod
+    def _result(message: BaseMessage) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=message.model_copy())])
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        key = self._key(messages, stop, kwargs)
+        deterministic = self._is_deterministic(kwargs)
+        while True:
+            if deterministic and (message := self._lookup(key)) is not None:
+                return self._result(message)
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return self._result(future.result())
+            except _LeaderAbandoned:
+                continue
+        try:
+            message = self.model.invoke(messages, stop=stop, **kwargs)
+        except BaseException as error:
+            self._finish(key, future, error=error)
+            raise
+        if deterministic:
+            self._store(key, message)
+        self._finish(key, future, message)
+        return self._result(message)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        key = self._key(messages, stop, kwargs)
+        deterministic = self._is_deterministic(kwargs)
+        while True:
+            if deterministic and (message := self._lookup(key)) is not None:
+                return self._result(message)
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                # follower가 취소돼도 공유 Future는 취소하지 않는다
+                return self._result(await asyncio.shield(asyncio.wrap_future(future)))
+            except _LeaderAbandoned:
+                continue
+        try:
+            message = await self.model.ainvoke(messages, stop=stop, **kwargs)
+        except BaseException as error:
+            self._finish(key, future, error=error)
+            raise
+        if deterministic:
+            self._store(key, message)
+        self._finish(key, future, message)
+        return self._result(message)
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        """스트리밍은 합치지 않고 그대로 전달 (temperature=0이면 캐시 적중 시 한 번에, 종료 후 저장)"""
+        key = self._key(messages, stop, kwargs)
+        deterministic = self._is_deterministic(kwargs)
+        if deterministic and (message := self._lookup(key)) is not None:
+            yield self._cached_chunk(message)
+            return
+        aggregated = None
+        for chunk in self.model.stream(messages, stop=stop, **kwargs):
+            aggregated = chunk if aggregated is None else aggregated + chunk
+            yield ChatGenerationChunk(message=chunk)
+        if deterministic and aggregated is not None:
+            self._store(key, aggregated)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager=None,
+        **kwargs: Any,
+    ):
+        """_stream의 비동기 버전"""
+        key = self._key(messages, stop, kwargs)
+        deterministic = self._is_deterministic(kwargs)
+        if deterministic and (message := self._lookup(key)) is not None:
+            yield self._cached_chunk(message)
+            return
+        aggregated = None
+        async for chunk in self.model.astream(messages, stop=stop, **kwargs):
+            aggregated = chunk if aggregated is None else aggregated + chunk
+            yield ChatGenerationChunk(message=chunk)
+        if deterministic and aggregated is not None:
+            self._store(key, aggregated)
+
+    @staticmethod
+    def _cached_chunk(message: BaseMessage) -> ChatGenerationChunk:
+        """캐시된 응답 메시지를 하나의 스트림 청크로 변환"""
+        if isinstance(message, AIMessageChunk):
+            return ChatGenerationChunk(message=message)
+        tool_call_chunks = [
+            {
+                "name": call["name"],
+                "args": json.dumps(call["args"]),
+                "id": call["id"],
+                "index": index,
+            }
+            for index, call in enumerate(getattr(message, "tool_calls", []))
+        ]
+        return ChatGenerationChunk(
+            message=AIMessageChunk(
+                content=message.content,
+                additional_kwargs=message.additional_kwargs,
+                response_metadata=message.response_metadata,
+                usage_metadata=getattr(message, "usage_metadata", None),
+                tool_call_chunks=tool_call_chunks,
+            )
+        )
+
+    def bind_tools(self, tools, **kwargs):
+        """도구 바인딩은 내부 모델에 위임하고 같은 캐시를 공유하는 래퍼로 반환"""
+        return self.model_copy(
+            update={"model": self._bound_model.bind_tools(tools, **kwargs)}
+        )
+
+    def clear_cache(self) -> None:
+        """메모리/디스크 캐시 비우기"""
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
@@ -2,6 +2,15 @@ from typing import ClassVar
 
 from langchain_openai import ChatOpenAI
 
+from core.utils import (
+    HttpClientConfig,
+    RoutingStrategy,
+    get_async_http_client,
+    get_balanced_async_http_client,
+    get_balanced_http_client,
+    get_http_client,
+)
+
 
 class ChatLocal(ChatOpenAI):
     """
@@ -11,14 +20,46 @@ class ChatLocal(ChatOpenAI):
         model: "local-model"로 고정(모델은 별도로 구분하지 않음)
         api_key: "not-needed"로 고정(API 키는 필요하지 않음)
         base_url: 온디바이스 모델 서버의 URL
+        http_config: 공유 HTTP 클라이언트 설정 (기본: HttpClientConfig(), 같은 base_url이면 연결 풀 공유)
+        endpoints: 요청을 분산할 서버 URL 리스트 (Option, 지정하면 base_url 대신 사용)
+        routing: 엔드포인트 선택 방식 (기본: LEAST_OUTSTANDING)
+
+    endpoints를 지정하면 연속으로 실패하는 서버는 잠시 제외하고, 연결 오류나 502/503/504 응답은
+    다른 서버로 재시도한다 (채팅 완성 요청은 서버 상태를 바꾸지 않으므로 POST도 재시도)
     """
 
     BASE_URL: ClassVar[str] = "http://localhost:8080/v1"
 
-    def __init__(self, base_url: str = None, **kwargs):
+    def __init__(
+        self,
+        base_url: str = None,
+        http_config: HttpClientConfig | None = None,
+        endpoints: list[str] | None = None,
+        routing: RoutingStrategy = RoutingStrategy.LEAST_OUTSTANDING,
+        **kwargs,
+    ):
+        # 직접 전달한 클라이언트가 있으면 쓰지 않을 공유 클라이언트를 만들지 않는다
+        if endpoints:
+            base_url = endpoints[0]
+            if "http_client" not in kwargs:
+                kwargs["http_client"] = get_balanced_http_client(
+                    endpoints, http_config, routing, True
+                )
+            if "http_async_client" not in kwargs:
+                kwargs["http_async_client"] = get_balanced_async_http_client(
+                    endpoints, http_config, routing, True
+                )
+        else:
+            base_url = base_url or self.BASE_URL
+            if "http_client" not in kwargs:
+                kwargs["http_client"] = get_http_client(base_url, http_config)
+            if "http_async_client" not in kwargs:
+                kwargs["http_async_client"] = get_async_http_client(
+                    base_url, http_config
+                )
         super().__init__(
             model="local-model",
-            base_url=base_url or self.BASE_URL,
+            base_url=base_url,
             api_key="not-needed",
             **kwargs,
         )
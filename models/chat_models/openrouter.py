@@ -1,7 +1,30 @@
+import asyncio
+import itertools
 import os
-from typing import ClassVar
+import time
+from typing import Any, ClassVar
 
+import openai
 from langchain_openai import ChatOpenAI
+from pydantic import PrivateAttr
+
+from core.utils import (
+    AdaptiveLimiter,
+    HttpClientConfig,
+    RateLimitConfig,
+    get_async_http_client,
+    get_http_client,
+    get_limiter,
+)
+
+
+def _retry_after(response) -> float | None:
+    """Retry-After 헤더(초 단위) 파싱 (없거나 날짜 형식이면 None)"""
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
 
 
 class ChatOpenRouter(ChatOpenAI):
@@ -11,18 +34,131 @@ class ChatOpenRouter(ChatOpenAI):
     Args:
         model: OpenRouter에서 제공하는 모델 이름
         api_key: OpenRouter API 키 (환경 변수 OPENROUTER_API_KEY에서 가져올 수 있음)
+        http_config: 공유 HTTP 클라이언트 설정 (기본: HttpClientConfig(), 모든 인스턴스가 연결 풀 공유)
+        rate_limit: 요청 속도/동시성 제한 설정 (기본: RateLimitConfig(), 같은 모델의 모든 인스턴스가 공유)
+        max_retries: 429/연결 오류/5xx 재시도 횟수 (기본: 2)
+            SDK 내부 재시도는 끄고 매 시도마다 제한기 슬롯을 다시 받아 토큰 버킷/AIMD/Retry-After를 거친다
     """
 
     BASE_URL: ClassVar[str] = "https://openrouter.ai/api/v1"
+    # Retry-After가 없는 429, 연결 오류/5xx 재시도 대기 시간 기준(초) (시도마다 2배)
+    RETRY_BACKOFF: ClassVar[float] = 0.5
 
-    def __init__(self, model: str, api_key: str = None, **kwargs):
+    _limiter: AdaptiveLimiter = PrivateAttr()
+    _max_retries: int = PrivateAttr(default=2)
+
+    def __init__(
+        self,
+        model: str,
+        api_key: str = None,
+        http_config: HttpClientConfig | None = None,
+        rate_limit: RateLimitConfig | None = None,
+        max_retries: int = 2,
+        **kwargs,
+    ):
         api_key = self._get_api_key(api_key)
+        kwargs.setdefault("http_client", get_http_client(self.BASE_URL, http_config))
+        kwargs.setdefault(
+            "http_async_client", get_async_http_client(self.BASE_URL, http_config)
+        )
         super(ChatOpenRouter, self).__init__(
             model=model,
             base_url=self.BASE_URL,
             api_key=api_key,
+            max_retries=0,
             **kwargs,
         )
+        self._limiter = get_limiter(f"openrouter:{model}", rate_limit)
+        self._max_retries = max_retries
+
+    @property
+    def limiter(self) -> AdaptiveLimiter:
+        """모델별 공유 제한기 (limiter.stats로 대기열/대기 시간 확인)"""
+        return self._limiter
+
+    def _retry_wait(self, slot, error: openai.APIError, attempt: int, retry: bool):
+        """
+        실패한 시도를 슬롯에 기록하고 재시도 전 대기 시간 계산
+
+        Args:
+            slot: 실패한 시도의 SlotResult
+            error: OpenAI SDK 예외
+            attempt: 0부터 시작하는 시도 번호
+            retry: 재시도 가능 여부 (스트림이 이미 시작됐으면 False)
+
+        Returns:
+            재시도 전 대기 시간(초) (재시도하지 않으면 None)
+        """
+        backoff = self.RETRY_BACKOFF * 2**attempt
+        if isinstance(error, openai.RateLimitError):
+            # 429는 제한기 전체를 Retry-After(없으면 backoff) 동안 멈추고 다음 acquire에서 대기
+            slot.throttled = True
+            slot.retry_after = _retry_after(error.response) or backoff
+            wait = 0.0
+        elif isinstance(error, (openai.APIConnectionError, openai.InternalServerError)):
+            wait = backoff
+        else:
+            return None
+        return wait if retry and attempt < self._max_retries else None
+
+    def _generate(self, *args: Any, **kwargs: Any):
+        if self.streaming:
+            # ChatOpenAI가 self._stream으로 위임하므로 슬롯/재시도는 _stream에서만 처리
+            return super()._generate(*args, **kwargs)
+        for attempt in itertools.count():
+            with self._limiter.slot() as slot:
+                try:
+                    return super()._generate(*args, **kwargs)
+                except openai.APIError as error:
+                    wait = self._retry_wait(slot, error, attempt, retry=True)
+                    if wait is None:
+                        raise
+            time.sleep(wait)
+
+    async def _agenerate(self, *args: Any, **kwargs: Any):
+        if self.streaming:
+            return await super()._agenerate(*args, **kwargs)
+        for attempt in itertools.count():
+            async with self._limiter.aslot() as slot:
+                try:
+                    return await super()._agenerate(*args, **kwargs)
+                except openai.APIError as error:
+                    wait = self._retry_wait(slot, error, attempt, retry=True)
+                    if wait is None:
+                        raise
+            await asyncio.sleep(wait)
+
+    def _stream(self, *args: Any, **kwargs: Any):
+        """스트림이 끝날 때까지 슬롯 유지 (첫 청크 전에 실패한 경우에만 재시도)"""
+        for attempt in itertools.count():
+            started = False
+            with self._limiter.slot() as slot:
+                try:
+                    for chunk in super()._stream(*args, **kwargs):
+                        started = True
+                        yield chunk
+                    return
+                except openai.APIError as error:
+                    wait = self._retry_wait(slot, error, attempt, retry=not started)
+                    if wait is None:
+                        raise
+            time.sleep(wait)
+
+    async def _astream(self, *args: Any, **kwargs: Any):
+        """_stream의 비동기 버전"""
+        for attempt in itertools.count():
+            started = False
+            async with self._limiter.aslot() as slot:
+                try:
+                    async for chunk in super()._astream(*args, **kwargs):
+                        started = True
+                        yield chunk
+                    return
+                except openai.APIError as error:
+                    wait = self._retry_wait(slot, error, attempt, retry=not started)
+                    if wait is None:
+                        raise
+            await asyncio.sleep(wait)
 
     def _get_api_key(self, api_key: str = None):
         """
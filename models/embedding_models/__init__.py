@@ -1,6 +1,8 @@
+from .cache import EmbeddingCache
 from .local import LocalEmbedding, HuggingfaceEmbeddingModel
 
 __all__ = [
+    "EmbeddingCache",
     "LocalEmbedding",
     "HuggingfaceEmbeddingModel",
 ]
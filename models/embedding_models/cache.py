@@ -0,0 +1,109 @@
+import array
+import unicodedata
+from pathlib import Path
+
+import diskcache
+import xxhash
+
+from models.backends import DEFAULT_CACHE_DIR
+
+
+class EmbeddingCache:
+    """
+    디스크 기반 임베딩 캐시
+    키는 네임스페이스(모델 이름 + 인코딩 옵션)와 정규화한 텍스트의 해시로 구성하며,
+    용량이 size_limit을 넘으면 가장 오래 사용하지 않은 항목부터 제거한다
+
+    Args:
+        directory: 캐시 저장 경로 (기본: ~/.cache/langgraph-blocks/embeddings)
+        size_limit: 최대 용량(바이트) (기본: 1GiB)
+    """
+
+    DEFAULT_SIZE_LIMIT = 2**30
+
+    def __init__(self, directory: str | None = None, size_limit: int | None = None):
+        self.directory = Path(directory or DEFAULT_CACHE_DIR / "embeddings")
+        self.cache = diskcache.Cache(
+            str(self.directory),
+            size_limit=size_limit or self.DEFAULT_SIZE_LIMIT,
+            eviction_policy="least-recently-used",
+        )
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        캐시 키용 텍스트 정규화
+        모델 입력과 동일하게 줄바꿈을 공백으로 바꾸고 유니코드 NFC로 통일
+
+        Args:
+            text: 원본 텍스트
+
+        Returns:
+            정규화된 텍스트
+        """
+        return unicodedata.normalize("NFC", text.replace("\n", " "))
+
+    def key(self, namespace: str, text: str) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            namespace: 모델/옵션 네임스페이스
+            text: 원본 텍스트
+
+        Returns:
+            "네임스페이스:텍스트 해시" 형태의 키
+        """
+        digest = xxhash.xxh3_128_hexdigest(self.normalize(text).encode("utf-8"))
+        return f"{namespace}:{digest}"
+
+    def get_many(self, namespace: str, texts: list[str]) -> list[list[float] | None]:
+        """
+        여러 텍스트의 임베딩 조회
+
+        Args:
+            namespace: 모델/옵션 네임스페이스
+            texts: 텍스트 리스트
+
+        Returns:
+            텍스트별 임베딩 (없으면 None)
+        """
+        results = []
+        for text in texts:
+            value = self.cache.get(self.key(namespace, text))
+            results.append(None if value is None else array.array("f", value).tolist())
+        return results
+
+    def set_many(
+        self, namespace: str, texts: list[str], vectors: list[list[float]]
+    ) -> None:
+        """
+        여러 텍스트의 임베딩을 한 트랜잭션으로 저장
+
+        Args:
+            namespace: 모델/옵션 네임스페이스
+            texts: 텍스트 리스트
+            vectors: 텍스트별 임베딩
+        """
+        with self.cache.transact():
+            for text, vector in zip(texts, vectors):
+                # float32 바이트로 저장해 pickle 대비 용량을 줄인다
+                self.cache.set(
+                    self.key(namespace, text), array.array("f", vector).tobytes()
+                )
+
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        return self.cache.clear()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def close(self) -> None:
+        """캐시 파일 핸들 정리"""
+        self.cache.close()
@@ -1,8 +1,22 @@
 import enum
+import json
+from pathlib import Path
+from typing import Any
 
-from langchain_huggingface import HuggingFaceEmbeddings
+import xxhash
+from langchain_core.embeddings import Embeddings
 
-embeddings = HuggingFaceEmbeddings(model_name="Qwen/Qwen3-Embedding-0.6B")
+from core.utils import model_registry, resolve_device
+from models.embedding_models.cache import EmbeddingCache
+from models.backends import (
+    ModelBackend,
+    backend_device,
+    causal_attention_bias,
+    export_onnx,
+    onnx_model_path,
+    onnx_session,
+    quantize_dynamic,
+)
 
 
 class HuggingfaceEmbeddingModel(enum.StrEnum):
@@ -12,21 +26,328 @@ class HuggingfaceEmbeddingModel(enum.StrEnum):
     QWEN3_4B = "Qwen/Qwen3-Embedding-4B"
     QWEN3_8B = "Qwen/Qwen3-Embedding-8B"
 
+    @property
+    def dimension(self) -> int:
+        """임베딩 벡터 차원"""
+        return {
+            HuggingfaceEmbeddingModel.QWEN3_0_6B: 1024,
+            HuggingfaceEmbeddingModel.QWEN3_4B: 2560,
+            HuggingfaceEmbeddingModel.QWEN3_8B: 4096,
+        }[self]
 
-class LocalEmbedding(HuggingFaceEmbeddings):
+
+class OnnxSentenceEncoder:
+    """
+    ONNX Runtime으로 문장 임베딩을 계산하는 인코더
+    SentenceTransformer.encode와 같은 호출 형태(batch_size, normalize_embeddings, prompt_name)를 지원한다
+
+    Args:
+        session: onnxruntime.InferenceSession
+        tokenizer: 허깅페이스 토크나이저
+        max_seq_length: 최대 토큰 길이
+        prompts: 프롬프트 이름별 접두 문자열
+    """
+
+    CONFIG_NAME = "encoder_config.json"
+
+    def __init__(
+        self,
+        session,
+        tokenizer,
+        max_seq_length: int,
+        prompts: dict[str, str] | None = None,
+    ):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.max_seq_length = max_seq_length
+        self.prompts = prompts or {}
+
+    @classmethod
+    def load(cls, path: Path):
+        """
+        변환된 ONNX 모델과 토크나이저 설정 로드
+
+        Args:
+            path: ONNX 파일 경로
+
+        Returns:
+            OnnxSentenceEncoder 인스턴스
+        """
+        from transformers import AutoTokenizer
+
+        config = json.loads((path.parent / cls.CONFIG_NAME).read_text())
+        return cls(
+            onnx_session(path),
+            AutoTokenizer.from_pretrained(path.parent),
+            config["max_seq_length"],
+            config.get("prompts"),
+        )
+
+    @staticmethod
+    def export(model, path: Path):
+        """
+        SentenceTransformer 모델을 (input_ids, attention_mask) -> sentence_embedding ONNX로 변환
+        토크나이저와 인코딩 설정도 같은 디렉터리에 저장한다
+
+        Args:
+            model: SentenceTransformer 인스턴스
+            path: 저장 경로
+        """
+        import torch
+
+        class _SentenceEmbedding(torch.nn.Module):
+            def __init__(self, model):
+                super().__init__()
+                self.model = model
+
+            def forward(self, input_ids, attention_mask):
+                # Qwen3 임베딩 모델은 디코더(인과) 구조이므로 인과 마스크를 직접 전달
+                outputs = self.model[0].auto_model(
+                    input_ids=input_ids,
+                    attention_mask=causal_attention_bias(attention_mask),
+                )
+                features = {
+                    "input_ids": input_ids,
+                    "attention_mask": attention_mask,
+                    "token_embeddings": outputs[0],
+                }
+                for module in list(self.model)[1:]:
+                    features = module(features)
+                return features["sentence_embedding"]
+
+        sample = model.tokenizer(["hello", "world"], padding=True, return_tensors="pt")
+        export_onnx(
+            _SentenceEmbedding(model),
+            {
+                "input_ids": sample["input_ids"],
+                "attention_mask": sample["attention_mask"],
+            },
+            path,
+            output_names=["sentence_embedding"],
+        )
+        model.tokenizer.save_pretrained(path.parent)
+        config = {"max_seq_length": model.max_seq_length, "prompts": model.prompts}
+        (path.parent / OnnxSentenceEncoder.CONFIG_NAME).write_text(json.dumps(config))
+
+    def encode(
+        self,
+        sentences: list[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        prompt_name: str | None = None,
+        prompt: str | None = None,
+        **kwargs,
+    ):
+        """
+        문장 임베딩 계산
+
+        Args:
+            sentences: 문장 리스트
+            batch_size: 배치 크기 (기본: 32)
+            normalize_embeddings: L2 정규화 여부 (기본: False)
+            prompt_name: 저장된 프롬프트 이름 (Option)
+            prompt: 문장 앞에 붙일 프롬프트 (Option, prompt_name보다 우선)
+
+        Returns:
+            (문장 수, 차원) numpy 배열
+        """
+        import numpy as np
+
+        if prompt is None and prompt_name is not None:
+            prompt = self.prompts[prompt_name]
+        if prompt:
+            sentences = [prompt + sentence for sentence in sentences]
+
+        outputs = []
+        for i in range(0, len(sentences), batch_size):
+            enc = self.tokenizer(
+                sentences[i : i + batch_size],
+                padding=True,
+                truncation="longest_first",
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            (embeddings,) = self.session.run(
+                ["sentence_embedding"],
+                {
+                    "input_ids": enc["input_ids"].astype(np.int64),
+                    "attention_mask": enc["attention_mask"].astype(np.int64),
+                },
+            )
+            outputs.append(embeddings)
+        embeddings = np.concatenate(outputs) if outputs else np.zeros((0, 0))
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+        return embeddings
+
+
+class LocalEmbedding(Embeddings):
     """
     온디바이스 임베딩
+    모델 가중치는 첫 인코딩 시점에 로드되며 같은 모델/디바이스를 쓰는 인스턴스끼리 공유된다
 
     Args:
         embedding_model: 사용할 임베딩 모델 (기본: QWEN3_0_6B)
+        device: 실행 디바이스 (기본: None, 자동 선택, 양자화/ONNX 백엔드는 CPU 고정)
+        backend: 실행 백엔드 (기본: TORCH)
+        cache_dir: ONNX 변환 결과 저장 경로 (기본: None, ~/.cache/langgraph-blocks)
+        model_kwargs: SentenceTransformer 생성 시 전달할 옵션 ("device" 키는 device로 취급)
+        encode_kwargs: 문서 인코딩 시 전달할 옵션
+        query_encode_kwargs: 쿼리 인코딩 시 전달할 옵션 (기본: encode_kwargs와 동일)
+        cache: 임베딩 캐시 (기본: None, 캐시 미사용)
+        cache_folder: 허깅페이스 모델 다운로드 경로 (기본: None, 허깅페이스 기본 경로)
+        multi_process: 여러 프로세스(GPU)로 나눠 인코딩할지 여부 (기본: False, ONNX 백엔드는 무시)
+        show_progress: 인코딩 진행률 표시 여부 (기본: False, ONNX 백엔드는 무시)
     """
 
     def __init__(
         self,
         embedding_model: HuggingfaceEmbeddingModel = HuggingfaceEmbeddingModel.QWEN3_0_6B,
-        **kwargs
+        device: str | None = None,
+        backend: ModelBackend = ModelBackend.TORCH,
+        cache_dir: str | None = None,
+        model_kwargs: dict[str, Any] | None = None,
+        encode_kwargs: dict[str, Any] | None = None,
+        query_encode_kwargs: dict[str, Any] | None = None,
+        cache: EmbeddingCache | None = None,
+        cache_folder: str | None = None,
+        multi_process: bool = False,
+        show_progress: bool = False,
     ):
-        super().__init__(
-            model_name=embedding_model,
-            **kwargs,
+        # HuggingFaceEmbeddings처럼 model_kwargs={"device": ...}로 넘긴 디바이스도 받는다
+        model_kwargs = dict(model_kwargs or {})
+        model_device = model_kwargs.pop("device", None)
+        self.model_name = str(embedding_model)
+        self.device = device or model_device
+        self.backend = ModelBackend(backend)
+        self.cache_dir = cache_dir
+        self.model_kwargs = model_kwargs
+        self.encode_kwargs = encode_kwargs or {}
+        self.query_encode_kwargs = query_encode_kwargs
+        self.cache = cache
+        self.cache_folder = cache_folder
+        self.multi_process = multi_process
+        self.show_progress = show_progress
+
+    @property
+    def registry_key(self) -> tuple:
+        """모델 레지스트리 키 (종류, 모델, 디바이스, 백엔드, 생성 옵션)"""
+        return (
+            "embedding",
+            self.model_name,
+            backend_device(self.backend, resolve_device(self.device)),
+            self.backend,
+            repr(sorted(self.model_kwargs.items())),
+        )
+
+    @property
+    def client(self):
+        """SentenceTransformer 또는 OnnxSentenceEncoder 인스턴스 (최초 접근 시 로드)"""
+        key = self.registry_key
+        return model_registry.get_or_create(key, lambda: self._load(key[2]))
+
+    @property
+    def dimension(self) -> int:
+        """임베딩 벡터 차원 (알려진 모델이 아니면 샘플 인코딩으로 확인)"""
+        try:
+            return HuggingfaceEmbeddingModel(self.model_name).dimension
+        except ValueError:
+            return len(self.embed_query("dimension"))
+
+    def _load(self, device: str):
+        from sentence_transformers import SentenceTransformer
+
+        if self.backend == ModelBackend.ONNX:
+            path = onnx_model_path("embedding", self.model_name, self.cache_dir)
+            if not path.exists():
+                model = SentenceTransformer(
+                    self.model_name,
+                    device="cpu",
+                    cache_folder=self.cache_folder,
+                    **self.model_kwargs,
+                )
+                OnnxSentenceEncoder.export(model, path)
+            return OnnxSentenceEncoder.load(path)
+
+        model = SentenceTransformer(
+            self.model_name,
+            device=device,
+            cache_folder=self.cache_folder,
+            **self.model_kwargs,
+        )
+        if self.backend == ModelBackend.TORCH_INT8:
+            model = quantize_dynamic(model)
+        return model
+
+    def _run_encode(self, texts: list[str], encode_kwargs: dict[str, Any]):
+        """진행률 표시/다중 프로세스 옵션을 반영한 인코딩 (ONNX 인코더는 그대로 호출)"""
+        client = self.client
+        if self.backend == ModelBackend.ONNX:
+            return client.encode(texts, **encode_kwargs)
+        encode_kwargs = {"show_progress_bar": self.show_progress, **encode_kwargs}
+        if not self.multi_process:
+            return client.encode(texts, **encode_kwargs)
+        pool = client.start_multi_process_pool()
+        try:
+            return client.encode(texts, pool=pool, **encode_kwargs)
+        finally:
+            client.stop_multi_process_pool(pool)
+
+    def _encode(self, texts: list[str], encode_kwargs: dict[str, Any]):
+        texts = [text.replace("\n", " ") for text in texts]
+        if self.cache is None:
+            return self._run_encode(texts, encode_kwargs).tolist()
+
+        # 캐시 미스만 중복 제거 후 한 번에 인코딩
+        namespace = self._cache_namespace(encode_kwargs)
+        vectors = self.cache.get_many(namespace, texts)
+        misses = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+        if misses:
+            encoded = self._run_encode(misses, encode_kwargs).tolist()
+            self.cache.set_many(namespace, misses, encoded)
+            encoded_map = dict(zip(misses, encoded))
+            vectors = [
+                encoded_map[t] if v is None else v for t, v in zip(texts, vectors)
+            ]
+        return vectors
+
+    def _cache_namespace(self, encode_kwargs: dict[str, Any]) -> str:
+        """모델/백엔드/모델 생성 옵션/인코딩 옵션별 캐시 네임스페이스"""
+        options = repr(sorted(encode_kwargs.items()))
+        namespace = f"{self.model_name}|{self.backend}|{options}"
+        if self.model_kwargs:
+            # truncate_dim, revision, dtype 등 생성 옵션이 다르면 같은 텍스트도 벡터가 달라짐
+            model_options = json.dumps(self.model_kwargs, sort_keys=True, default=repr)
+            digest = xxhash.xxh3_64_hexdigest(model_options.encode("utf-8"))
+            namespace = f"{namespace}|model:{digest}"
+        return namespace
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """
+        문서 임베딩
+
+        Args:
+            texts: 임베딩할 문서 리스트
+
+        Returns:
+            문서별 임베딩 벡터 리스트
+        """
+        return self._encode(texts, self.encode_kwargs)
+
+    def embed_query(self, text: str) -> list[float]:
+        """
+        쿼리 임베딩
+
+        Args:
+            text: 임베딩할 쿼리
+
+        Returns:
+            쿼리 임베딩 벡터
+        """
+        encode_kwargs = (
+            self.encode_kwargs
+            if self.query_encode_kwargs is None
+            else self.query_encode_kwargs
         )
+        return self._encode([text], encode_kwargs)[0]
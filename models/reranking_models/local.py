@@ -1,7 +1,22 @@
+import copy
 import enum
+import functools
+import heapq
+import time
+from typing import Iterator
 
 import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM
+
+from core.utils import model_registry, resolve_device
+from models.backends import (
+    ModelBackend,
+    backend_device,
+    causal_attention_bias,
+    export_onnx,
+    onnx_model_path,
+    onnx_session,
+    quantize_dynamic,
+)
 
 
 class HuggingfaceRerankModel(enum.StrEnum):
@@ -12,12 +27,34 @@ class HuggingfaceRerankModel(enum.StrEnum):
     QWEN3_8B = "Qwen/Qwen3-Reranker-8B"
 
 
+class _YesNoLogits(torch.nn.Module):
+    """마지막 토큰의 ('no', 'yes') 로짓만 내보내는 ONNX 변환용 래퍼"""
+
+    def __init__(self, model, tid_no: int, tid_yes: int):
+        super().__init__()
+        self.model = model
+        self.tid_no = tid_no
+        self.tid_yes = tid_yes
+
+    def forward(self, input_ids, attention_mask):
+        logits = self.model(
+            input_ids=input_ids,
+            attention_mask=causal_attention_bias(attention_mask),
+            use_cache=False,
+        ).logits[:, -1, :]
+        return torch.stack([logits[:, self.tid_no], logits[:, self.tid_yes]], dim=1)
+
+
 class LocalReranking:
     """
     로컬 리랭킹 모델
+    모델 가중치는 첫 스코어 계산 시점에 로드되며 같은 모델/디바이스를 쓰는 인스턴스끼리 공유된다
 
     Args:
         rerank_model: 사용할 리랭크 모델 (기본: QWEN3_0_6B)
+        device: 실행 디바이스 (기본: None, 자동 선택, 양자화/ONNX 백엔드는 CPU 고정)
+        backend: 실행 백엔드 (기본: TORCH)
+        cache_dir: ONNX 변환 결과 저장 경로 (기본: None, ~/.cache/langgraph-blocks)
     """
 
     INSTRUCT = (
@@ -28,43 +65,373 @@ class LocalReranking:
     SUFFIX = "<|im_end|>\n<|im_start|>assistant\n<think>\n\n</think>\n\n"
 
     def __init__(
-        self, rerank_model: HuggingfaceRerankModel = HuggingfaceRerankModel.QWEN3_0_6B
+        self,
+        rerank_model: HuggingfaceRerankModel = HuggingfaceRerankModel.QWEN3_0_6B,
+        device: str | None = None,
+        backend: ModelBackend = ModelBackend.TORCH,
+        cache_dir: str | None = None,
     ):
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.tokenizer = AutoTokenizer.from_pretrained(
-            rerank_model,
-            padding_side="left",
-        )
-        self.model = (
-            AutoModelForCausalLM.from_pretrained(rerank_model).to(self.device).eval()
-        )
+        self.model_name = str(rerank_model)
+        self.backend = ModelBackend(backend)
+        self.device = backend_device(self.backend, resolve_device(device))
+        self.cache_dir = cache_dir
 
     @property
-    def tid_no(self):
+    def registry_key(self) -> tuple:
+        """모델 레지스트리 키 (종류, 모델, 디바이스, 백엔드)"""
+        return ("reranking", self.model_name, self.device, self.backend)
+
+    def _load(self):
+        from transformers import AutoTokenizer, AutoModelForCausalLM
+
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name, padding_side="left")
+        if self.backend == ModelBackend.ONNX:
+            path = onnx_model_path("reranking", self.model_name, self.cache_dir)
+            if not path.exists():
+                model = AutoModelForCausalLM.from_pretrained(
+                    self.model_name, attn_implementation="eager"
+                )
+                head = _YesNoLogits(
+                    model,
+                    tokenizer.convert_tokens_to_ids("no"),
+                    tokenizer.convert_tokens_to_ids("yes"),
+                )
+                sample = tokenizer(["yes", "no"], padding=True, return_tensors="pt")
+                export_onnx(
+                    head,
+                    {
+                        "input_ids": sample["input_ids"],
+                        "attention_mask": sample["attention_mask"],
+                    },
+                    path,
+                    output_names=["logits"],
+                )
+            return tokenizer, onnx_session(path)
+
+        model = AutoModelForCausalLM.from_pretrained(self.model_name)
+        if self.backend == ModelBackend.TORCH_INT8:
+            model = quantize_dynamic(model)
+        return tokenizer, model.to(self.device).eval()
+
+    @property
+    def tokenizer(self):
+        """토크나이저 (최초 접근 시 로드)"""
+        return model_registry.get_or_create(self.registry_key, self._load)[0]
+
+    @property
+    def model(self):
+        """리랭크 모델 (최초 접근 시 로드, ONNX 백엔드는 InferenceSession)"""
+        return model_registry.get_or_create(self.registry_key, self._load)[1]
+
+    @functools.cached_property
+    def tid_no(self) -> int:
         """'no' 토큰의 ID"""
         return self.tokenizer.convert_tokens_to_ids("no")
 
-    @property
-    def tid_yes(self):
+    @functools.cached_property
+    def tid_yes(self) -> int:
         """'yes' 토큰의 ID"""
         return self.tokenizer.convert_tokens_to_ids("yes")
 
-    @property
-    def prefix_ids(self):
+    @functools.cached_property
+    def pad_token_id(self) -> int:
+        """패딩 토큰의 ID"""
+        return self.tokenizer.pad_token_id or 0
+
+    @functools.cached_property
+    def prefix_ids(self) -> list[int]:
         """프롬프트 접두사 토큰 ID 리스트"""
         return self.tokenizer.encode(self.PREFIX, add_special_tokens=False)
 
-    @property
-    def suffix_ids(self):
+    @functools.cached_property
+    def suffix_ids(self) -> list[int]:
         """프롬프트 접미사 토큰 ID 리스트"""
         return self.tokenizer.encode(self.SUFFIX, add_special_tokens=False)
 
+    @functools.cached_property
+    def _prefix_tensor(self) -> torch.Tensor:
+        return torch.tensor(self.prefix_ids, dtype=torch.long)
+
+    @functools.cached_property
+    def _suffix_tensor(self) -> torch.Tensor:
+        return torch.tensor(self.suffix_ids, dtype=torch.long)
+
+    def _encode_pairs(self, query: str, docs: list[str]) -> list[list[int]]:
+        """
+        query/doc 쌍을 토큰 ID 리스트로 변환 (prefix/suffix는 배치 구성 시 삽입)
+
+        Args:
+            query: 검색 쿼리
+            docs: 문서 리스트
+
+        Returns:
+            문서별 토큰 ID 리스트
+        """
+        # Instruct/Query/Document 한 번에 문자열로 구성
+        pairs = [
+            f"<Instruct>: {self.INSTRUCT}\n<Query>: {query}\n<Document>: {d}"
+            for d in docs
+        ]
+        enc = self.tokenizer(
+            pairs,
+            padding=False,
+            truncation="longest_first",
+            return_attention_mask=False,
+            max_length=self.MAX_LEN - len(self.prefix_ids) - len(self.suffix_ids),
+        )
+        return enc["input_ids"]
+
+    def _score_ids(self, batch_ids: list[list[int]]) -> list[float]:
+        """
+        토큰 ID 배치의 P('yes') 계산
+        미리 할당한 텐서에 왼쪽 패딩 + prefix/본문/suffix를 직접 채운다
+
+        Args:
+            batch_ids: 문서별 토큰 ID 리스트 (prefix/suffix 제외)
+
+        Returns:
+            문서별 관련도 점수 리스트
+        """
+        batch = len(batch_ids)
+        n_prefix, n_suffix = len(self.prefix_ids), len(self.suffix_ids)
+        longest = n_prefix + max(len(ids) for ids in batch_ids) + n_suffix
+
+        input_ids = torch.full((batch, longest), self.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((batch, longest), dtype=torch.long)
+        for row, ids in enumerate(batch_ids):
+            start = longest - (n_prefix + len(ids) + n_suffix)
+            body_start = start + n_prefix
+            body_end = body_start + len(ids)
+            input_ids[row, start:body_start] = self._prefix_tensor
+            input_ids[row, body_start:body_end] = torch.tensor(ids, dtype=torch.long)
+            input_ids[row, body_end:] = self._suffix_tensor
+            attention_mask[row, start:] = 1
+
+        scores = self._yes_no_logits(input_ids, attention_mask)
+        return torch.softmax(scores, dim=1)[:, 1].tolist()
+
+    def _yes_no_logits(
+        self, input_ids: torch.Tensor, attention_mask: torch.Tensor
+    ) -> torch.Tensor:
+        """
+        마지막 토큰의 ('no', 'yes') 로짓 계산
+
+        Args:
+            input_ids: 왼쪽 패딩된 토큰 ID 텐서
+            attention_mask: 어텐션 마스크 텐서
+
+        Returns:
+            (batch, 2) 로짓 텐서
+        """
+        if self.backend == ModelBackend.ONNX:
+            (logits,) = self.model.run(
+                ["logits"],
+                {
+                    "input_ids": input_ids.numpy(),
+                    "attention_mask": attention_mask.numpy(),
+                },
+            )
+            return torch.from_numpy(logits)
+
+        with torch.no_grad():
+            outputs = self.model(
+                input_ids=input_ids.to(self.device),
+                attention_mask=attention_mask.to(self.device),
+            )
+            logits = outputs.logits[:, -1, :]  # 마지막 토큰 로짓
+            return torch.stack([logits[:, self.tid_no], logits[:, self.tid_yes]], dim=1)
+
+    def _encode_query_prefix(self, query: str) -> list[int]:
+        """
+        모든 문서가 공유하는 system/Instruct/Query 접두사 토큰 ID 리스트
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            접두사 토큰 ID 리스트
+        """
+        text = f"<Instruct>: {self.INSTRUCT}\n<Query>: {query}\n<Document>:"
+        return self.prefix_ids + self.tokenizer.encode(text, add_special_tokens=False)
+
+    def _encode_docs(self, docs: list[str], max_length: int) -> list[list[int]]:
+        """
+        문서만 토큰화 (접두사 KV 캐시 재사용 모드용, suffix는 배치 구성 시 삽입)
+
+        Args:
+            docs: 문서 리스트
+            max_length: 문서 최대 토큰 길이
+
+        Returns:
+            문서별 토큰 ID 리스트
+        """
+        # 접두사가 ":"로 끝나므로 공백은 문서 쪽 토큰에 붙인다
+        enc = self.tokenizer(
+            [f" {d}" for d in docs],
+            padding=False,
+            truncation=True,
+            add_special_tokens=False,
+            return_attention_mask=False,
+            max_length=max_length,
+        )
+        return enc["input_ids"]
+
+    def _prefix_cache(self, prefix_ids: list[int]):
+        """
+        공유 접두사를 한 번만 실행해 past_key_values 생성
+
+        Args:
+            prefix_ids: 접두사 토큰 ID 리스트
+
+        Returns:
+            접두사의 past_key_values
+        """
+        input_ids = torch.tensor([prefix_ids], device=self.device)
+        with torch.no_grad():
+            return self.model(input_ids=input_ids, use_cache=True).past_key_values
+
+    def _score_ids_with_prefix(
+        self, past_key_values, prefix_len: int, batch_ids: list[list[int]]
+    ) -> list[float]:
+        """
+        캐시된 접두사 뒤에 문서/suffix 토큰만 이어 붙여 P('yes') 계산
+        접두사 위치를 이어받기 위해 오른쪽 패딩을 사용하고 문서별 마지막 토큰 로짓을 읽는다
+
+        Args:
+            past_key_values: 접두사의 past_key_values
+            prefix_len: 접두사 토큰 길이
+            batch_ids: 문서별 토큰 ID 리스트 (접두사/suffix 제외)
+
+        Returns:
+            문서별 관련도 점수 리스트
+        """
+        batch = len(batch_ids)
+        n_suffix = len(self.suffix_ids)
+        lengths = torch.tensor([len(ids) + n_suffix for ids in batch_ids])
+        longest = int(lengths.max())
+
+        input_ids = torch.full((batch, longest), self.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((batch, prefix_len + longest), dtype=torch.long)
+        attention_mask[:, :prefix_len] = 1
+        for row, ids in enumerate(batch_ids):
+            input_ids[row, : len(ids)] = torch.tensor(ids, dtype=torch.long)
+            input_ids[row, len(ids) : len(ids) + n_suffix] = self._suffix_tensor
+            attention_mask[row, prefix_len : prefix_len + len(ids) + n_suffix] = 1
+        position_ids = torch.arange(prefix_len, prefix_len + longest).expand(
+            batch, longest
+        )
+
+        # 캐시는 forward 중에 갱신되므로 배치마다 복사 후 배치 크기만큼 확장
+        cache = copy.deepcopy(past_key_values)
+        cache.batch_repeat_interleave(batch)
+
+        with torch.no_grad():
+            logits = self.model(
+                input_ids=input_ids.to(self.device),
+                attention_mask=attention_mask.to(self.device),
+                position_ids=position_ids.to(self.device),
+                past_key_values=cache,
+                use_cache=True,
+            ).logits
+            logits = logits[torch.arange(batch), lengths.to(self.device) - 1]
+            scores = torch.stack(
+                [logits[:, self.tid_no], logits[:, self.tid_yes]], dim=1
+            )
+            return torch.softmax(scores, dim=1)[:, 1].tolist()
+
+    @staticmethod
+    def _plan_batches(
+        lengths: list[int],
+        batch_size: int,
+        max_batch_tokens: int | None = None,
+    ) -> list[list[int]]:
+        """
+        배치 구성 계획 수립
+        max_batch_tokens가 없으면 입력 순서대로 batch_size씩 자르고,
+        있으면 길이 내림차순으로 정렬한 뒤 (문서 수 x 최장 길이)가 예산을 넘지 않도록 묶는다
+
+        Args:
+            lengths: 문서별 토큰 길이
+            batch_size: 배치 크기
+            max_batch_tokens: 배치당 패딩 포함 토큰 예산 (Option)
+
+        Returns:
+            배치별 원본 인덱스 리스트
+        """
+        indices = list(range(len(lengths)))
+        if not max_batch_tokens:
+            return [
+                indices[i : i + batch_size] for i in range(0, len(indices), batch_size)
+            ]
+
+        indices.sort(key=lambda i: lengths[i], reverse=True)
+        batches, batch = [], []
+        for i in indices:
+            # 내림차순이므로 배치의 최장 길이는 첫 문서 길이
+            longest = lengths[batch[0]] if batch else lengths[i]
+            if batch and (len(batch) + 1) * longest > max_batch_tokens:
+                batches.append(batch)
+                batch = []
+            batch.append(i)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _iter_batch_scores(
+        self,
+        query: str,
+        docs: list[str],
+        batch_size: int = 16,
+        max_batch_tokens: int | None = None,
+        reuse_prefix: bool = False,
+    ) -> Iterator[tuple[list[int], list[float]]]:
+        """
+        배치 단위 스코어 계산 제너레이터
+
+        Args:
+            query: 검색 쿼리
+            docs: 문서 리스트
+            batch_size: 배치 크기
+            max_batch_tokens: 배치당 패딩 포함 토큰 예산 (Option)
+            reuse_prefix: 공유 접두사 KV 캐시 재사용 여부
+
+        Yields:
+            (배치의 원본 인덱스 리스트, 관련도 점수 리스트)
+        """
+        if not docs:
+            return
+
+        if reuse_prefix and self.backend == ModelBackend.ONNX:
+            raise ValueError("ONNX 백엔드는 reuse_prefix를 지원하지 않습니다")
+
+        if reuse_prefix:
+            prefix_ids = self._encode_query_prefix(query)
+            input_ids = self._encode_docs(
+                docs, self.MAX_LEN - len(prefix_ids) - len(self.suffix_ids)
+            )
+            score_fn = functools.partial(
+                self._score_ids_with_prefix,
+                self._prefix_cache(prefix_ids),
+                len(prefix_ids),
+            )
+            overhead = len(self.suffix_ids)
+        else:
+            input_ids = self._encode_pairs(query, docs)
+            score_fn = self._score_ids
+            overhead = len(self.prefix_ids) + len(self.suffix_ids)
+        lengths = [len(ids) + overhead for ids in input_ids]
+
+        for batch in self._plan_batches(lengths, batch_size, max_batch_tokens):
+            yield batch, score_fn([input_ids[i] for i in batch])
+
     def scores(
         self,
         query: str,
         docs: list[str],
         top_k: int | None = None,
         batch_size: int = 16,
+        max_batch_tokens: int | None = None,
+        reuse_prefix: bool = False,
     ):
         """
         리랭킹 스코어 계산
@@ -72,49 +439,115 @@ class LocalReranking:
         2. (doc, score) 리스트를 score 내림차순으로 반환
         3. top_k가 주어지면 상위 k개만 반환
 
+        max_batch_tokens를 지정하면 문서를 토큰 길이순으로 정렬해 토큰 예산 단위로 배치를 구성하므로
+        길이가 섞인 후보군에서 패딩 낭비가 줄어든다 (이 경우 batch_size는 사용하지 않음)
+        reuse_prefix를 켜면 system/Instruct/Query 접두사를 쿼리당 한 번만 실행해 KV 캐시로 재사용하고
+        문서별로는 문서와 suffix 토큰만 계산한다
+
         Args:
             query: 검색 쿼리
             docs: 문서 리스트
-            top_k: 상위 k개 결과만 반환 (기본: None, 전체 반환
+            top_k: 상위 k개 결과만 반환 (기본: None, 전체 반환)
             batch_size: 배치 크기 (기본: 16)
+            max_batch_tokens: 배치당 패딩 포함 토큰 예산 (기본: None, 문서 수 기준 배치)
+            reuse_prefix: 공유 접두사 KV 캐시 재사용 여부 (기본: False, ONNX 백엔드 미지원)
 
         Returns:
             list[tuple[str, float]]: (문서, 관련도 점수) 리스트
         """
-        results = []
-        for i in range(0, len(docs), batch_size):
-            chunk = docs[i : i + batch_size]
-            # Instruct/Query/Document 한 번에 문자열로 구성
-            pairs = [
-                f"<Instruct>: {self.INSTRUCT}\n<Query>: {query}\n<Document>: {d}"
-                for d in chunk
-            ]
-            enc = self.tokenizer(
-                pairs,
-                padding=False,
-                truncation="longest_first",
-                return_attention_mask=False,
-                max_length=self.MAX_LEN - len(self.prefix_ids) - len(self.suffix_ids),
-            )
-            # prefix/suffix 삽입
-            for j, ids in enumerate(enc["input_ids"]):
-                enc["input_ids"][j] = self.prefix_ids + ids + self.suffix_ids
+        probs = [0.0] * len(docs)
+        for batch, batch_probs in self._iter_batch_scores(
+            query, docs, batch_size, max_batch_tokens, reuse_prefix
+        ):
+            # 원래 순서로 점수 복원
+            for i, prob in zip(batch, batch_probs):
+                probs[i] = prob
 
-            # 배치 패딩 후 텐서화
-            enc = self.tokenizer.pad(
-                enc, padding=True, return_tensors="pt", max_length=self.MAX_LEN
-            )
-            for k in enc:
-                enc[k] = enc[k].to(self.device)
+        results = list(zip(docs, probs))
+        results.sort(key=lambda x: x[1], reverse=True)
+        return results[:top_k] if top_k else results
 
-            with torch.no_grad():
-                logits = self.model(**enc).logits[:, -1, :]  # 마지막 토큰 로짓
-                scores = torch.stack(
-                    [logits[:, self.tid_no], logits[:, self.tid_yes]], dim=1
-                )
-                probs_yes = torch.softmax(scores, dim=1)[:, 1].tolist()
+    def stream_scores(
+        self,
+        query: str,
+        docs: list[str],
+        batch_size: int = 16,
+        max_batch_tokens: int | None = None,
+        reuse_prefix: bool = False,
+    ) -> Iterator[list[tuple[str, float]]]:
+        """
+        리랭킹 스코어 스트리밍
+        배치가 끝날 때마다 해당 배치의 (doc, score) 리스트를 정렬 없이 반환
 
-            results.extend(zip(chunk, probs_yes))
+        Args:
+            query: 검색 쿼리
+            docs: 문서 리스트
+            batch_size: 배치 크기 (기본: 16)
+            max_batch_tokens: 배치당 패딩 포함 토큰 예산 (기본: None, 문서 수 기준 배치)
+            reuse_prefix: 공유 접두사 KV 캐시 재사용 여부 (기본: False)
 
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k] if top_k else results
+        Yields:
+            list[tuple[str, float]]: 배치의 (문서, 관련도 점수) 리스트
+        """
+        for batch, batch_probs in self._iter_batch_scores(
+            query, docs, batch_size, max_batch_tokens, reuse_prefix
+        ):
+            yield [(docs[i], prob) for i, prob in zip(batch, batch_probs)]
+
+    def top_k_scores(
+        self,
+        query: str,
+        docs: list[str],
+        top_k: int = 5,
+        batch_size: int = 16,
+        max_batch_tokens: int | None = None,
+        reuse_prefix: bool = False,
+        min_score: float | None = None,
+        stop_score: float | None = None,
+        time_budget: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        상위 k개 리랭킹 (스트리밍 + 조기 종료)
+        전체 결과를 모으지 않고 크기 top_k의 힙만 유지하며, 아래 조건 중 하나를 만족하면 남은 후보를 건너뛴다
+        - 힙이 가득 찼고 힙의 최저 점수가 stop_score 이상일 때
+        - 경과 시간이 time_budget(초)을 넘었을 때
+        후보가 1차 검색 점수 순으로 들어온다고 가정하므로 조기 종료를 쓸 때는 max_batch_tokens 없이 입력 순서대로 배치하는 편이 좋다
+
+        Args:
+            query: 검색 쿼리
+            docs: 문서 리스트 (1차 검색 순위순 권장)
+            top_k: 반환할 결과 수 (기본: 5, 1 미만이면 스코어 계산 없이 빈 리스트)
+            batch_size: 배치 크기 (기본: 16)
+            max_batch_tokens: 배치당 패딩 포함 토큰 예산 (기본: None, 문서 수 기준 배치)
+            reuse_prefix: 공유 접두사 KV 캐시 재사용 여부 (기본: False)
+            min_score: 이 점수 미만의 문서는 결과에서 제외 (Option)
+            stop_score: 상위 k개가 모두 이 점수 이상이면 종료 (Option)
+            time_budget: 스코어 계산 시간 예산(초) (Option)
+
+        Returns:
+            list[tuple[str, float]]: 점수 내림차순 (문서, 관련도 점수) 리스트
+        """
+        if top_k < 1:
+            return []
+        started = time.monotonic()
+        heap: list[tuple[float, int, str]] = []
+        for batch, batch_probs in self._iter_batch_scores(
+            query, docs, batch_size, max_batch_tokens, reuse_prefix
+        ):
+            for i, prob in zip(batch, batch_probs):
+                if min_score is not None and prob < min_score:
+                    continue
+                # 동점이면 앞선 문서를 우선하도록 인덱스를 음수로 저장
+                item = (prob, -i, docs[i])
+                if len(heap) < top_k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+            if stop_score is not None and len(heap) == top_k:
+                if heap[0][0] >= stop_score:
+                    break
+            if time_budget is not None and time.monotonic() - started >= time_budget:
+                break
+
+        return [(doc, prob) for prob, _, doc in sorted(heap, reverse=True)]
@@ -0,0 +1,6 @@
+from .bm25 import BM25SparseEmbedding, default_tokenizer
+
+__all__ = [
+    "BM25SparseEmbedding",
+    "default_tokenizer",
+]
@@ -0,0 +1,271 @@
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from scipy import sparse as sp
+
+_WORD_PATTERN = re.compile(r"\w+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]")
+
+
+def default_tokenizer(text: str) -> list[str]:
+    """
+    기본 토크나이저
+    소문자 단어 단위로 분리하고, 한글 단어는 조사/어미가 붙어도 매칭되도록 음절 bigram을 함께 생성한다
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        토큰 리스트
+    """
+    tokens = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        tokens.append(word)
+        if len(word) > 2 and _HANGUL_PATTERN.search(word):
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class BM25SparseEmbedding:
+    """
+    BM25 sparse 임베딩
+    문서 벡터는 tf 포화 가중치, 쿼리 벡터는 IDF 가중치로 만들어 두 벡터의 내적(IP)이 BM25 점수가 되며,
+    결과는 밀버스 SPARSE_FLOAT_VECTOR가 받는 {인덱스: 값} 딕셔너리 또는 CSR 행렬 형태로 반환한다
+
+    어휘/문서 빈도/평균 문서 길이는 fit/partial_fit으로 명시적으로 갱신하고 save/load로 보존한다
+    (bulk_ingest는 적재하는 문서로 partial_fit을 한 번씩 호출한다)
+    IDF는 쿼리 쪽에만 들어가므로 통계가 갱신되어도 이미 적재한 문서 벡터를 다시 만들 필요가 없다
+
+    Args:
+        k1: tf 포화 계수 (기본: 1.2)
+        b: 문서 길이 정규화 계수 (기본: 0.75)
+        tokenizer: 텍스트 -> 토큰 리스트 함수 (기본: default_tokenizer)
+        auto_update: embed_documents 호출 시 통계를 먼저 갱신할지 여부 (기본: False)
+            True면 같은 문서를 다시 임베딩(재적재/재시도)할 때마다 중복 집계되어 IDF가 왜곡된다
+    """
+
+    STATE_NAME = "bm25.json"
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        tokenizer: Callable[[str], list[str]] | None = None,
+        auto_update: bool = False,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.tokenizer = tokenizer or default_tokenizer
+        self.auto_update = auto_update
+        self.vocabulary: dict[str, int] = {}
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self.num_docs = 0
+        self.num_tokens = 0
+        self._lock = threading.Lock()
+
+    @property
+    def avgdl(self) -> float:
+        """평균 문서 길이(토큰 수)"""
+        return self.num_tokens / self.num_docs if self.num_docs else 1.0
+
+    def _term_counts(self, texts: list[str], grow: bool) -> sp.csr_matrix:
+        """
+        텍스트 배치를 (문서 수, 어휘 수) 단어 빈도 CSR 행렬로 변환
+
+        Args:
+            texts: 텍스트 리스트
+            grow: 처음 보는 토큰을 어휘에 추가할지 여부 (False면 무시)
+        """
+        indptr = [0]
+        indices = []
+        for text in texts:
+            for token in self.tokenizer(text):
+                index = self.vocabulary.get(token)
+                if index is None:
+                    if not grow:
+                        continue
+                    index = self.vocabulary[token] = len(self.vocabulary)
+                indices.append(index)
+            indptr.append(len(indices))
+        counts = sp.csr_matrix(
+            (
+                np.ones(len(indices), dtype=np.float32),
+                np.asarray(indices, dtype=np.int64),
+                np.asarray(indptr, dtype=np.int64),
+            ),
+            shape=(len(texts), len(self.vocabulary)),
+        )
+        counts.sum_duplicates()
+        return counts
+
+    def partial_fit(self, texts: list[str]) -> "BM25SparseEmbedding":
+        """
+        문서 배치로 어휘/문서 빈도/문서 길이 통계를 점진 갱신
+
+        Args:
+            texts: 새로 적재하는 문서 리스트
+
+        Returns:
+            self
+        """
+        with self._lock:
+            counts = self._term_counts(texts, grow=True)
+            doc_freq = np.bincount(counts.indices, minlength=len(self.vocabulary))
+            doc_freq[: len(self.doc_freq)] += self.doc_freq
+            self.doc_freq = doc_freq
+            self.num_docs += len(texts)
+            self.num_tokens += int(counts.sum())
+        return self
+
+    def fit(self, texts: list[str]) -> "BM25SparseEmbedding":
+        """통계를 초기화하고 문서 전체로 다시 학습"""
+        with self._lock:
+            self.vocabulary = {}
+            self.doc_freq = np.zeros(0, dtype=np.int64)
+            self.num_docs = 0
+            self.num_tokens = 0
+        return self.partial_fit(texts)
+
+    @property
+    def idf(self) -> np.ndarray:
+        """어휘별 IDF (BM25, 항상 0 이상)"""
+        return np.log1p(
+            (self.num_docs - self.doc_freq + 0.5) / (self.doc_freq + 0.5)
+        ).astype(np.float32)
+
+    def encode_documents(self, texts: list[str]) -> sp.csr_matrix:
+        """
+        문서 배치를 tf 포화 가중치 CSR 행렬로 변환
+        w(t, d) = tf * (k1 + 1) / (tf + k1 * (1 - b + b * |d| / avgdl))
+
+        Args:
+            texts: 문서 리스트
+
+        Returns:
+            (문서 수, 어휘 수) CSR 행렬
+        """
+        if self.auto_update:
+            self.partial_fit(texts)
+        with self._lock:
+            counts = self._term_counts(texts, grow=False)
+            avgdl = self.avgdl
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        norm = self.k1 * (1 - self.b + self.b * lengths / avgdl)
+        tf = counts.data
+        counts.data = (
+            tf * (self.k1 + 1) / (tf + np.repeat(norm, np.diff(counts.indptr)))
+        ).astype(np.float32)
+        return counts
+
+    def encode_queries(self, texts: list[str]) -> sp.csr_matrix:
+        """
+        쿼리 배치를 IDF 가중치 CSR 행렬로 변환 (쿼리 내 중복 토큰은 한 번만 반영, 처음 보는 토큰은 무시)
+
+        Args:
+            texts: 쿼리 리스트
+
+        Returns:
+            (쿼리 수, 어휘 수) CSR 행렬
+        """
+        with self._lock:
+            counts = self._term_counts(texts, grow=False)
+            idf = self.idf
+        counts.data = idf[counts.indices]
+        counts.eliminate_zeros()
+        return counts
+
+    @staticmethod
+    def to_dicts(matrix: sp.csr_matrix) -> list[dict[int, float]]:
+        """CSR 행렬을 행별 {인덱스: 값} 딕셔너리 리스트로 변환"""
+        indices, data, indptr = (
+            matrix.indices.tolist(),
+            matrix.data.tolist(),
+            matrix.indptr,
+        )
+        return [
+            dict(zip(indices[start:end], data[start:end]))
+            for start, end in zip(indptr[:-1], indptr[1:])
+        ]
+
+    def embed_documents(self, texts: list[str]) -> list[dict[int, float]]:
+        """
+        문서 sparse 임베딩 (auto_update면 통계를 먼저 갱신)
+
+        Args:
+            texts: 임베딩할 문서 리스트
+
+        Returns:
+            문서별 {어휘 인덱스: tf 포화 가중치} 딕셔너리 리스트
+        """
+        return self.to_dicts(self.encode_documents(texts))
+
+    def embed_query(self, text: str) -> dict[int, float]:
+        """
+        쿼리 sparse 임베딩 (처음 보는 토큰은 무시)
+
+        Args:
+            text: 임베딩할 쿼리
+
+        Returns:
+            {어휘 인덱스: IDF 가중치} 딕셔너리 (문서 딕셔너리와의 내적이 BM25 점수)
+        """
+        return self.to_dicts(self.encode_queries([text]))[0]
+
+    def save(self, directory: str) -> Path:
+        """
+        어휘와 통계를 디렉터리에 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            directory: 저장 경로 (없으면 생성)
+
+        Returns:
+            저장된 파일 경로
+        """
+        path = Path(directory) / self.STATE_NAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            state = {
+                "k1": self.k1,
+                "b": self.b,
+                "num_docs": self.num_docs,
+                "num_tokens": self.num_tokens,
+                "vocabulary": self.vocabulary,
+                "doc_freq": self.doc_freq.tolist(),
+            }
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(
+        cls,
+        directory: str,
+        tokenizer: Callable[[str], list[str]] | None = None,
+        auto_update: bool = False,
+    ) -> "BM25SparseEmbedding":
+        """
+        저장된 어휘와 통계 불러오기 (토크나이저는 저장하지 않으므로 학습 때와 같은 것을 전달)
+
+        Args:
+            directory: save로 저장한 경로
+            tokenizer: 토크나이저 (기본: default_tokenizer)
+            auto_update: embed_documents 호출 시 통계 갱신 여부 (기본: False, 중복 집계 주의)
+
+        Returns:
+            BM25SparseEmbedding
+        """
+        state = json.loads(
+            (Path(directory) / cls.STATE_NAME).read_text(encoding="utf-8")
+        )
+        embedding = cls(state["k1"], state["b"], tokenizer, auto_update)
+        embedding.vocabulary = state["vocabulary"]
+        embedding.doc_freq = np.asarray(state["doc_freq"], dtype=np.int64)
+        embedding.num_docs = state["num_docs"]
+        embedding.num_tokens = state["num_tokens"]
+        return embedding
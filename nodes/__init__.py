@@ -1,5 +1,8 @@
+from .cache import NodeCache, NodeCacheStats
 from .rewiter import QueryRewrite
 
 __all__ = [
+    "NodeCache",
+    "NodeCacheStats",
     "QueryRewrite",
 ]
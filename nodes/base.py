@@ -1,13 +1,67 @@
-class BaseNode:
+import abc
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ClassVar
+
+from langchain_core.runnables import RunnableLambda
+from langgraph.config import get_stream_writer
+
+from nodes.cache import NodeCache
+
+logger = logging.getLogger(__name__)
+
+
+def _stream_writer() -> Callable[[Any], None]:
+    """LangGraph custom 스트림 채널 writer (그래프 밖에서 호출되면 아무 것도 하지 않음)"""
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return lambda chunk: None
+
+
+class BaseNode(abc.ABC):
     """
     베이스 노드 클래스
+    하위 클래스는 build_messages/parse_response만 구현하면 동기(as_node), 비동기(aas_node),
+    배치(batch/abatch) 실행 경로를 모두 얻는다
 
     Args:
         chat_model: 챗 모델 인스턴스
+        max_concurrency: 배치 실행 시 동시 LLM 호출 수 상한 (기본: 8)
+        cache: LLM 응답 캐시 (Option, 정확 일치 + 의미 유사도 조회)
+        stream: 토큰 스트리밍 여부 (기본: False, True면 부분 출력을 stream_mode="custom"으로 내보냄)
+        on_prefix: 안정된 접두 출력이 나오면 한 번 호출할 함수 (prefix, state) -> 결과 (Option, 스트리밍 전용)
+        prefix_min_chars: on_prefix를 호출할 접두 출력의 최소 길이 (기본: 32)
     """
 
-    def __init__(self, chat_model):
+    DEFAULT_MAX_CONCURRENCY = 8
+    # on_prefix 결과({"prefix", "result"})를 담을 상태 키
+    SPECULATIVE_KEY = "speculative"
+    # 접두 출력이 안정되었다고 보는 경계 문자
+    PREFIX_BOUNDARIES = (".", "?", "!", "\n", "。")
+
+    # 동기 on_prefix 실행용 프로세스 단위 실행기
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+    _executor_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        chat_model,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: NodeCache | None = None,
+        stream: bool = False,
+        on_prefix: Callable[[str, Any], Any] | None = None,
+        prefix_min_chars: int = 32,
+    ):
         self.chat_model = chat_model
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.stream = stream
+        self.on_prefix = on_prefix
+        self.prefix_min_chars = prefix_min_chars
 
     def get_message(self, state, idx: int = -1):
         """특정 인덱스의 메시지 조회"""
@@ -20,3 +74,330 @@ class BaseNode:
         ):
             return messages[idx].content
         return ""
+
+    @abc.abstractmethod
+    def build_messages(self, state) -> list | None:
+        """
+        상태로부터 챗 모델 입력 메시지 생성
+
+        Args:
+            state: 현재 상태
+
+        Returns:
+            메시지 리스트 (None이면 모델을 호출하지 않고 empty_response 반환)
+        """
+
+    @abc.abstractmethod
+    def parse_response(self, response, state) -> dict:
+        """
+        챗 모델 응답을 상태 갱신 값으로 변환
+
+        Args:
+            response: 챗 모델 응답 메시지
+            state: 현재 상태
+
+        Returns:
+            상태 갱신 딕셔너리
+        """
+
+    def empty_response(self, state) -> dict:
+        """모델을 호출할 입력이 없을 때의 상태 갱신 값"""
+        return {}
+
+    def cache_text(self, messages: list, state) -> str | None:
+        """
+        의미 캐시 조회에 사용할 텍스트 (기본: 마지막 메시지 내용)
+        프롬프트 템플릿이 유사도를 지배하지 않도록 하위 클래스에서 원본 질문만 반환하도록 재정의할 수 있다
+        """
+        content = messages[-1].content if messages else None
+        return content if isinstance(content, str) else None
+
+    @property
+    def cache_namespace(self) -> str:
+        """캐시 네임스페이스 (노드 클래스 + 모델 이름)"""
+        model = getattr(self.chat_model, "model_name", None) or getattr(
+            self.chat_model, "model", type(self.chat_model).__name__
+        )
+        return f"{type(self).__name__}:{model}"
+
+    def stable_prefix(self, text: str) -> str | None:
+        """
+        스트리밍 중인 출력에서 더 이상 바뀌지 않을 접두 부분 (마지막 경계 문자까지)
+
+        Args:
+            text: 지금까지 생성된 출력
+
+        Returns:
+            prefix_min_chars 이상인 접두 문자열 (없으면 None)
+        """
+        if not isinstance(text, str):
+            return None
+        end = max(text.rfind(boundary) for boundary in self.PREFIX_BOUNDARIES) + 1
+        prefix = text[:end].strip()
+        return prefix if len(prefix) >= self.prefix_min_chars else None
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """동기 on_prefix용 공유 실행기 (최초 호출 시 생성)"""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=cls.DEFAULT_MAX_CONCURRENCY,
+                        thread_name_prefix="node-prefix",
+                    )
+        return cls._executor
+
+    def _emit(self, writer, response, delta: str) -> None:
+        if delta:
+            writer(
+                {"node": type(self).__name__, "delta": delta, "text": response.content}
+            )
+
+    def _stream_response(self, messages: list, state):
+        """
+        토큰 스트리밍 호출
+        청크마다 custom 스트림 채널로 부분 출력을 내보내고, 안정된 접두 출력이 나오면
+        on_prefix를 백그라운드에서 실행해 나머지 토큰 생성과 겹치게 한다
+
+        Returns:
+            (누적 응답 메시지, {"prefix", "result"} 또는 None)
+        """
+        writer = _stream_writer()
+        response = future = prefix = None
+        try:
+            for chunk in self.chat_model.stream(messages):
+                response = chunk if response is None else response + chunk
+                self._emit(writer, response, chunk.content)
+                if self.on_prefix is not None and future is None:
+                    prefix = self.stable_prefix(response.content)
+                    if prefix:
+                        future = self._get_executor().submit(
+                            self.on_prefix, prefix, state
+                        )
+        except BaseException:
+            if future is not None:
+                future.cancel()
+            raise
+        speculative = None
+        if future is not None:
+            try:
+                speculative = {"prefix": prefix, "result": future.result()}
+            except Exception:
+                # 추측 실행은 선택 작업이므로 실패해도 본 응답은 그대로 반환
+                logger.warning(
+                    "on_prefix 실행 실패 (추측 결과 없이 진행)", exc_info=True
+                )
+        return response, speculative
+
+    async def _arun_prefix(self, prefix: str, state):
+        if inspect.iscoroutinefunction(self.on_prefix):
+            return await self.on_prefix(prefix, state)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), self.on_prefix, prefix, state
+        )
+
+    async def _astream_response(self, messages: list, state):
+        """_stream_response의 비동기 버전 (on_prefix는 별도 태스크로 실행)"""
+        writer = _stream_writer()
+        response = task = prefix = None
+        try:
+            async for chunk in self.chat_model.astream(messages):
+                response = chunk if response is None else response + chunk
+                self._emit(writer, response, chunk.content)
+                if self.on_prefix is not None and task is None:
+                    prefix = self.stable_prefix(response.content)
+                    if prefix:
+                        task = asyncio.ensure_future(self._arun_prefix(prefix, state))
+        except BaseException:
+            if task is not None:
+                task.cancel()
+                # 취소된 태스크의 예외를 회수해 "never retrieved" 경고를 막는다
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            raise
+        speculative = None
+        if task is not None:
+            try:
+                speculative = {"prefix": prefix, "result": await task}
+            except Exception:
+                logger.warning(
+                    "on_prefix 실행 실패 (추측 결과 없이 진행)", exc_info=True
+                )
+        return response, speculative
+
+    def _check_model(self):
+        assert self.chat_model is not None, "Model is not set"
+
+    def _invoke(self, messages: list, state):
+        """
+        캐시를 거쳐 챗 모델 호출 (stream이면 스트리밍)
+
+        Returns:
+            (응답 메시지, on_prefix 결과 또는 None)
+        """
+        self._check_model()
+        probe = None
+        if self.cache is not None:
+            response, probe = self.cache.get(
+                self.cache_namespace, messages, self.cache_text(messages, state)
+            )
+            if response is not None:
+                if self.stream:
+                    self._emit(_stream_writer(), response, response.content)
+                return response, None
+        if self.stream:
+            response, speculative = self._stream_response(messages, state)
+        else:
+            response, speculative = self.chat_model.invoke(messages), None
+        if probe is not None:
+            self.cache.set(probe, response)
+        return response, speculative
+
+    async def _ainvoke(self, messages: list, state):
+        """_invoke의 비동기 버전"""
+        self._check_model()
+        probe = None
+        if self.cache is not None:
+            response, probe = await self.cache.aget(
+                self.cache_namespace, messages, self.cache_text(messages, state)
+            )
+            if response is not None:
+                if self.stream:
+                    self._emit(_stream_writer(), response, response.content)
+                return response, None
+        if self.stream:
+            response, speculative = await self._astream_response(messages, state)
+        else:
+            response, speculative = await self.chat_model.ainvoke(messages), None
+        if probe is not None:
+            self.cache.set(probe, response)
+        return response, speculative
+
+    def _to_update(self, response, speculative, state) -> dict:
+        update = self.parse_response(response, state)
+        if speculative is not None:
+            update[self.SPECULATIVE_KEY] = speculative
+        return update
+
+    def as_node(self, state):
+        """
+        동기 노드 실행
+
+        Args:
+            state: 현재 상태
+
+        Returns:
+            상태 갱신 딕셔너리
+        """
+        messages = self.build_messages(state)
+        if messages is None:
+            return self.empty_response(state)
+        return self._to_update(*self._invoke(messages, state), state)
+
+    async def aas_node(self, state):
+        """
+        비동기 노드 실행 (ainvoke 사용, 비동기 그래프에서 워커 스레드를 점유하지 않음)
+
+        Args:
+            state: 현재 상태
+
+        Returns:
+            상태 갱신 딕셔너리
+        """
+        messages = self.build_messages(state)
+        if messages is None:
+            return self.empty_response(state)
+        return self._to_update(*await self._ainvoke(messages, state), state)
+
+    def as_runnable(self) -> RunnableLambda:
+        """동기/비동기 실행 경로를 모두 가진 Runnable (그래프 실행 방식에 맞는 경로가 선택됨)"""
+        return RunnableLambda(
+            self.as_node, afunc=self.aas_node, name=type(self).__name__
+        )
+
+    def _split_batch(self, states: list) -> tuple[list, list, list[int]]:
+        """상태별 메시지를 만들고, 모델 호출이 필요한 항목의 위치를 분리"""
+        results = [None] * len(states)
+        inputs, positions = [], []
+        for i, state in enumerate(states):
+            messages = self.build_messages(state)
+            if messages is None:
+                results[i] = self.empty_response(state)
+            else:
+                inputs.append(messages)
+                positions.append(i)
+        return results, inputs, positions
+
+    def _merge_responses(
+        self, states, results, positions, probes, misses, responses
+    ) -> None:
+        """배치 응답을 결과 위치에 채우고 캐시에 저장"""
+        for j, response in zip(misses, responses):
+            i = positions[j]
+            if probes[j] is not None:
+                self.cache.set(probes[j], response)
+            results[i] = self.parse_response(response, states[i])
+
+    def _batch_config(self, max_concurrency: int | None) -> dict:
+        return {"max_concurrency": max_concurrency or self.max_concurrency}
+
+    def batch(self, states: list, max_concurrency: int | None = None) -> list[dict]:
+        """
+        여러 상태를 한 번의 batch 호출로 처리
+
+        Args:
+            states: 상태 리스트
+            max_concurrency: 동시 LLM 호출 수 상한 (기본: self.max_concurrency)
+
+        Returns:
+            상태별 갱신 딕셔너리 (입력 순서 유지)
+        """
+        results, inputs, positions = self._split_batch(states)
+        probes = [None] * len(inputs)
+        if self.cache is not None:
+            for j, (i, messages) in enumerate(zip(positions, inputs)):
+                response, probes[j] = self.cache.get(
+                    self.cache_namespace, messages, self.cache_text(messages, states[i])
+                )
+                if response is not None:
+                    results[i] = self.parse_response(response, states[i])
+        misses = [j for j, i in enumerate(positions) if results[i] is None]
+        if misses:
+            self._check_model()
+            responses = self.chat_model.batch(
+                [inputs[j] for j in misses], config=self._batch_config(max_concurrency)
+            )
+            self._merge_responses(states, results, positions, probes, misses, responses)
+        return results
+
+    async def abatch(
+        self, states: list, max_concurrency: int | None = None
+    ) -> list[dict]:
+        """
+        여러 상태를 한 번의 abatch 호출로 처리 (비동기)
+
+        Args:
+            states: 상태 리스트
+            max_concurrency: 동시 LLM 호출 수 상한 (기본: self.max_concurrency)
+
+        Returns:
+            상태별 갱신 딕셔너리 (입력 순서 유지)
+        """
+        results, inputs, positions = self._split_batch(states)
+        probes = [None] * len(inputs)
+        if self.cache is not None:
+            for j, (i, messages) in enumerate(zip(positions, inputs)):
+                response, probes[j] = await self.cache.aget(
+                    self.cache_namespace, messages, self.cache_text(messages, states[i])
+                )
+                if response is not None:
+                    results[i] = self.parse_response(response, states[i])
+        misses = [j for j, i in enumerate(positions) if results[i] is None]
+        if misses:
+            self._check_model()
+            responses = await self.chat_model.abatch(
+                [inputs[j] for j in misses], config=self._batch_config(max_concurrency)
+            )
+            self._merge_responses(states, results, positions, probes, misses, responses)
+        return results
@@ -0,0 +1,231 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import xxhash
+
+
+@dataclass
+class NodeCacheStats:
+    """노드 LLM 캐시 적중 통계"""
+
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.exact_hits + self.semantic_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 적중률"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    namespace: str
+    response: object
+    expires_at: float
+    slot: int | None
+
+
+@dataclass
+class CacheProbe:
+    """조회 결과를 저장할 때 재사용하는 키와 임베딩 벡터"""
+
+    namespace: str
+    key: str
+    vector: np.ndarray | None
+
+
+class NodeCache:
+    """
+    노드 LLM 호출 캐시
+    프롬프트 해시로 정확 일치를 먼저 찾고, 임베딩 모델이 주어지면 코사인 유사도가 임계값 이상인
+    이전 질문의 응답을 재사용한다 (최대 항목 수는 LRU, 만료는 TTL로 제한)
+
+    Args:
+        max_size: 최대 항목 수 (기본: 1024)
+        ttl: 항목 유지 시간(초) (기본: 3600)
+        embedding: 의미 검색용 임베딩 모델 (LocalEmbedding 등 embed_query 제공, Option)
+        similarity_threshold: 의미 일치로 판단할 최소 코사인 유사도 (기본: 0.95)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 3600,
+        embedding=None,
+        similarity_threshold: float = 0.95,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.embedding = embedding
+        self.similarity_threshold = similarity_threshold
+        self.stats = NodeCacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # 의미 검색용 벡터 행렬 (슬롯 단위, 첫 저장 시 차원에 맞춰 할당)
+        self._vectors: np.ndarray | None = None
+        self._slot_keys: list[str | None] = [None] * max_size
+        self._free_slots = list(range(max_size - 1, -1, -1))
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(namespace: str, messages: list) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            namespace: 노드/모델 네임스페이스
+            messages: 챗 모델 입력 메시지
+
+        Returns:
+            "네임스페이스:프롬프트 해시" 형태의 키
+        """
+        payload = json.dumps(
+            [[message.type, message.content] for message in messages],
+            ensure_ascii=False,
+            default=str,
+        )
+        return f"{namespace}:{xxhash.xxh3_128_hexdigest(payload.encode('utf-8'))}"
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _remove(self, key: str) -> None:
+        """항목과 의미 검색 슬롯 제거 (락 안에서 호출)"""
+        entry = self._entries.pop(key)
+        if entry.slot is not None:
+            self._slot_keys[entry.slot] = None
+            self._free_slots.append(entry.slot)
+
+    def _get_exact(self, key: str, now: float):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._remove(key)
+            self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _get_semantic(self, namespace: str, vector: np.ndarray, now: float):
+        """같은 네임스페이스에서 유사도가 가장 높은 항목 (임계값 미만이면 None)"""
+        if self._vectors is None:
+            return None
+        scores = self._vectors @ vector
+        for slot in np.argsort(-scores):
+            if scores[slot] < self.similarity_threshold:
+                return None
+            key = self._slot_keys[slot]
+            if key is None or self._entries[key].namespace != namespace:
+                continue
+            entry = self._get_exact(key, now)
+            if entry is not None:
+                return entry
+        return None
+
+    def _lookup(self, namespace: str, key: str, vector) -> tuple[object, CacheProbe]:
+        vector = None if vector is None else self._normalize(vector)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._get_exact(key, now)
+            if entry is not None:
+                self.stats.exact_hits += 1
+            elif vector is not None:
+                entry = self._get_semantic(namespace, vector, now)
+                if entry is not None:
+                    self.stats.semantic_hits += 1
+            if entry is None:
+                self.stats.misses += 1
+        response = None if entry is None else entry.response
+        return response, CacheProbe(namespace, key, vector)
+
+    def _needs_vector(self, key: str, text: str | None) -> bool:
+        """의미 검색용 임베딩이 필요한지 여부 (정확 일치면 임베딩을 계산하지 않는다)"""
+        if self.embedding is None or not text:
+            return False
+        with self._lock:
+            return self._get_exact(key, time.monotonic()) is None
+
+    def get(self, namespace: str, messages: list, text: str | None = None):
+        """
+        캐시 조회
+
+        Args:
+            namespace: 노드/모델 네임스페이스
+            messages: 챗 모델 입력 메시지
+            text: 의미 검색에 사용할 텍스트 (Option, 없으면 정확 일치만 조회)
+
+        Returns:
+            (캐시된 응답 또는 None, 저장 시 set에 전달할 CacheProbe)
+        """
+        key = self.key(namespace, messages)
+        vector = None
+        if self._needs_vector(key, text):
+            vector = self.embedding.embed_query(text)
+        return self._lookup(namespace, key, vector)
+
+    async def aget(self, namespace: str, messages: list, text: str | None = None):
+        """get의 비동기 버전 (임베딩은 aembed_query로 계산)"""
+        key = self.key(namespace, messages)
+        vector = None
+        if self._needs_vector(key, text):
+            vector = await self.embedding.aembed_query(text)
+        return self._lookup(namespace, key, vector)
+
+    def set(self, probe: CacheProbe, response) -> None:
+        """
+        응답 저장 (가득 차면 만료 항목, 그다음 가장 오래 사용하지 않은 항목부터 제거)
+
+        Args:
+            probe: get이 반환한 CacheProbe
+            response: 챗 모델 응답
+        """
+        if self.max_size <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if probe.key in self._entries:
+                self._remove(probe.key)
+            if len(self._entries) >= self.max_size:
+                for key in [k for k, e in self._entries.items() if e.expires_at <= now]:
+                    self._remove(key)
+                    self.stats.expirations += 1
+            while len(self._entries) >= self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+            slot = None
+            if probe.vector is not None:
+                if self._vectors is None:
+                    self._vectors = np.zeros(
+                        (self.max_size, len(probe.vector)), dtype=np.float32
+                    )
+                slot = self._free_slots.pop()
+                self._vectors[slot] = probe.vector
+                self._slot_keys[slot] = probe.key
+            self._entries[probe.key] = _Entry(
+                probe.namespace, response, now + self.ttl, slot
+            )
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -13,21 +13,20 @@ Here is the initial question:
 \n ------- \n
 Formulate an improved question:"""
 
-    def as_node(self, state):
-        """
-        쿼리 재작성 노드
-
-        Args:
-            state: 현재 상태
-
-        Returns:
-            재작성된 쿼리
-        """
+    def build_messages(self, state):
+        """첫 메시지로 재작성 프롬프트 생성 (첫 메시지가 없으면 None)"""
         first_message = self.get_message(state, idx=0)
         if not first_message:
-            return {"query": ""}
-        assert self.chat_model is not None, "Model is not set"
-        response = self.chat_model.invoke(
-            [HumanMessage(content=self.PROMPT % first_message)]
-        )
+            return None
+        return [HumanMessage(content=self.PROMPT % first_message)]
+
+    def cache_text(self, messages, state):
+        """의미 캐시는 프롬프트 템플릿을 제외한 원본 질문으로 조회"""
+        return self.get_message(state, idx=0)
+
+    def parse_response(self, response, state):
+        """재작성된 쿼리"""
         return {"rewritten_query": response.content}
+
+    def empty_response(self, state):
+        return {"query": ""}
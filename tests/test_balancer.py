@@ -0,0 +1,132 @@
+import asyncio
+
+import httpx
+import pytest
+
+from core.utils import EndpointPool
+from core.utils.balancer import AsyncBalancedTransport, BalancedTransport
+from models.chat_models import local
+
+URLS = ["http://a.test", "http://b.test"]
+
+
+def _outstanding(pool: EndpointPool) -> list[int]:
+    return [endpoint["outstanding"] for endpoint in pool.snapshot()]
+
+
+def test_retries_unavailable_endpoint_on_another():
+    pool = EndpointPool(URLS)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = 503 if request.url.host == "a.test" else 200
+        return httpx.Response(status, text=request.url.host)
+
+    with httpx.Client(
+        transport=BalancedTransport(pool, httpx.MockTransport(handler))
+    ) as client:
+        responses = [client.get(f"{URLS[0]}/x") for _ in range(4)]
+
+    assert {response.text for response in responses} == {"b.test"}
+    assert _outstanding(pool) == [0, 0]
+
+
+def test_endpoint_is_ejected_after_repeated_failures():
+    pool = EndpointPool(URLS, max_failures=2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "a.test":
+            raise httpx.ConnectError("down", request=request)
+        return httpx.Response(200)
+
+    with httpx.Client(
+        transport=BalancedTransport(pool, httpx.MockTransport(handler))
+    ) as client:
+        for _ in range(6):
+            assert client.get(f"{URLS[0]}/x").status_code == 200
+
+    assert [endpoint["ejected"] for endpoint in pool.snapshot()] == [True, False]
+
+
+def test_unexpected_error_releases_endpoint():
+    pool = EndpointPool(URLS)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("boom")
+
+    with httpx.Client(
+        transport=BalancedTransport(pool, httpx.MockTransport(handler))
+    ) as client:
+        with pytest.raises(RuntimeError):
+            client.get(f"{URLS[0]}/x")
+
+    assert _outstanding(pool) == [0, 0]
+    assert [endpoint["errors"] for endpoint in pool.snapshot()] == [0, 0]
+
+
+def test_cancelled_async_request_releases_endpoint():
+    pool = EndpointPool(URLS)
+    started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    async def run():
+        transport = AsyncBalancedTransport(pool, httpx.MockTransport(handler))
+        async with httpx.AsyncClient(transport=transport) as client:
+            task = asyncio.create_task(client.get(f"{URLS[0]}/x"))
+            await started.wait()
+            assert sum(_outstanding(pool)) == 1
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(run())
+    assert _outstanding(pool) == [0, 0]
+    assert [endpoint["errors"] for endpoint in pool.snapshot()] == [0, 0]
+
+
+def test_streamed_response_releases_endpoint_on_close():
+    pool = EndpointPool(URLS)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"x" * 100)
+
+    with httpx.Client(
+        transport=BalancedTransport(pool, httpx.MockTransport(handler))
+    ) as client:
+        with client.stream("GET", f"{URLS[0]}/x") as response:
+            assert sum(_outstanding(pool)) == 1
+            next(response.iter_bytes())
+    assert _outstanding(pool) == [0, 0]
+
+
+def test_chat_local_with_endpoints_does_not_create_single_client(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("단일 엔드포인트 클라이언트를 만들면 안 됩니다")
+
+    monkeypatch.setattr(local, "get_http_client", fail)
+    monkeypatch.setattr(local, "get_async_http_client", fail)
+    model = local.ChatLocal(endpoints=["http://a:1/v1", "http://b:2/v1"])
+    assert model.openai_api_base == "http://a:1/v1"
+
+
+@pytest.mark.parametrize(
+    "base_url", ["http://Host-A.test:80/v1", "http://host-a.test/v1/"]
+)
+def test_requests_are_routed_despite_url_normalization(base_url):
+    pool = EndpointPool([base_url, "http://b.test:8080/api/v1"])
+    pool.endpoints[0].ejected_until = float("inf")
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200)
+
+    with httpx.Client(
+        transport=BalancedTransport(pool, httpx.MockTransport(handler))
+    ) as client:
+        client.get(f"{base_url.rstrip('/')}/chat/completions", params={"q": "1"})
+
+    assert seen == ["http://b.test:8080/api/v1/chat/completions?q=1"]
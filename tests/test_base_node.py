@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from nodes.base import BaseNode
+
+ANSWER = "First sentence. Second part"
+
+
+class EchoNode(BaseNode):
+    def build_messages(self, state):
+        return [HumanMessage(state["question"])] if state.get("question") else None
+
+    def parse_response(self, response, state):
+        return {"answer": response.content}
+
+    def empty_response(self, state):
+        return {"answer": ""}
+
+
+def _model(text: str = ANSWER) -> GenericFakeChatModel:
+    return GenericFakeChatModel(messages=iter([AIMessage(text)]))
+
+
+def _node(on_prefix, model=None) -> EchoNode:
+    return EchoNode(
+        model or _model(), stream=True, on_prefix=on_prefix, prefix_min_chars=5
+    )
+
+
+def test_subclass_without_parse_response_cannot_be_created():
+    class IncompleteNode(BaseNode):
+        def build_messages(self, state):
+            return None
+
+    with pytest.raises(TypeError, match="parse_response"):
+        IncompleteNode(_model())
+
+
+def test_empty_input_skips_model():
+    assert EchoNode(_model()).as_node({}) == {"answer": ""}
+
+
+def test_speculative_result_is_attached():
+    node = _node(lambda prefix, state: prefix.upper())
+    update = node.as_node({"question": "q"})
+    assert update["answer"] == ANSWER
+    assert update[BaseNode.SPECULATIVE_KEY] == {
+        "prefix": "First sentence.",
+        "result": "FIRST SENTENCE.",
+    }
+
+
+def test_failing_on_prefix_does_not_fail_node(caplog):
+    def on_prefix(prefix, state):
+        raise RuntimeError("retrieval down")
+
+    update = _node(on_prefix).as_node({"question": "q"})
+    assert update == {"answer": ANSWER}
+    assert "on_prefix" in caplog.text
+
+
+def test_failing_async_on_prefix_does_not_fail_node():
+    async def on_prefix(prefix, state):
+        raise RuntimeError("retrieval down")
+
+    update = asyncio.run(_node(on_prefix).aas_node({"question": "q"}))
+    assert update == {"answer": ANSWER}
+
+
+def test_async_stream_failure_cancels_prefix_task():
+    cancelled = asyncio.Event()
+
+    async def on_prefix(prefix, state):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    class BrokenModel(GenericFakeChatModel):
+        async def _astream(self, *args, **kwargs):
+            async for chunk in super()._astream(*args, **kwargs):
+                yield chunk
+                if "." in chunk.message.content:
+                    await asyncio.sleep(0)
+                    raise ConnectionError("stream dropped")
+
+    async def run():
+        node = _node(on_prefix, BrokenModel(messages=iter([AIMessage(ANSWER)])))
+        with pytest.raises(ConnectionError):
+            await node.aas_node({"question": "q"})
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    asyncio.run(run())
@@ -0,0 +1,30 @@
+import math
+
+from models.sparse_models import BM25SparseEmbedding
+
+
+def test_embeddings_are_index_weight_dicts_scoring_bm25():
+    corpus = ["apple banana", "banana cherry cherry"]
+    bm25 = BM25SparseEmbedding().fit(corpus)
+    documents = bm25.embed_documents(corpus)
+    query = bm25.embed_query("cherry unknown")
+
+    assert all(isinstance(document, dict) for document in documents)
+    assert list(query) == [bm25.vocabulary["cherry"]]
+    scores = [
+        sum(weight * document.get(index, 0.0) for index, weight in query.items())
+        for document in documents
+    ]
+    # BM25(cherry, d2) = idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * |d| / avgdl))
+    idf = math.log(1 + (2 - 1 + 0.5) / (1 + 0.5))
+    tf_weight = 2 * 2.2 / (2 + 1.2 * (1 - 0.75 + 0.75 * 3 / 2.5))
+    assert scores[0] == 0.0
+    assert math.isclose(scores[1], idf * tf_weight, rel_tol=1e-5)
+
+
+def test_embedding_documents_does_not_update_statistics_by_default():
+    bm25 = BM25SparseEmbedding().fit(["apple banana"])
+    first = bm25.embed_query("apple")
+    bm25.embed_documents(["apple banana"] * 3)
+    assert bm25.num_docs == 1
+    assert bm25.embed_query("apple") == first
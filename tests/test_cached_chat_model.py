@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from models.chat_models import CachedChatModel, ChatLocal
+
+
+class SlowChatModel(BaseChatModel):
+    """호출 수를 세고 delay만큼 늦게 응답하는 테스트용 모델"""
+
+    delay: float = 0.2
+    temperature: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage("ok"))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage("ok"))])
+
+
+def test_concurrent_requests_are_coalesced():
+    inner = SlowChatModel()
+    model = CachedChatModel(model=inner)
+
+    async def run():
+        return await asyncio.gather(*[model.ainvoke("hi") for _ in range(5)])
+
+    results = asyncio.run(run())
+    assert [r.content for r in results] == ["ok"] * 5
+    assert inner.calls == 1
+    assert model.stats.coalesced == 4
+
+
+def test_deterministic_response_is_cached():
+    inner = SlowChatModel(delay=0)
+    model = CachedChatModel(model=inner)
+    model.invoke("hi")
+    model.invoke("hi")
+    assert inner.calls == 1
+    assert model.stats.hits == 1
+
+
+def test_cancelled_leader_does_not_fail_follower():
+    inner = SlowChatModel()
+    model = CachedChatModel(model=inner)
+
+    async def run():
+        leader = asyncio.create_task(model.ainvoke("hi"))
+        await asyncio.sleep(0.05)
+        follower = asyncio.create_task(model.ainvoke("hi"))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()).content == "ok"
+    assert inner.calls == 2
+    assert not model._inflight
+
+
+def test_cancelled_follower_does_not_cancel_leader():
+    inner = SlowChatModel()
+    model = CachedChatModel(model=inner)
+
+    async def run():
+        leader = asyncio.create_task(model.ainvoke("hi"))
+        await asyncio.sleep(0.05)
+        follower = asyncio.create_task(model.ainvoke("hi"))
+        await asyncio.sleep(0.05)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(run()).content == "ok"
+    assert inner.calls == 1
+
+
+def test_leader_error_reaches_sync_followers():
+    class FailingChatModel(SlowChatModel):
+        def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+            self.calls += 1
+            time.sleep(self.delay)
+            raise ValueError("upstream")
+
+    model = CachedChatModel(model=FailingChatModel())
+    errors = []
+
+    def call():
+        try:
+            model.invoke("hi")
+        except ValueError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 3
+    assert model.model.calls == 1
+
+
+def test_cache_key_includes_endpoint():
+    first = CachedChatModel(model=ChatLocal(base_url="http://127.0.0.1:1/v1"))
+    second = CachedChatModel(model=ChatLocal(base_url="http://127.0.0.1:2/v1"))
+    messages = [AIMessage("hi")]
+    assert first._key(messages, None, {}) != second._key(messages, None, {})
+
+
+def test_disk_cache_entries_expire(tmp_path):
+    inner = SlowChatModel(delay=0)
+    model = CachedChatModel(
+        model=inner, disk_cache=True, disk_cache_dir=str(tmp_path), disk_cache_ttl=0.1
+    )
+    model.invoke("hi")
+    reopened = CachedChatModel(
+        model=inner, disk_cache=True, disk_cache_dir=str(tmp_path)
+    )
+    reopened.invoke("hi")
+    assert (inner.calls, reopened.stats.disk_hits) == (1, 1)
+    time.sleep(0.2)
+    CachedChatModel(model=inner, disk_cache=True, disk_cache_dir=str(tmp_path)).invoke(
+        "hi"
+    )
+    assert inner.calls == 2
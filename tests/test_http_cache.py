@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from tools import HttpCache, ahttp_get, http_get, set_http_cache
+
+requests = Counter()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        requests[path] += 1
+        headers = {"date": formatdate(usegmt=True)}
+        body = f"{path} {requests[path]}"
+        status = 200
+        if path == "/fresh":
+            headers["cache-control"] = "max-age=60"
+        elif path == "/etag":
+            headers["cache-control"] = "no-cache"
+            headers["etag"] = '"v1"'
+            if self.headers.get("if-none-match") == '"v1"':
+                status, body = 304, ""
+                headers["x-revalidated"] = str(requests[path])
+        elif path == "/last-modified":
+            headers["last-modified"] = formatdate(time.time() - 10 * 86400, usegmt=True)
+        elif path == "/no-store":
+            headers["cache-control"] = "no-store, max-age=60"
+        elif path == "/vary":
+            headers["cache-control"] = "max-age=60"
+            headers["vary"] = "Accept-Language"
+            body = f"{self.headers.get('accept-language')} {requests[path]}"
+        data = body.encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def cache():
+    requests.clear()
+    cache = HttpCache()
+    previous = set_http_cache(cache)
+    yield cache
+    set_http_cache(previous)
+
+
+def get(url: str, **headers) -> dict:
+    return http_get.invoke({"url": url, "headers": headers or None})
+
+
+def test_fresh_response_is_served_without_request(base_url, cache):
+    first = get(f"{base_url}/fresh")
+    second = get(f"{base_url}/fresh")
+    assert second == first
+    assert requests["/fresh"] == 1
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (1, 1, 1)
+
+
+def test_request_no_cache_bypasses_fresh_entry(base_url, cache):
+    get(f"{base_url}/fresh")
+    result = get(f"{base_url}/fresh", **{"cache-control": "no-cache"})
+    assert result["body"] == "/fresh 2"
+    assert requests["/fresh"] == 2
+
+
+def test_etag_revalidation_reuses_body_and_merges_headers(base_url, cache):
+    first = get(f"{base_url}/etag")
+    second = get(f"{base_url}/etag")
+    assert requests["/etag"] == 2
+    assert second["status_code"] == 200
+    assert second["body"] == first["body"] == "/etag 1"
+    assert second["headers"]["x-revalidated"] == "2"
+    assert second["headers"]["content-length"] == first["headers"]["content-length"]
+    assert cache.stats.revalidated == 1
+    assert cache.stats.bytes_saved == len("/etag 1")
+
+
+def test_last_modified_heuristic_freshness(base_url, cache):
+    get(f"{base_url}/last-modified")
+    assert get(f"{base_url}/last-modified")["body"] == "/last-modified 1"
+    assert requests["/last-modified"] == 1
+    entry = cache.lookup(f"{base_url}/last-modified", httpx.Headers())
+    assert 0 < entry.freshness_lifetime() <= 86400
+
+
+def test_no_store_response_is_not_stored(base_url, cache):
+    get(f"{base_url}/no-store")
+    assert get(f"{base_url}/no-store")["body"] == "/no-store 2"
+    assert cache.stats.stores == 0
+
+
+def test_vary_matches_request_headers(base_url, cache):
+    ko = get(f"{base_url}/vary", **{"accept-language": "ko"})
+    assert get(f"{base_url}/vary", **{"accept-language": "ko"}) == ko
+    en = get(f"{base_url}/vary", **{"accept-language": "en"})
+    assert en["body"] == "en 2"
+    assert requests["/vary"] == 2
+
+
+def test_async_tool_shares_cache(base_url, cache):
+    first = get(f"{base_url}/fresh")
+    second = asyncio.run(ahttp_get.ainvoke({"url": f"{base_url}/fresh"}))
+    assert second == first
+    assert requests["/fresh"] == 1
+
+
+def test_disk_cache_survives_new_instance(base_url, cache, tmp_path):
+    disk = HttpCache(disk=True, directory=str(tmp_path))
+    set_http_cache(disk)
+    first = get(f"{base_url}/fresh")
+    disk.close()
+    reopened = HttpCache(disk=True, directory=str(tmp_path))
+    set_http_cache(reopened)
+    try:
+        assert get(f"{base_url}/fresh") == first
+        assert requests["/fresh"] == 1
+        assert reopened.stats.hits == 1
+    finally:
+        reopened.close()
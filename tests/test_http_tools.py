@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tools import ahttp_get, ahttp_get_many, http_get, http_get_many, set_http_cache
+from tools.http import MAX_BODY_CHARS
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/slow"):
+            time.sleep(2)
+        if self.path.startswith("/missing"):
+            body = b""
+            self.send_response(404)
+        elif self.path.startswith("/big"):
+            body = b"x" * 1_000_000
+            self.send_response(200)
+        else:
+            body = self.path.encode()
+            self.send_response(200)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def no_cache():
+    previous = set_http_cache(None)
+    yield
+    set_http_cache(previous)
+
+
+def test_http_get_caps_body(base_url):
+    result = http_get.invoke({"url": f"{base_url}/big"})
+    assert len(result["body"]) == MAX_BODY_CHARS
+    assert result["truncated"] is True
+    assert http_get.invoke({"url": f"{base_url}/a"})["truncated"] is False
+
+
+def test_ahttp_get_works_across_event_loops(base_url):
+    for _ in range(2):
+        result = asyncio.run(ahttp_get.ainvoke({"url": f"{base_url}/a"}))
+        assert result["body"] == "/a"
+
+
+def test_ahttp_get_many_works_across_event_loops(base_url):
+    urls = [f"{base_url}/{i}" for i in range(3)]
+    for _ in range(2):
+        results = asyncio.run(ahttp_get_many.ainvoke({"urls": urls}))
+        assert [result.get("body") for result in results] == ["/0", "/1", "/2"]
+
+
+@pytest.mark.parametrize("many", [http_get_many, ahttp_get_many])
+def test_get_many_reports_errors_and_deadline(base_url, many):
+    payload = {
+        "urls": [f"{base_url}/ok", f"{base_url}/missing", f"{base_url}/slow"],
+        "deadline": 1,
+    }
+    if many is ahttp_get_many:
+        results = asyncio.run(many.ainvoke(payload))
+    else:
+        results = many.invoke(payload)
+    assert [result["url"] for result in results] == payload["urls"]
+    assert results[0]["body"] == "/ok"
+    assert results[1]["status_code"] == 404 and "error" in results[1]
+    assert "error" in results[2]
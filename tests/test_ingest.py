@@ -0,0 +1,105 @@
+import pytest
+from pymilvus import DataType, FieldSchema
+
+from core.databases.ingest import IngestPolicy, bulk_ingest
+from core.databases.schema import MilvusCollectionSpec
+from models.sparse_models import BM25SparseEmbedding
+
+
+class FakeCollection:
+    def flush(self):
+        pass
+
+
+class FakeMilvus:
+    text_max_length = 64
+
+    def __init__(self):
+        self.collection = FakeCollection()
+        self.rows = []
+
+    def insert(self, texts, dense_vectors, sparse_vectors, metadata=None):
+        metadata = metadata or [{} for _ in texts]
+        for text, dense, sparse, fields in zip(
+            texts, dense_vectors, sparse_vectors, metadata
+        ):
+            self.rows.append({"text": text, "dense": dense, "sparse": sparse, **fields})
+
+
+class FakeEmbedding:
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+def _ingest(texts, **kwargs):
+    milvus = FakeMilvus()
+    policy = IngestPolicy(chunk_size=16, insert_batch_size=3, embed_batch_size=2)
+    stats = bulk_ingest(
+        milvus, texts, FakeEmbedding(), FakeEmbedding(), policy, **kwargs
+    )
+    return milvus, stats
+
+
+def test_plain_texts_are_chunked_and_inserted():
+    milvus, stats = _ingest(["alpha beta gamma delta epsilon", "zeta"])
+    assert stats.texts == 2
+    assert stats.inserted == stats.chunks == len(milvus.rows)
+    assert all(set(row) == {"text", "dense", "sparse"} for row in milvus.rows)
+    assert milvus.rows[-1]["text"] == "zeta"
+
+
+def test_parallel_metadata_is_inherited_by_chunks():
+    milvus, _ = _ingest(
+        ["alpha beta gamma delta epsilon", "zeta"],
+        metadata=[{"source": "a", "tenant": 1}, {"source": "b", "tenant": 2}],
+    )
+    assert len(milvus.rows) > 2
+    assert [row["source"] for row in milvus.rows[:-1]] == ["a"] * (len(milvus.rows) - 1)
+    assert milvus.rows[-1] == {
+        "text": "zeta",
+        "dense": [4.0],
+        "sparse": [4.0],
+        "source": "b",
+        "tenant": 2,
+    }
+
+
+def test_text_metadata_pairs_are_accepted():
+    milvus, _ = _ingest([("one", {"source": "x"}), ("two", {"source": "y"})])
+    assert [(row["text"], row["source"]) for row in milvus.rows] == [
+        ("one", "x"),
+        ("two", "y"),
+    ]
+
+
+def test_metadata_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        _ingest(["one", "two"], metadata=[{"source": "x"}])
+
+
+def test_ingest_fits_bm25_once_per_chunk():
+    milvus = FakeMilvus()
+    bm25 = BM25SparseEmbedding()
+    stats = bulk_ingest(
+        milvus, ["apple banana", "banana cherry"], FakeEmbedding(), bm25
+    )
+    assert bm25.num_docs == stats.chunks == 2
+    assert all(row["sparse"] for row in milvus.rows)
+
+
+def test_missing_required_metadata_raises_before_insert():
+    milvus = FakeMilvus()
+    milvus.spec = MilvusCollectionSpec(
+        extra_fields=[
+            FieldSchema("tenant", DataType.INT64),
+            FieldSchema("source", DataType.VARCHAR, max_length=8, nullable=True),
+        ]
+    )
+    texts = [("one", {"tenant": 1}), ("two", {"source": "x"})]
+    with pytest.raises(ValueError, match="1번째 텍스트.*tenant"):
+        bulk_ingest(milvus, texts, FakeEmbedding(), FakeEmbedding())
+    assert milvus.rows == []
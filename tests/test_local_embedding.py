@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from models.embedding_models import EmbeddingCache, LocalEmbedding
+
+
+class FakeEncoder:
+    """model_kwargs의 truncate_dim만큼 잘린 벡터를 돌려주는 인코더"""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.calls = []
+
+        self.kwargs = []
+        self.pools = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        self.kwargs.append(kwargs)
+        return np.ones((len(texts), self.dim), dtype=np.float32)
+
+    def start_multi_process_pool(self):
+        self.pools.append("started")
+        return "pool"
+
+    def stop_multi_process_pool(self, pool):
+        self.pools.append(f"stopped {pool}")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path)
+    yield cache
+    cache.close()
+
+
+def _embedding(cache, monkeypatch, options=None, **model_kwargs) -> LocalEmbedding:
+    embedding = LocalEmbedding(
+        model_kwargs=model_kwargs or None, cache=cache, **(options or {})
+    )
+    encoder = FakeEncoder(model_kwargs.get("truncate_dim", 8))
+    monkeypatch.setattr(LocalEmbedding, "client", property(lambda self: self.encoder))
+    embedding.encoder = encoder
+    return embedding
+
+
+def test_cache_is_reused_for_same_options(cache, monkeypatch):
+    first = _embedding(cache, monkeypatch)
+    second = _embedding(cache, monkeypatch)
+    first.embed_documents(["a", "b", "a"])
+    second.embed_documents(["a", "b"])
+    assert first.encoder.calls == [["a", "b"]]
+    assert second.encoder.calls == []
+
+
+def test_cache_namespace_includes_model_kwargs(cache, monkeypatch):
+    full = _embedding(cache, monkeypatch)
+    truncated = _embedding(cache, monkeypatch, truncate_dim=4)
+    assert len(full.embed_query("a")) == 8
+    assert len(truncated.embed_query("a")) == 4
+    assert full._cache_namespace({}) != truncated._cache_namespace({})
+    assert truncated._cache_namespace({}) == _embedding(
+        cache, monkeypatch, truncate_dim=4
+    )._cache_namespace({})
+
+
+def test_huggingface_options_are_forwarded(cache, monkeypatch):
+    embedding = _embedding(
+        cache,
+        monkeypatch,
+        options={"multi_process": True, "show_progress": True},
+    )
+    embedding.embed_documents(["a"])
+    assert embedding.encoder.kwargs == [{"show_progress_bar": True, "pool": "pool"}]
+    assert embedding.encoder.pools == ["started", "stopped pool"]
+
+
+def test_model_kwargs_device_is_used_as_device():
+    embedding = LocalEmbedding(model_kwargs={"device": "cpu", "truncate_dim": 4})
+    assert embedding.device == "cpu"
+    assert embedding.model_kwargs == {"truncate_dim": 4}
@@ -0,0 +1,90 @@
+import pytest
+from pymilvus import DataType, FieldSchema
+
+from core.databases import Milvus
+from core.databases.pool import disconnect
+from models.sparse_models import BM25SparseEmbedding
+from core.databases.schema import MilvusCollectionSpec, MilvusIndexSpec, MilvusIndexType
+
+
+@pytest.fixture
+def uri(tmp_path):
+    uri = str(tmp_path / "milvus.db")
+    yield uri
+    disconnect(uri)
+
+
+def _create(uri: str) -> None:
+    Milvus(
+        uri,
+        "docs",
+        MilvusCollectionSpec(dim=4, dense_index=MilvusIndexSpec.ivf(nlist=8)),
+    )
+
+
+def test_existing_collection_syncs_spec_copy(uri):
+    _create(uri)
+    spec = MilvusCollectionSpec(dim=8, dense_index=MilvusIndexSpec(metric_type="L2"))
+    milvus = Milvus(uri, "docs", spec)
+
+    assert (spec.dim, spec.dense_index.metric_type) == (8, "L2")
+    assert milvus.spec is not spec
+    assert milvus.spec.dim == 4
+    assert milvus.spec.dense_index == MilvusIndexSpec(
+        MilvusIndexType.IVF_FLAT, "IP", {"nlist": 8}
+    )
+    assert milvus.spec.dense_index.search_param()["metric_type"] == "IP"
+
+
+def test_same_index_type_keeps_requested_search_params(uri):
+    _create(uri)
+    milvus = Milvus(
+        uri,
+        "docs",
+        MilvusCollectionSpec(dim=4, dense_index=MilvusIndexSpec.ivf(nlist=8, nprobe=4)),
+    )
+    assert milvus.spec.dense_index.search_params == {"nprobe": 4}
+
+
+def test_pooled_instance_warns_on_conflicting_spec(uri, caplog):
+    _create(uri)
+    with caplog.at_level("WARNING", logger="core.databases.milvus"):
+        Milvus(
+            uri,
+            "docs",
+            MilvusCollectionSpec(dim=4, dense_index=MilvusIndexSpec.ivf(nlist=8)),
+        )
+    assert not caplog.records
+
+    with caplog.at_level("WARNING", logger="core.databases.milvus"):
+        Milvus(
+            uri,
+            "docs",
+            MilvusCollectionSpec(dim=8, dense_index=MilvusIndexSpec.ivf(nlist=16)),
+        )
+    (record,) = caplog.records
+    assert "dim: 8 -> 4" in record.getMessage()
+    assert "'nlist': 16" in record.getMessage()
+
+
+class FakeEmbedding:
+    def embed_documents(self, texts):
+        return [[1.0, 0.0, 0.0, 0.0] for _ in texts]
+
+
+def test_ingest_requires_declared_metadata(uri):
+    spec = MilvusCollectionSpec(
+        dim=4, extra_fields=[FieldSchema("tenant", DataType.INT64)]
+    )
+    milvus = Milvus(uri, "docs", spec)
+    bm25 = BM25SparseEmbedding()
+    texts = [("one", {"tenant": 1}), ("two", {"tenant": 2})]
+    assert milvus.ingest(texts, FakeEmbedding(), bm25).inserted == 2
+    rows = milvus.collection.query("tenant >= 0", output_fields=["text", "tenant"])
+    assert sorted((row["text"], row["tenant"]) for row in rows) == [
+        ("one", 1),
+        ("two", 2),
+    ]
+
+    with pytest.raises(ValueError, match="1번째 텍스트.*tenant"):
+        milvus.ingest([("three", {"tenant": 3}), "four"], FakeEmbedding(), bm25)
@@ -0,0 +1,68 @@
+import numpy as np
+from scipy import sparse as sp
+
+from core.databases import NumpyIndex
+
+
+def _build(rng, size=20, dim=8):
+    index = NumpyIndex(dim=dim)
+    dense = rng.standard_normal((size, dim)).astype(np.float32)
+    sparse = [{i % 5: 1.0, 10 + i: 0.5} for i in range(size)]
+    index.insert([f"doc{i}" for i in range(size)], dense, sparse)
+    return index, dense
+
+
+def test_save_load_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    index, dense = _build(rng)
+    index.save(tmp_path)
+
+    loaded = NumpyIndex.load(tmp_path)
+    np.testing.assert_array_equal(loaded._dense[: len(loaded)], dense)
+    assert loaded.texts == index.texts
+    assert loaded.collection_name == index.collection_name
+    assert loaded.uri == tmp_path.resolve().as_uri()
+    query = rng.standard_normal((1, 8))
+    expected = [hit.text for hit in index.dense_search_batch(query, limit=5)[0]]
+    assert [
+        hit.text for hit in loaded.dense_search_batch(query, limit=5)[0]
+    ] == expected
+
+
+def test_save_over_mmap_loaded_directory(tmp_path):
+    rng = np.random.default_rng(1)
+    index, dense = _build(rng)
+    index.save(tmp_path)
+
+    loaded = NumpyIndex.load(tmp_path, mmap=True)
+    loaded.save(tmp_path)
+
+    np.testing.assert_array_equal(np.load(tmp_path / "dense.npy"), dense)
+    np.testing.assert_array_equal(loaded._dense[: len(loaded)], dense)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_insert_after_mmap_load(tmp_path):
+    rng = np.random.default_rng(2)
+    index, dense = _build(rng, size=4)
+    index.save(tmp_path)
+
+    loaded = NumpyIndex.load(tmp_path)
+    extra = rng.standard_normal((1, 8)).astype(np.float32)
+    loaded.insert(["new"], extra, [{1: 1.0}])
+    loaded.save(tmp_path)
+
+    reloaded = NumpyIndex.load(tmp_path, mmap=False)
+    np.testing.assert_array_equal(reloaded._dense, np.vstack([dense, extra]))
+    assert reloaded.texts[-1] == "new"
+
+
+def test_sparse_search_accepts_list_of_sparse_rows():
+    index = NumpyIndex(dim=2)
+    index.insert(["a", "b"], np.eye(2, dtype=np.float32), [{0: 1.0}, {5: 1.0}])
+    rows = [
+        sp.csr_matrix(([1.0], ([0], [5])), shape=(1, 8)),
+        {0: 2.0},
+    ]
+    hits = index.sparse_search_batch(rows, limit=1)
+    assert [[hit.text for hit in query] for query in hits] == [["b"], ["a"]]
@@ -0,0 +1,141 @@
+import asyncio
+import itertools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openai
+import pytest
+
+from core.utils import RateLimitConfig
+from models.chat_models import ChatOpenRouter
+
+_names = itertools.count()
+
+
+class FakeOpenRouter(BaseHTTPRequestHandler):
+    """앞의 throttle_count번은 429, 이후에는 정상 응답하는 OpenAI 호환 서버"""
+
+    protocol_version = "HTTP/1.1"
+    throttle_count = 0
+    requests = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["content-length"])))
+        cls = type(self)
+        cls.requests += 1
+        if cls.requests <= cls.throttle_count:
+            return self._send(429, {"error": {"message": "rate"}}, retry_after="0.05")
+        if body.get("stream"):
+            chunk = {
+                "id": "x",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "m",
+                "choices": [
+                    {"index": 0, "delta": {"content": "ok"}, "finish_reason": None}
+                ],
+            }
+            data = f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n".encode()
+            self.send_response(200)
+            self.send_header("content-type", "text/event-stream")
+            self.send_header("content-length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        message = {"role": "assistant", "content": "ok"}
+        self._send(
+            200,
+            {
+                "id": "x",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "m",
+                "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+            },
+        )
+
+    def _send(self, status: int, payload: dict, retry_after: str | None = None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        if retry_after:
+            self.send_header("retry-after", retry_after)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    handler = type("Handler", (FakeOpenRouter,), {})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        ChatOpenRouter, "BASE_URL", f"http://127.0.0.1:{httpd.server_port}/v1"
+    )
+    yield handler
+    httpd.shutdown()
+
+
+def _model(**kwargs) -> ChatOpenRouter:
+    return ChatOpenRouter(f"test-{next(_names)}", api_key="key", **kwargs)
+
+
+def test_every_throttled_attempt_goes_through_limiter(server):
+    server.throttle_count = 100
+    model = _model(max_retries=2)
+    with pytest.raises(openai.RateLimitError):
+        model.invoke("hi")
+    stats = model.limiter.stats
+    assert server.requests == 3
+    assert (stats.acquired, stats.throttled) == (3, 3)
+    assert stats.limit < RateLimitConfig().initial_concurrency
+
+
+def test_retry_succeeds_after_retry_after(server):
+    server.throttle_count = 1
+    model = _model()
+    assert model.invoke("hi").content == "ok"
+    assert server.requests == 2
+    assert model.limiter.stats.total_wait >= 0.04
+
+
+def test_stream_retries_before_first_chunk(server):
+    server.throttle_count = 1
+    model = _model()
+    assert "".join(chunk.content for chunk in model.stream("hi")) == "ok"
+    assert server.requests == 2
+
+
+def test_async_concurrency_is_capped(server):
+    model = _model(rate_limit=RateLimitConfig(initial_concurrency=2))
+
+    async def run():
+        return await asyncio.gather(*[model.ainvoke("hi") for _ in range(6)])
+
+    assert [message.content for message in asyncio.run(run())] == ["ok"] * 6
+    assert model.limiter.stats.max_queue_depth >= 4
+
+
+def test_instances_of_same_model_share_limiter():
+    first = ChatOpenRouter("shared-model", api_key="key")
+    second = ChatOpenRouter("shared-model", api_key="key")
+    assert first.limiter is second.limiter
+
+
+def test_streaming_generate_takes_single_slot(server):
+    server.throttle_count = 1
+    model = _model(
+        streaming=True,
+        rate_limit=RateLimitConfig(
+            initial_concurrency=1, max_concurrency=1, max_wait=2
+        ),
+    )
+    assert model.invoke("hi").content == "ok"
+    assert asyncio.run(model.ainvoke("hi")).content == "ok"
+    assert server.requests == 3
+    assert model.limiter.stats.acquired == 3
@@ -0,0 +1,33 @@
+import pytest
+
+from models.reranking_models.local import LocalReranking
+
+
+@pytest.fixture
+def reranker(monkeypatch):
+    """모델 로드 없이 점수만 돌려주는 LocalReranking"""
+    scores = {"a": 0.9, "b": 0.2, "c": 0.7, "d": 0.7}
+    instance = object.__new__(LocalReranking)
+
+    def iter_batch_scores(query, docs, batch_size=16, *args):
+        for start in range(0, len(docs), batch_size):
+            batch = list(range(start, min(start + batch_size, len(docs))))
+            yield batch, [scores[docs[i]] for i in batch]
+
+    monkeypatch.setattr(instance, "_iter_batch_scores", iter_batch_scores)
+    return instance
+
+
+def test_top_k_scores_orders_and_breaks_ties_by_input(reranker):
+    result = reranker.top_k_scores("q", ["a", "b", "c", "d"], top_k=3, batch_size=2)
+    assert result == [("a", 0.9), ("c", 0.7), ("d", 0.7)]
+
+
+def test_top_k_scores_applies_min_score(reranker):
+    result = reranker.top_k_scores("q", ["a", "b", "c"], top_k=5, min_score=0.5)
+    assert [doc for doc, _ in result] == ["a", "c"]
+
+
+@pytest.mark.parametrize("top_k", [0, -1])
+def test_top_k_scores_with_non_positive_top_k(reranker, top_k):
+    assert reranker.top_k_scores("q", ["a", "b"], top_k=top_k) == []
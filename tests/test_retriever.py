@@ -0,0 +1,64 @@
+import asyncio
+
+import numpy as np
+import pytest
+from scipy import sparse as sp
+
+from core.databases import MilvusRetriever, NumpyIndex
+from core.databases.retriever import rrf_fusion
+
+
+def _csr(index: int, value: float = 1.0, size: int = 16) -> sp.csr_matrix:
+    return sp.csr_matrix(([value], ([0], [index])), shape=(1, size))
+
+
+@pytest.fixture
+def retriever():
+    index = NumpyIndex(dim=4)
+    dense = np.eye(4, dtype=np.float32)
+    index.insert(["a", "b", "c", "d"], dense, [{0: 1.0}, {1: 1.0}, {2: 1.0}, {3: 1.0}])
+    return MilvusRetriever(index, dense_weight=0.0)
+
+
+def test_cache_key_distinguishes_csr_contents(retriever):
+    dense = [0.0] * 4
+    first = retriever._cache_key(dense, _csr(1), 5, None)
+    assert first != retriever._cache_key(dense, _csr(2), 5, None)
+    assert first != retriever._cache_key(dense, _csr(1, 0.5), 5, None)
+    assert first == retriever._cache_key(dense, _csr(1).tocoo(), 5, None)
+
+
+def test_cache_key_includes_dict_contents(retriever):
+    dense = [0.0] * 4
+    assert retriever._cache_key(dense, {1: 1.0}, 5, None) != retriever._cache_key(
+        dense, {2: 1.0}, 5, None
+    )
+
+
+def test_cached_results_follow_sparse_query(retriever):
+    dense = [0.0] * 4
+    first = retriever.search(dense, _csr(1), limit=1)
+    second = retriever.search(dense, _csr(2), limit=1)
+    assert [hit.text for hit in first] == ["b"]
+    assert [hit.text for hit in second] == ["c"]
+    assert retriever.stats.misses == 2
+
+    retriever.search(dense, _csr(1), limit=1)
+    assert retriever.stats.hits == 1
+
+
+def test_rrf_fusion_rewards_agreement():
+    index = NumpyIndex(dim=2)
+    index.insert(["x", "y"], np.eye(2, dtype=np.float32), [{0: 1.0}, {1: 1.0}])
+    hits_x = index.dense_search_batch([[1.0, 0.0]], limit=2)[0]
+    hits_y = index.dense_search_batch([[0.0, 1.0]], limit=2)[0]
+    fused = rrf_fusion([hits_x, hits_x, hits_y], k=60, limit=2)
+    assert [hit.text for hit in fused] == ["x", "y"]
+
+
+def test_async_search_uses_index_executor(retriever):
+    dense = [0.0] * 4
+    hits = asyncio.run(retriever.asearch(dense, _csr(3), limit=1))
+    assert [hit.text for hit in hits] == ["d"]
+    assert retriever.search(dense, _csr(3), limit=1) == hits
+    assert retriever.stats.hits == 1
@@ -8,21 +8,39 @@ from .file_system import (
     read_file,
     write_file,
 )
-from .http import HttpGetInput, http_get
+from .http import (
+    HttpGetInput,
+    HttpGetManyInput,
+    ahttp_get,
+    ahttp_get_many,
+    get_http_cache,
+    http_get,
+    http_get_many,
+    set_http_cache,
+)
+from .http_cache import HttpCache, HttpCacheStats
 from .python_repl import PythonREPLInput, python_repl
 
 
 __all__ = [
+    "HttpCache",
+    "HttpCacheStats",
     "HttpGetInput",
+    "HttpGetManyInput",
     "ListDirectoryInput",
     "PythonREPLInput",
     "ReadFileInput",
     "WriteFileInput",
+    "ahttp_get",
+    "ahttp_get_many",
     "calculator",
     "current_time",
+    "get_http_cache",
     "http_get",
+    "http_get_many",
     "list_directory",
     "python_repl",
     "read_file",
+    "set_http_cache",
     "write_file",
 ]
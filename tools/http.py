@@ -4,12 +4,61 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Union
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Dict, List, Optional, Union
 
 import httpx
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field, HttpUrl
 
+from core.utils import HttpClientConfig, get_http_client, get_loop_async_http_client
+
+from .http_cache import HttpCache, HttpCacheEntry
+
+# 응답 본문 최대 글자 수 (이만큼 읽으면 나머지는 받지 않고 연결을 끊음)
+MAX_BODY_CHARS = 1000
+# 응답 본문 최대 수신 바이트 (글자 수와 관계없이 이만큼 받으면 중단, UTF-8 최대 4바이트 기준)
+MAX_BODY_BYTES = MAX_BODY_CHARS * 4
+
+# 도구 호출 간 공유하는 클라이언트 설정 (요청별 timeout은 호출 시 따로 지정)
+HTTP_CONFIG = HttpClientConfig(read_timeout=60.0)
+# 공유 클라이언트 이름 (여러 호스트를 호출하므로 base_url 대신 사용, 비동기 클라이언트는 이벤트 루프별로 생성)
+CLIENT_KEY = "tools:http"
+
+# http_get_many 동기 경로에서 요청을 실행할 공유 실행기 크기
+MAX_FETCH_WORKERS = 32
+
+# 도구 응답 캐시 (set_http_cache로 교체/비활성화)
+_http_cache: HttpCache | None = HttpCache()
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def set_http_cache(cache: HttpCache | None) -> HttpCache | None:
+    """
+    http_get/ahttp_get 도구가 사용할 응답 캐시 교체
+
+    Args:
+        cache: 새 캐시 (None이면 캐시 사용 안 함, 예: HttpCache(disk=True))
+
+    Returns:
+        이전 캐시
+    """
+    global _http_cache
+    previous, _http_cache = _http_cache, cache
+    return previous
+
+
+def get_http_cache() -> HttpCache | None:
+    """현재 도구 응답 캐시 (통계는 get_http_cache().stats)"""
+    return _http_cache
+
 
 class HttpGetInput(BaseModel):
     """HTTP GET 도구 입력 스키마"""
@@ -31,6 +80,178 @@ class HttpGetInput(BaseModel):
     )
 
 
+class HttpGetManyInput(BaseModel):
+    """HTTP GET 일괄 조회 도구 입력 스키마"""
+
+    urls: List[HttpUrl] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="동시에 요청할 완전한 URL 목록",
+    )
+    headers: Optional[Dict[str, str]] = Field(
+        default=None,
+        description="선택 사항. 모든 요청에 붙일 추가 헤더",
+    )
+    timeout: float = Field(
+        10.0,
+        ge=1.0,
+        le=60.0,
+        description="요청별 타임아웃(초)",
+    )
+    deadline: float = Field(
+        30.0,
+        ge=1.0,
+        le=120.0,
+        description="전체 마감 시간(초). 넘으면 끝나지 않은 요청은 오류로 반환",
+    )
+    max_per_host: int = Field(
+        4,
+        ge=1,
+        le=16,
+        description="호스트별 최대 동시 요청 수",
+    )
+
+
+class _CachedRequest:
+    """캐시 조회 결과와 실제로 보낼 요청 정보"""
+
+    def __init__(self, url, params, headers, timeout: float):
+        self.cache = _http_cache
+        self.url = str(httpx.URL(str(url)).copy_merge_params(params or {}))
+        self.headers = httpx.Headers(headers or {})
+        self.timeout = timeout
+        self.entry: HttpCacheEntry | None = None
+        self.result: dict | None = None
+        if self.cache is not None:
+            self.entry = self.cache.lookup(self.url, self.headers)
+            if self.entry is not None and self.cache.is_fresh(self.entry, self.headers):
+                self.result = self.cache.hit(self.entry)
+        self.request_time = time.time()
+
+    def stream_kwargs(self) -> dict:
+        """client.stream 인자 (저장 항목이 있으면 조건부 요청 헤더 추가)"""
+        headers = self.headers.copy()
+        if self.entry is not None:
+            headers.update(self.entry.validators)
+        return {
+            "headers": headers,
+            "timeout": self.timeout,
+            "follow_redirects": True,
+        }
+
+    def not_modified(self, response: httpx.Response) -> dict | None:
+        """304 응답이면 저장된 본문으로 응답"""
+        if self.entry is None or response.status_code != 304:
+            return None
+        return self.cache.revalidated(self.entry, response, self.request_time)
+
+    def finish(self, response: httpx.Response, result: dict) -> dict:
+        if self.cache is not None:
+            self.cache.store(
+                self.url, self.headers, response, result, self.request_time
+            )
+        return result
+
+
+def _result(response: httpx.Response, body: str, truncated: bool) -> dict:
+    return {
+        "status_code": response.status_code,
+        "reason": response.reason_phrase,
+        "headers": dict(response.headers),
+        "body": body[:MAX_BODY_CHARS],
+        "truncated": truncated,
+    }
+
+
+def _append(parts: list[str], text: str, response: httpx.Response) -> bool:
+    """디코딩된 조각 추가 후 상한에 도달했는지 여부 반환"""
+    parts.append(text)
+    return (
+        sum(len(part) for part in parts) > MAX_BODY_CHARS
+        or response.num_bytes_downloaded >= MAX_BODY_BYTES
+    )
+
+
+def _read_limited(response: httpx.Response) -> dict:
+    """응답 본문을 상한까지만 스트리밍으로 읽기"""
+    response.raise_for_status()
+    parts: list[str] = []
+    truncated = False
+    for text in response.iter_text():
+        if _append(parts, text, response):
+            truncated = True
+            break
+    return _result(response, "".join(parts), truncated)
+
+
+async def _aread_limited(response: httpx.Response) -> dict:
+    """_read_limited의 비동기 버전"""
+    response.raise_for_status()
+    parts: list[str] = []
+    truncated = False
+    async for text in response.aiter_text():
+        if _append(parts, text, response):
+            truncated = True
+            break
+    return _result(response, "".join(parts), truncated)
+
+
+def _get(url, params, headers, timeout: float) -> dict:
+    """공유 클라이언트로 GET 요청 (캐시 조회/재검증/저장 포함)"""
+    request = _CachedRequest(url, params, headers, timeout)
+    if request.result is not None:
+        return request.result
+    client = get_http_client(CLIENT_KEY, HTTP_CONFIG)
+    with client.stream("GET", request.url, **request.stream_kwargs()) as response:
+        if (result := request.not_modified(response)) is not None:
+            return result
+        return request.finish(response, _read_limited(response))
+
+
+async def _aget(url, params, headers, timeout: float) -> dict:
+    """_get의 비동기 버전"""
+    request = _CachedRequest(url, params, headers, timeout)
+    if request.result is not None:
+        return request.result
+    client = get_loop_async_http_client(CLIENT_KEY, HTTP_CONFIG)
+    async with client.stream("GET", request.url, **request.stream_kwargs()) as response:
+        if (result := request.not_modified(response)) is not None:
+            return result
+        return request.finish(response, await _aread_limited(response))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """http_get_many 동기 경로용 공유 실행기 (최초 호출 시 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=MAX_FETCH_WORKERS, thread_name_prefix="http-get"
+                )
+    return _executor
+
+
+def _host(url) -> str:
+    parsed = httpx.URL(str(url))
+    return f"{parsed.host}:{parsed.port or parsed.scheme}"
+
+
+def _error(url, error: BaseException) -> dict:
+    if isinstance(error, httpx.HTTPStatusError):
+        return {
+            "url": str(url),
+            "status_code": error.response.status_code,
+            "error": str(error),
+        }
+    return {"url": str(url), "error": f"{type(error).__name__}: {error}"}
+
+
+def _deadline_error(url, deadline: float) -> dict:
+    return {"url": str(url), "error": f"전체 마감 시간({deadline}초) 안에 끝나지 않음"}
+
+
 @tool(
     "http_get",
     args_schema=HttpGetInput,
@@ -51,23 +272,138 @@ def http_get(
         timeout: 요청 타임아웃
 
     Returns:
-        호출 결과에 대한 상태 및 내용 반환
+        호출 결과에 대한 상태 및 내용 반환 (본문은 최대 1000자, 캐시가 신선하면 네트워크 요청 생략)
     """
-    client = httpx.Client(timeout=timeout, follow_redirects=True)
-    try:
-        response = client.get(str(url), params=params, headers=headers)
-    finally:
-        client.close()
-    response.raise_for_status()
-    return {
-        "status_code": response.status_code,
-        "reason": response.reason_phrase,
-        "headers": dict(response.headers),
-        "body": response.text[:1000],
-    }
+    return _get(url, params, headers, timeout)
+
+
+@tool(
+    "ahttp_get",
+    args_schema=HttpGetInput,
+)
+async def ahttp_get(
+    url: Union[str, HttpUrl],
+    params: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10.0,
+):
+    """
+    HTTP GET 요청에 대한 결과 조회 (비동기)
+
+    Args:
+        url: 호출할 URL 경로
+        params: 파라미터 정보
+        headers: 헤더 입력 정보
+        timeout: 요청 타임아웃
+
+    Returns:
+        호출 결과에 대한 상태 및 내용 반환 (본문은 최대 1000자, 캐시가 신선하면 네트워크 요청 생략)
+    """
+    return await _aget(url, params, headers, timeout)
+
+
+@tool(
+    "http_get_many",
+    args_schema=HttpGetManyInput,
+)
+def http_get_many(
+    urls: List[Union[str, HttpUrl]],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10.0,
+    deadline: float = 30.0,
+    max_per_host: int = 4,
+):
+    """
+    여러 URL을 동시에 GET 요청해 결과 조회
+
+    Args:
+        urls: 호출할 URL 목록
+        headers: 모든 요청에 붙일 헤더
+        timeout: 요청별 타임아웃
+        deadline: 전체 마감 시간 (넘으면 남은 요청은 오류로 반환, 실행 중인 요청은 요청별 타임아웃까지 백그라운드에서 끝남)
+        max_per_host: 호스트별 최대 동시 요청 수
+
+    Returns:
+        URL 순서대로 http_get 결과(+url) 또는 {"url", "error"} 리스트
+    """
+    semaphores = {host: threading.Semaphore(max_per_host) for host in map(_host, urls)}
+    cutoff = time.monotonic() + deadline
+
+    def fetch(url) -> dict:
+        semaphore = semaphores[_host(url)]
+        if not semaphore.acquire(timeout=max(0.0, cutoff - time.monotonic())):
+            return _deadline_error(url, deadline)
+        try:
+            return {"url": str(url), **_get(url, None, headers, timeout)}
+        except Exception as error:
+            return _error(url, error)
+        finally:
+            semaphore.release()
+
+    futures = [_get_executor().submit(fetch, url) for url in urls]
+    wait_futures(futures, timeout=deadline)
+    results = []
+    for url, future in zip(urls, futures):
+        if future.done():
+            results.append(future.result())
+        else:
+            future.cancel()
+            results.append(_deadline_error(url, deadline))
+    return results
+
+
+@tool(
+    "ahttp_get_many",
+    args_schema=HttpGetManyInput,
+)
+async def ahttp_get_many(
+    urls: List[Union[str, HttpUrl]],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10.0,
+    deadline: float = 30.0,
+    max_per_host: int = 4,
+):
+    """
+    여러 URL을 동시에 GET 요청해 결과 조회 (비동기, 마감 시간이 지나면 남은 요청은 취소)
+
+    Args:
+        urls: 호출할 URL 목록
+        headers: 모든 요청에 붙일 헤더
+        timeout: 요청별 타임아웃
+        deadline: 전체 마감 시간
+        max_per_host: 호스트별 최대 동시 요청 수
+
+    Returns:
+        URL 순서대로 ahttp_get 결과(+url) 또는 {"url", "error"} 리스트
+    """
+    semaphores = {host: asyncio.Semaphore(max_per_host) for host in map(_host, urls)}
+
+    async def fetch(url) -> dict:
+        async with semaphores[_host(url)]:
+            try:
+                return {"url": str(url), **await _aget(url, None, headers, timeout)}
+            except Exception as error:
+                return _error(url, error)
+
+    tasks = [asyncio.ensure_future(fetch(url)) for url in urls]
+    await asyncio.wait(tasks, timeout=deadline)
+    results = []
+    for url, task in zip(urls, tasks):
+        if task.done():
+            results.append(task.result())
+        else:
+            task.cancel()
+            results.append(_deadline_error(url, deadline))
+    return results
 
 
 __all__ = [
     "HttpGetInput",
+    "HttpGetManyInput",
+    "ahttp_get",
+    "ahttp_get_many",
+    "get_http_cache",
     "http_get",
+    "http_get_many",
+    "set_http_cache",
 ]
@@ -0,0 +1,391 @@
+"""
+http_get 도구용 HTTP 응답 캐시 (RFC 9111 개인 캐시 규칙)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import diskcache
+import httpx
+import xxhash
+from cachetools import LRUCache
+
+from models.backends import DEFAULT_CACHE_DIR
+
+# 저장할 수 있는 최종 응답 상태 코드 (오류 응답은 도구가 예외로 처리하므로 제외)
+CACHEABLE_STATUS_CODES = frozenset({200, 203, 204})
+# 304 응답으로 갱신하지 않는 헤더 (본문과 연결에 관한 헤더)
+NON_UPDATABLE_HEADERS = frozenset(
+    {"content-length", "content-encoding", "transfer-encoding", "connection"}
+)
+# Last-Modified 기반 추정 신선도의 상한(초)
+HEURISTIC_MAX_AGE = 24 * 3600
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """
+    Cache-Control 헤더 파싱
+
+    Args:
+        value: 헤더 값
+
+    Returns:
+        소문자 지시자 이름 -> 값 (값이 없는 지시자는 None)
+    """
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip().strip('"') if arg else None
+    return directives
+
+
+def _seconds(value: str | None) -> int | None:
+    try:
+        return max(0, int(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class HttpCacheEntry:
+    """
+    저장된 도구 응답
+
+    Args:
+        url: 요청 URL (쿼리 포함)
+        status_code: 응답 상태 코드
+        reason: 응답 사유 문구
+        headers: 응답 헤더 (소문자 키)
+        body: 도구가 반환한 본문 (상한까지 읽은 부분)
+        truncated: 본문이 잘렸는지 여부
+        vary: Vary 헤더에 지정된 요청 헤더 값
+        request_time: 요청을 보낸 시각 (time.time 기준)
+        response_time: 응답을 받은 시각 (time.time 기준)
+    """
+
+    url: str
+    status_code: int
+    reason: str
+    headers: dict[str, str]
+    body: str
+    truncated: bool
+    vary: dict[str, str | None] = field(default_factory=dict)
+    request_time: float = 0.0
+    response_time: float = 0.0
+
+    @property
+    def cache_control(self) -> dict[str, str | None]:
+        return parse_cache_control(self.headers.get("cache-control"))
+
+    def freshness_lifetime(self) -> float:
+        """신선도 유지 시간(초) (max-age > Expires > Last-Modified 추정 순)"""
+        max_age = _seconds(self.cache_control.get("max-age", None))
+        if max_age is not None:
+            return max_age
+        date = _http_date(self.headers.get("date")) or self.response_time
+        if "expires" in self.headers:
+            expires = _http_date(self.headers["expires"])
+            return max(0.0, expires - date) if expires is not None else 0.0
+        last_modified = _http_date(self.headers.get("last-modified"))
+        if last_modified is not None:
+            return min(HEURISTIC_MAX_AGE, max(0.0, (date - last_modified) * 0.1))
+        return 0.0
+
+    def age(self, now: float | None = None) -> float:
+        """현재 나이(초) (RFC 9111 4.2.3)"""
+        now = time.time() if now is None else now
+        date = _http_date(self.headers.get("date"))
+        apparent_age = max(0.0, self.response_time - date) if date else 0.0
+        response_delay = self.response_time - self.request_time
+        corrected_age = (_seconds(self.headers.get("age")) or 0) + response_delay
+        return max(apparent_age, corrected_age) + (now - self.response_time)
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """재검증 요청 헤더 (If-None-Match/If-Modified-Since)"""
+        headers = {}
+        if "etag" in self.headers:
+            headers["if-none-match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            headers["if-modified-since"] = self.headers["last-modified"]
+        return headers
+
+    def to_result(self) -> dict:
+        """도구 반환 형식"""
+        return {
+            "status_code": self.status_code,
+            "reason": self.reason,
+            "headers": dict(self.headers),
+            "body": self.body,
+            "truncated": self.truncated,
+        }
+
+
+@dataclass
+class HttpCacheStats:
+    """HTTP 캐시 통계"""
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stores: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """네트워크 본문 전송 없이 응답한 비율 (재검증 포함)"""
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+
+class HttpCache:
+    """
+    http_get 도구용 2단(메모리 LRU + 선택적 디스크) HTTP 캐시
+    Cache-Control(max-age/no-cache/no-store/must-revalidate)과 Expires로 신선도를 판단하고,
+    오래된 항목은 ETag/Last-Modified로 조건부 요청을 보내 304면 저장된 본문을 그대로 사용한다
+
+    Args:
+        max_entries: 메모리 캐시 최대 항목 수 (기본: 256)
+        disk: 디스크 캐시 사용 여부 (기본: False, 세션 간 재사용 시 True)
+        directory: 디스크 캐시 경로 (기본: ~/.cache/langgraph-blocks/http)
+        size_limit: 디스크 캐시 최대 용량(바이트) (기본: 256MiB)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        disk: bool = False,
+        directory: str | None = None,
+        size_limit: int = 2**28,
+    ):
+        self._memory = LRUCache(maxsize=max(max_entries, 1))
+        self._disk = None
+        if disk:
+            self._disk = diskcache.Cache(
+                str(Path(directory or DEFAULT_CACHE_DIR / "http")),
+                size_limit=size_limit,
+                eviction_policy="least-recently-used",
+            )
+        self._lock = threading.Lock()
+        self._stats = HttpCacheStats()
+
+    @property
+    def stats(self) -> HttpCacheStats:
+        return self._stats
+
+    @staticmethod
+    def key(url: str) -> str:
+        return f"http:{xxhash.xxh3_128_hexdigest(url.encode('utf-8'))}"
+
+    @staticmethod
+    def _vary(response_headers, request_headers: httpx.Headers) -> dict | None:
+        """Vary에 지정된 요청 헤더 값 (Vary: *이면 None, 저장 불가)"""
+        names = [
+            name.strip().lower()
+            for name in response_headers.get("vary", "").split(",")
+            if name.strip()
+        ]
+        if "*" in names:
+            return None
+        return {name: request_headers.get(name) for name in names}
+
+    def lookup(self, url: str, request_headers: httpx.Headers) -> HttpCacheEntry | None:
+        """
+        URL과 요청 헤더(Vary)가 맞는 저장 항목 조회 (신선도와 무관)
+
+        Args:
+            url: 요청 URL (쿼리 포함)
+            request_headers: 요청 헤더
+
+        Returns:
+            저장 항목 (없으면 None)
+        """
+        key = self.key(url)
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None and self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                entry = HttpCacheEntry(**json.loads(value))
+                with self._lock:
+                    self._memory[key] = entry
+        if entry is None or entry.url != url:
+            return None
+        for name, value in entry.vary.items():
+            if request_headers.get(name) != value:
+                return None
+        return entry
+
+    @staticmethod
+    def is_fresh(entry: HttpCacheEntry, request_headers: httpx.Headers) -> bool:
+        """
+        재검증 없이 바로 쓸 수 있는지 여부
+
+        Args:
+            entry: 저장 항목
+            request_headers: 요청 헤더 (Cache-Control: no-cache/max-age 반영)
+
+        Returns:
+            신선 여부
+        """
+        request_cc = parse_cache_control(request_headers.get("cache-control"))
+        if "no-cache" in request_cc or "no-cache" in entry.cache_control:
+            return False
+        age = entry.age()
+        max_age = _seconds(request_cc.get("max-age", None))
+        if max_age is not None and age > max_age:
+            return False
+        return age < entry.freshness_lifetime()
+
+    @staticmethod
+    def storable(request_headers: httpx.Headers, response: httpx.Response) -> bool:
+        """응답 저장 가능 여부 (no-store, Vary: *, 신선도/검증자 없음 제외)"""
+        if response.status_code not in CACHEABLE_STATUS_CODES:
+            return False
+        request_cc = parse_cache_control(request_headers.get("cache-control"))
+        response_cc = parse_cache_control(response.headers.get("cache-control"))
+        if "no-store" in request_cc or "no-store" in response_cc:
+            return False
+        if HttpCache._vary(response.headers, request_headers) is None:
+            return False
+        return any(
+            name in response.headers
+            for name in ("etag", "last-modified", "expires", "cache-control")
+        )
+
+    def _save(self, entry: HttpCacheEntry) -> None:
+        key = self.key(entry.url)
+        with self._lock:
+            self._memory[key] = entry
+        if self._disk is not None:
+            self._disk.set(key, json.dumps(asdict(entry), ensure_ascii=False))
+
+    def store(
+        self,
+        url: str,
+        request_headers: httpx.Headers,
+        response: httpx.Response,
+        result: dict,
+        request_time: float,
+    ) -> None:
+        """
+        전체 응답 결과 저장 (저장할 수 없는 응답이면 미스로만 기록)
+
+        Args:
+            url: 요청 URL (쿼리 포함)
+            request_headers: 요청 헤더
+            response: 응답
+            result: 도구 반환 결과 (body/truncated 사용)
+            request_time: 요청을 보낸 시각 (time.time 기준)
+        """
+        with self._lock:
+            self._stats.misses += 1
+        if not self.storable(request_headers, response):
+            return
+        entry = HttpCacheEntry(
+            url=url,
+            status_code=response.status_code,
+            reason=response.reason_phrase,
+            headers=dict(response.headers),
+            body=result["body"],
+            truncated=result["truncated"],
+            vary=self._vary(response.headers, request_headers),
+            request_time=request_time,
+            response_time=time.time(),
+        )
+        if entry.freshness_lifetime() <= 0 and not entry.validators:
+            return
+        self._save(entry)
+        with self._lock:
+            self._stats.stores += 1
+
+    def hit(self, entry: HttpCacheEntry) -> dict:
+        """
+        신선한 저장 항목으로 응답
+
+        Args:
+            entry: 저장 항목
+
+        Returns:
+            도구 반환 결과
+        """
+        with self._lock:
+            self._stats.hits += 1
+            self._stats.bytes_saved += len(entry.body.encode("utf-8"))
+        return entry.to_result()
+
+    def revalidated(
+        self, entry: HttpCacheEntry, response: httpx.Response, request_time: float
+    ) -> dict:
+        """
+        304 응답의 헤더로 저장 항목을 갱신하고 저장된 본문으로 응답
+
+        Args:
+            entry: 저장 항목
+            response: 304 응답
+            request_time: 조건부 요청을 보낸 시각 (time.time 기준)
+
+        Returns:
+            도구 반환 결과
+        """
+        headers = dict(entry.headers)
+        headers.update(
+            (name, value)
+            for name, value in response.headers.items()
+            if name not in NON_UPDATABLE_HEADERS
+        )
+        entry = HttpCacheEntry(
+            **{
+                **asdict(entry),
+                "headers": headers,
+                "request_time": request_time,
+                "response_time": time.time(),
+            }
+        )
+        if "no-store" in entry.cache_control:
+            with self._lock:
+                self._memory.pop(self.key(entry.url), None)
+            if self._disk is not None:
+                self._disk.delete(self.key(entry.url))
+        else:
+            self._save(entry)
+        with self._lock:
+            self._stats.revalidated += 1
+            self._stats.bytes_saved += len(entry.body.encode("utf-8"))
+        return entry.to_result()
+
+    def clear(self) -> None:
+        """메모리/디스크 캐시 비우기"""
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def close(self) -> None:
+        """디스크 캐시 파일 핸들 정리"""
+        if self._disk is not None:
+            self._disk.close()
+
+
+__all__ = [
+    "HttpCache",
+    "HttpCacheEntry",
+    "HttpCacheStats",
+    "parse_cache_control",
+]